@@ -179,7 +179,8 @@ interface DataNodeViewerProps extends CoreProps {
     showData?: boolean;
     chartConfigs?: string;
     scenarios?: Scenarios;
-    history?: Array<[string, string, string]>;
+    // timestamp, job or editor id, comment, rank of the edit
+    history?: Array<[string, string, string, number]>;
     data?: DatanodeData;
     tabularData?: TableValueType;
     tabularColumns?: string;
@@ -234,6 +235,15 @@ enum TabValues {
     History,
 }
 
+// Number of edits added to the history when more are requested
+const historyPageSize = 50;
+
+const getHistoryContext = (updateDnVars: string, dnId: string, count = 0) => {
+    const idVar = getUpdateVar(updateDnVars, "history_id");
+    const countVar = getUpdateVar(updateDnVars, "history_count");
+    return idVar ? { [idVar]: dnId, ...(countVar ? { [countVar]: count } : {}) } : undefined;
+};
+
 const DataNodeViewer = (props: DataNodeViewerProps) => {
     const {
         id = "",
@@ -299,14 +309,13 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
                 if (newValue == TabValues.History) {
                     setHistoryRequested((req) => {
                         if (!req) {
-                            const idVar = getUpdateVar(updateDnVars, "history_id");
                             dispatch(
                                 createRequestUpdateAction(
                                     id,
                                     module,
                                     getUpdateVarNames(updateVars, "history"),
                                     true,
-                                    idVar ? { [idVar]: dnId } : undefined
+                                    getHistoryContext(updateDnVars, dnId)
                                 )
                             );
                         }
@@ -406,11 +415,10 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
             editLock.current = dn[DataNodeFullProps.editInProgress];
             setHistoryRequested((req) => {
                 if (req && showHistory && !isNewDn && tabValue == TabValues.History) {
-                    const idVar = getUpdateVar(updateDnVars, "history_id");
                     const vars = getUpdateVarNames(updateVars, "history");
                     Promise.resolve().then(() =>
                         dispatch(
-                            createRequestUpdateAction(id, module, vars, true, idVar ? { [idVar]: newDnId } : undefined)
+                            createRequestUpdateAction(id, module, vars, true, getHistoryContext(updateDnVars, newDnId))
                         )
                     );
                     return true;
@@ -485,6 +493,20 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
     const [dataRequested, setDataRequested] = useState(false);
     const [propertiesRequested, setPropertiesRequested] = useState(false);
 
+    const showMoreHistory = useCallback(
+        () =>
+            dispatch(
+                createRequestUpdateAction(
+                    id,
+                    module,
+                    getUpdateVarNames(updateVars, "history"),
+                    true,
+                    getHistoryContext(updateDnVars, dnId, (props.history || []).length + historyPageSize)
+                )
+            ),
+        [props.history, dnId, id, dispatch, module, updateVars, updateDnVars]
+    );
+
     // userExpanded
     const [userExpanded, setUserExpanded] = useState(valid && expanded);
     const onExpand = useCallback(
@@ -978,7 +1000,7 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
                                             ) : null}
                                             <Grid container>
                                                 <Grid size={0.4} sx={editSx}>
-                                                    <Box>{(props.history || []).length - idx}</Box>
+                                                    <Box>{edit[3] ?? (props.history || []).length - idx}</Box>
                                                 </Grid>
                                                 <Grid size={0.1}></Grid>
                                                 <Grid container size={11.5}>
@@ -999,6 +1021,11 @@ const DataNodeViewer = (props: DataNodeViewerProps) => {
                                             </Grid>
                                         </Fragment>
                                     ))}
+                                    {props.history.length && props.history[props.history.length - 1][3] > 1 ? (
+                                        <Grid size={12}>
+                                            <Button onClick={showMoreHistory}>Show more</Button>
+                                        </Grid>
+                                    ) : null}
                                 </Grid>
                             ) : (
                                 "History will come here"
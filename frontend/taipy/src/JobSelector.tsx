@@ -43,6 +43,7 @@ import TableBody from "@mui/material/TableBody";
 import TableCell from "@mui/material/TableCell";
 import TableContainer from "@mui/material/TableContainer";
 import TableHead from "@mui/material/TableHead";
+import TablePagination from "@mui/material/TablePagination";
 import TableRow from "@mui/material/TableRow";
 import TextField from "@mui/material/TextField";
 import Toolbar from "@mui/material/Toolbar";
@@ -101,6 +102,8 @@ interface JobSelectorProps extends CoreProps {
     updateJbVars?: string;
     details?: JobDetail;
     onDetails?: string | boolean;
+    pageSize?: number;
+    jobsCount?: number;
 }
 
 // job id, job name, empty list, entity id, entity name, submit id, creation date, status, not deletable, not readable, not editable
@@ -495,11 +498,13 @@ const JobSelector = (props: JobSelectorProps) => {
         propagate = true,
         updateJbVars = "",
         coreChanged,
+        pageSize = 0,
     } = props;
     const [checked, setChecked] = useState<string[]>([]);
     const [selected, setSelected] = useState<string[]>([]);
     const [jobRows, setJobRows] = useState<Jobs>([]);
     const [filters, setFilters] = useState<FilterData[]>();
+    const [page, setPage] = useState(0);
     const [anchorEl, setAnchorEl] = useState<HTMLButtonElement | null>(null);
     const [showDetails, setShowDetails] = useState(false);
     const detailId = useRef<string>();
@@ -734,9 +739,49 @@ const JobSelector = (props: JobSelectorProps) => {
         }
     }, [props.details]);
 
+    // Jobs are paged, filtered and sorted by the server when the page size is set
+    const paged = pageSize > 0;
+    const firstPageRequest = useRef(true);
+
+    const handleApplyFilter = useCallback((filters: FilterData[]) => {
+        setFilters(filters);
+        setPage(0);
+    }, []);
+
+    const handlePageChange = useCallback((event: unknown, newPage: number) => setPage(newPage), []);
+
+    useEffect(() => {
+        if (!paged) {
+            return;
+        }
+        if (firstPageRequest.current) {
+            // the first page is requested on first render
+            firstPageRequest.current = false;
+            return;
+        }
+        const pageVar = getUpdateVar(updateJbVars, "page_id");
+        pageVar &&
+            dispatch(
+                createRequestUpdateAction(id, module, getUpdateVarNames(props.updateVars, "jobs", "jobsCount"), true, {
+                    [pageVar]: {
+                        start: page * pageSize,
+                        count: pageSize,
+                        filters: (filters || [])
+                            .filter((filter) => filter.data && filter.operator)
+                            .map((filter) => ({
+                                col: JobProps[filter.data],
+                                operator: filter.operator,
+                                value: filter.value,
+                            })),
+                    },
+                })
+            );
+    }, [paged, page, pageSize, filters, updateJbVars, props.updateVars, module, dispatch, id]);
+
     useEffect(() => {
         let filteredJobRows = [...(props.jobs || [])];
-        filteredJobRows.length &&
+        !paged &&
+            filteredJobRows.length &&
             filters &&
             filters
                 .filter((filter) => filter.data && filter.operator)
@@ -763,7 +808,7 @@ const JobSelector = (props: JobSelectorProps) => {
         setJobRows(filteredJobRows);
         const jobIds = filteredJobRows.map((j) => j[JobProps.id]);
         setChecked((ids) => ids.filter((id) => jobIds.includes(id)));
-    }, [filters, props.jobs]);
+    }, [paged, filters, props.jobs]);
 
     useEffect(() => {
         if (props.value) {
@@ -780,8 +825,8 @@ const JobSelector = (props: JobSelectorProps) => {
 
     useEffect(() => {
         if (coreChanged?.jobs) {
-            const updateVar = getUpdateVar(props.updateVars, "jobs");
-            updateVar && dispatch(createRequestUpdateAction(id, module, [updateVar], true));
+            const updateVars = getUpdateVarNames(props.updateVars, "jobs", "jobsCount");
+            updateVars.length && dispatch(createRequestUpdateAction(id, module, updateVars, true));
         }
     }, [coreChanged, props.updateVars, module, dispatch, id]);
 
@@ -859,7 +904,7 @@ const JobSelector = (props: JobSelectorProps) => {
                         open={!!anchorEl}
                         anchorEl={anchorEl}
                         handleFilterClose={handleFilterClose}
-                        handleApplyFilter={setFilters}
+                        handleApplyFilter={handleApplyFilter}
                         columns={jobSelectorColumns}
                     />
                 </Toolbar>
@@ -895,6 +940,16 @@ const JobSelector = (props: JobSelectorProps) => {
                         </TableBody>
                     </Table>
                 </TableContainer>
+                {paged ? (
+                    <TablePagination
+                        component="div"
+                        count={props.jobsCount || 0}
+                        page={page}
+                        rowsPerPage={pageSize}
+                        rowsPerPageOptions={[]}
+                        onPageChange={handlePageChange}
+                    />
+                ) : null}
             </Paper>
             {props.children}
         </Box>
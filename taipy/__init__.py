@@ -9,29 +9,140 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import typing as t
+from importlib import import_module
 from importlib.util import find_spec
 
-if find_spec("taipy"):
-    if find_spec("taipy.common") and find_spec("taipy.common.config"):
-        from taipy.common.config._init import *
+# The API exposed by the taipy package is imported when it is first used (PEP 562) so that the processes that
+# only need a part of Taipy (a CLI command, a standalone job worker...) don't load all the packages.
+# key = attribute name, value = module where it is defined
+_LAZY_ATTRIBUTES: t.Dict[str, str] = {
+    "Config": "taipy.common.config._init",
+    "Gui": "taipy.gui._init",
+    "Rest": "taipy.rest._init",
+    "run": "taipy._run",
+    "Core": "taipy.core._init",
+    "Cycle": "taipy.core._init",
+    "CycleId": "taipy.core._init",
+    "DataNode": "taipy.core._init",
+    "DataNodeId": "taipy.core._init",
+    "Frequency": "taipy.core._init",
+    "Job": "taipy.core._init",
+    "JobId": "taipy.core._init",
+    "Orchestrator": "taipy.core._init",
+    "Scenario": "taipy.core._init",
+    "ScenarioId": "taipy.core._init",
+    "Scope": "taipy.core._init",
+    "Sequence": "taipy.core._init",
+    "SequenceId": "taipy.core._init",
+    "Status": "taipy.core._init",
+    "Submission": "taipy.core._init",
+    "SubmissionId": "taipy.core._init",
+    "SubmissionStatus": "taipy.core._init",
+    "Submittable": "taipy.core._init",
+    "Task": "taipy.core._init",
+    "TaskId": "taipy.core._init",
+    "can_create": "taipy.core._init",
+    "cancel_job": "taipy.core._init",
+    "clean_all_entities": "taipy.core._init",
+    "compare_scenarios": "taipy.core._init",
+    "create_global_data_node": "taipy.core._init",
+    "create_scenario": "taipy.core._init",
+    "delete": "taipy.core._init",
+    "delete_job": "taipy.core._init",
+    "delete_jobs": "taipy.core._init",
+    "exists": "taipy.core._init",
+    "get": "taipy.core._init",
+    "get_cycles": "taipy.core._init",
+    "get_cycles_scenarios": "taipy.core._init",
+    "get_data_nodes": "taipy.core._init",
+    "get_entities_by_config_id": "taipy.core._init",
+    "get_jobs": "taipy.core._init",
+    "get_latest_job": "taipy.core._init",
+    "get_latest_submission": "taipy.core._init",
+    "get_parents": "taipy.core._init",
+    "get_primary": "taipy.core._init",
+    "get_primary_scenarios": "taipy.core._init",
+    "get_scenarios": "taipy.core._init",
+    "get_sequences": "taipy.core._init",
+    "get_submissions": "taipy.core._init",
+    "get_tasks": "taipy.core._init",
+    "is_deletable": "taipy.core._init",
+    "is_editable": "taipy.core._init",
+    "is_promotable": "taipy.core._init",
+    "is_readable": "taipy.core._init",
+    "is_submittable": "taipy.core._init",
+    "set": "taipy.core._init",
+    "set_primary": "taipy.core._init",
+    "submit": "taipy.core._init",
+    "subscribe_scenario": "taipy.core._init",
+    "subscribe_sequence": "taipy.core._init",
+    "tag": "taipy.core._init",
+    "unsubscribe_scenario": "taipy.core._init",
+    "unsubscribe_sequence": "taipy.core._init",
+    "untag": "taipy.core._init",
+}
+# key = module, value = modules that extend it and must be imported with it
+_COMPANION_MODULES: t.Dict[str, t.Tuple[str, ...]] = {
+    # Configuration sections
+    "taipy.common.config._init": ("taipy.core.config", "taipy.rest.config", "taipy.gui"),
+}
+# Subpackages that are available as attributes of the taipy package, as they were when they were imported eagerly
+_SUBPACKAGES: t.Tuple[str, ...] = ("common", "core", "gui", "gui_core", "rest", "enterprise", "designer")
 
-    if find_spec("taipy.gui"):
-        from taipy.gui._init import *
 
-    if find_spec("taipy.core"):
-        from taipy.core._init import *
+def _is_available(module_name: str) -> bool:
+    try:
+        return find_spec(module_name) is not None
+    except ModuleNotFoundError:
+        return False
 
-    if find_spec("taipy.rest"):
-        from taipy.rest._init import *
 
-    if find_spec("taipy.gui_core"):
-        from taipy.gui_core._init import *
+def _available_attributes() -> t.List[str]:
+    # Only the subpackages are looked up: finding a module inside a subpackage would import the subpackage
+    return [name for name, module in _LAZY_ATTRIBUTES.items() if _is_available(".".join(module.split(".")[:2]))]
 
-    if find_spec("taipy.enterprise"):
-        from taipy.enterprise._init import *
 
-    if find_spec("taipy.designer"):
-        from taipy.designer._init import *
+def __getattr__(name: str) -> t.Any:
+    if name in _SUBPACKAGES and _is_available(f"{__name__}.{name}"):
+        return import_module(f"{__name__}.{name}")
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None or not _is_available(module_name):
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    module = import_module(module_name)
+    for companion in _COMPANION_MODULES.get(module_name, ()):
+        if _is_available(companion):
+            import_module(companion)
+    value = getattr(module, "_run" if name == "run" else name)
+    globals()[name] = value
+    return value
 
-    if find_spec("taipy._run"):
-        from taipy._run import _run as run
+
+def __dir__() -> t.List[str]:
+    # The builtin set may be shadowed by taipy.set once it is resolved
+    return sorted(
+        {
+            *globals(),
+            *(name for name in _SUBPACKAGES if _is_available(f"{__name__}.{name}")),
+            *_available_attributes(),
+        }
+    )
+
+
+# The names exported by 'from taipy import *' are resolved by __getattr__
+__all__ = _available_attributes()
+
+
+# The configuration sections of the core package are registered before the configuration is used or loaded.
+# The other packages register their own sections when they are imported.
+if _is_available("taipy.core"):
+    import_module("taipy.core.config")
+
+for _extension in ("taipy.enterprise._init", "taipy.designer._init"):
+    if _is_available(_extension):
+        _extension_module = import_module(_extension)
+        _extension_names = getattr(
+            _extension_module, "__all__", [name for name in vars(_extension_module) if not name.startswith("_")]
+        )
+        globals().update({name: getattr(_extension_module, name) for name in _extension_names})
+        __all__ += _extension_names
@@ -13,8 +13,6 @@ import json
 from copy import copy
 from typing import Optional, Set, Union
 
-from deepdiff import DeepDiff
-
 from ...logger._taipy_logger import _TaipyLogger
 from .._config import _Config
 from .._serializer._json_serializer import _JsonSerializer
@@ -94,6 +92,9 @@ class _ConfigComparator:
         json_config_1 = json.loads(_JsonSerializer._serialize(config_1))
         json_config_2 = json.loads(_JsonSerializer._serialize(config_2))
 
+        # deepdiff imports pandas: only load it when configurations are compared
+        from deepdiff import DeepDiff
+
         config_deepdiff = DeepDiff(json_config_1, json_config_2, ignore_order=True)
 
         comparator_result = _ComparatorResult(copy(self._unconflicted_sections))
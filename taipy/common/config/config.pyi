@@ -993,6 +993,7 @@ class Config:
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        max_data_node_edits: Optional[int] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -1021,6 +1022,9 @@ class Config:
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
+            max_data_node_edits (Optional[int]): Maximum number of edits kept in each data node. The oldest
+                edits are moved to an append-only log. The default value is None, meaning that all the edits
+                are kept in the data node.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
@@ -35,5 +35,4 @@ class _Entity:
             self._properties.data.update(self._properties._pending_changes)
         _Reloader()._get_manager(self._MANAGER_NAME)._set(self)
 
-        for event in self._in_context_attributes_changed_collector:
-            Notifier.publish(event)
+        Notifier._publish_batch(self._in_context_attributes_changed_collector)
@@ -0,0 +1,61 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+
+class _EntityCache:
+    """Entities read by the managers while a scope is open.
+
+    Within a scope, an entity is loaded from its repository once: the later reads, including the reloads
+    made when the properties of the entity are accessed, return the same object. Saving or deleting an
+    entity removes it from the cache so that the next read loads it again.<br/>
+    The scope is bound to the current context (thread or task). Nothing is cached outside of a scope.
+    """
+
+    __entities: ContextVar[Optional[Dict[str, Any]]] = ContextVar("taipy_entity_cache", default=None)
+
+    def __enter__(self):
+        self._open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self._close()
+
+    @classmethod
+    def _open(cls) -> None:
+        cls.__entities.set({})
+
+    @classmethod
+    def _close(cls) -> None:
+        cls.__entities.set(None)
+
+    @classmethod
+    def _get(cls, entity_id: str) -> Optional[Any]:
+        if (entities := cls.__entities.get()) is None:
+            return None
+        return entities.get(entity_id)
+
+    @classmethod
+    def _put(cls, entity_id: str, entity: Any) -> None:
+        if (entities := cls.__entities.get()) is not None:
+            entities[entity_id] = entity
+
+    @classmethod
+    def _discard(cls, entity_id: Optional[str] = None) -> None:
+        """Remove an entity from the cache, or all the entities if *entity_id* is None."""
+        if (entities := cls.__entities.get()) is None:
+            return
+        if entity_id is None:
+            entities.clear()
+        else:
+            entities.pop(entity_id, None)
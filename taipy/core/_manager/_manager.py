@@ -9,7 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Dict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
@@ -18,6 +18,7 @@ from .._repository._abstract_repository import _AbstractRepository
 from ..exceptions.exceptions import ModelNotFound
 from ..notification import Event, EventOperation, Notifier
 from ..reason import EntityDoesNotExist, ReasonCollection
+from ._entity_cache import _EntityCache
 
 EntityType = TypeVar("EntityType")
 
@@ -33,6 +34,7 @@ class _Manager(Generic[EntityType]):
         Deletes all entities.
         """
         cls._repository._delete_all()
+        _EntityCache._discard()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -48,16 +50,17 @@ class _Manager(Generic[EntityType]):
         Deletes entities by a list of ids.
         """
         cls._repository._delete_many(ids)
+        _EntityCache._discard()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
-            for entity_id in ids:
-                Notifier.publish(
-                    Event(
-                        cls._EVENT_ENTITY_TYPE,  # type: ignore
-                        EventOperation.DELETION,
-                        entity_id=entity_id,
-                        metadata={"delete_all": True},
-                    )
+            Notifier._publish_batch(
+                Event(
+                    cls._EVENT_ENTITY_TYPE,  # type: ignore
+                    EventOperation.DELETION,
+                    entity_id=entity_id,
+                    metadata={"delete_all": True},
                 )
+                for entity_id in ids
+            )
 
     @classmethod
     def _delete_by_version(cls, version_number: str):
@@ -65,6 +68,7 @@ class _Manager(Generic[EntityType]):
         Deletes entities by version number.
         """
         cls._repository._delete_by(attribute="version", value=version_number)
+        _EntityCache._discard()
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -80,6 +84,7 @@ class _Manager(Generic[EntityType]):
         Deletes an entity by id.
         """
         cls._repository._delete(id)
+        _EntityCache._discard(id)
         if hasattr(cls, "_EVENT_ENTITY_TYPE"):
             Notifier.publish(
                 Event(
@@ -95,6 +100,7 @@ class _Manager(Generic[EntityType]):
         Save or update an entity.
         """
         cls._repository._save(entity)
+        _EntityCache._discard(entity.id)  # type: ignore[attr-defined]
 
     @classmethod
     def _get_all(cls, version_number: Optional[str] = "all") -> List[EntityType]:
@@ -113,17 +119,30 @@ class _Manager(Generic[EntityType]):
             filters = []
         return cls._repository._load_all(filters)
 
+    @classmethod
+    def _get_page(
+        cls, offset: int = 0, limit: Optional[int] = None, filters: Optional[List[Dict]] = None
+    ) -> Tuple[List[EntityType], int]:
+        """
+        Returns a page of the entities based on a criteria, sorted by id, and the number of matching entities.
+        """
+        return cls._repository._load_page(filters or [], offset, limit)
+
     @classmethod
     def _get(cls, entity: Union[str, EntityType], default=None) -> EntityType:
         """
         Returns an entity by id or reference.
         """
         entity_id = entity if isinstance(entity, str) else entity.id  # type: ignore
+        if (cached_entity := _EntityCache._get(entity_id)) is not None:
+            return cached_entity
         try:
-            return cls._repository._load(entity_id)
+            loaded_entity = cls._repository._load(entity_id)
         except ModelNotFound:
             cls._logger.error(f"{cls._ENTITY_NAME} not found: {entity_id}")
             return default
+        _EntityCache._put(entity_id, loaded_entity)
+        return loaded_entity
 
     @classmethod
     def _exists(cls, entity_id: str) -> ReasonCollection:
@@ -133,7 +152,7 @@ class _Manager(Generic[EntityType]):
         """
         reason_collector = ReasonCollection()
 
-        if not cls._repository._exists(entity_id):
+        if _EntityCache._get(entity_id) is None and not cls._repository._exists(entity_id):
             reason_collector._add_reason(entity_id, EntityDoesNotExist(entity_id))
 
         return reason_collector
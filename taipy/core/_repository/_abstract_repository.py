@@ -12,7 +12,7 @@
 import json
 import pathlib
 from abc import abstractmethod
-from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar, Union
+from typing import Any, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
 
 from ..exceptions import FileCannotBeRead
 from ._decoder import _Decoder
@@ -66,6 +66,26 @@ class _AbstractRepository(Generic[ModelType, Entity]):
         """
         raise NotImplementedError
 
+    def _load_page(
+        self, filters: Optional[List[Dict]] = None, offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[Entity], int]:
+        """
+        Retrieve a page of the entities' data from the repository taking any passed filter into account.
+
+        The entities are sorted by id.
+
+        Arguments:
+            filters: The filters the entities must match.
+            offset: The number of matching entities to skip.
+            limit: The maximum number of entities to return. All the remaining entities are returned if None.
+
+        Returns:
+            A tuple holding the list of entities of the page and the number of matching entities.
+        """
+        entities = sorted(self._load_all(filters), key=lambda e: e.id)  # type: ignore[attr-defined]
+        end = None if limit is None else offset + limit
+        return entities[offset:end], len(entities)
+
     @abstractmethod
     def _delete(self, entity_id: str):
         """
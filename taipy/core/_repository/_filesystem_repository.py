@@ -13,7 +13,7 @@ import copy
 import json
 import pathlib
 import shutil
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type, Union
 
 from taipy.common.config import Config
 
@@ -89,6 +89,26 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
             pass
         return entities
 
+    def _load_page(
+        self, filters: Optional[List[Dict]] = None, offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[List[Entity], int]:
+        # Files are matched on their content: only the entities of the page are decoded
+        entities = []
+        total = 0
+        end = None if limit is None else offset + limit
+        try:
+            paths = sorted(self.dir_path.iterdir(), key=lambda path: path.stem)
+        except FileNotFoundError:
+            return entities, total
+        for f in paths:
+            if offset <= total and (end is None or total < end):
+                if data := self.__filter_by(f, filters):
+                    entities.append(self.__file_content_to_entity(data))
+                    total += 1
+            elif self.__read_matching_file(f, filters) is not None:
+                total += 1
+        return entities, total
+
     def _delete(self, entity_id: str):
         try:
             self.__get_path(entity_id).unlink()
@@ -219,6 +239,11 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
         return self.converter._model_to_entity(model)
 
     def __filter_by(self, filepath: pathlib.Path, filters: Optional[List[Dict]]) -> Optional[Json]:
+        if (file_content := self.__read_matching_file(filepath, filters)) is not None:
+            return json.loads(file_content, cls=_Decoder)
+        return None
+
+    def __read_matching_file(self, filepath: pathlib.Path, filters: Optional[List[Dict]]) -> Optional[str]:
         if not filters:
             filters = [{}]
 
@@ -232,7 +257,7 @@ class _FileSystemRepository(_AbstractRepository[ModelType, Entity]):
                 f'"{key}": "{value}"' if value is not None else f'"{key}": null' for key, value in _filter.items()
             ]
             if all(condition in file_content for condition in conditions):
-                return json.loads(file_content, cls=_Decoder)
+                return file_content
         return None
 
     @_retry_repository_operation(__EXCEPTIONS_TO_RETRY)
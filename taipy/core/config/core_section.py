@@ -61,6 +61,9 @@ class CoreSection(UniqueSection):
     _FORCE_KEY = "force"
     _DEFAULT_FORCE = False
 
+    _MAX_DATA_NODE_EDITS_KEY = "max_data_node_edits"
+    _DEFAULT_MAX_DATA_NODE_EDITS = None
+
     _CORE_VERSION_KEY = "core_version"
     _CURRENT_CORE_VERSION = _read_version()
 
@@ -76,6 +79,7 @@ class CoreSection(UniqueSection):
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
         core_version: Optional[str] = None,
+        max_data_node_edits: Optional[int] = None,
         **properties,
     ):
         self._root_folder = root_folder
@@ -87,6 +91,7 @@ class CoreSection(UniqueSection):
         self._mode = mode
         self._version_number = version_number
         self._force = force
+        self._max_data_node_edits = max_data_node_edits
 
         self._check_compatibility(core_version)
         self._core_version = core_version
@@ -105,6 +110,7 @@ class CoreSection(UniqueSection):
             self.version_number,
             self.force,
             self._core_version,
+            self._max_data_node_edits,
             **copy(self._properties),
         )
 
@@ -242,6 +248,23 @@ class CoreSection(UniqueSection):
     def force(self, val) -> None:
         self._force = val
 
+    @property
+    def max_data_node_edits(self) -> Optional[int]:
+        """Maximum number of edits kept in each data node.
+
+        When a data node has more edits, the oldest ones are moved to an append-only log stored
+        next to the data node entities. They can still be retrieved with
+        `(DataNode.)get_edit_history()^`.
+
+        The default value is None, meaning that all the edits are kept in the data node.
+        """
+        return _tpl._replace_templates(self._max_data_node_edits)
+
+    @max_data_node_edits.setter  # type: ignore
+    @_ConfigBlocker._check()
+    def max_data_node_edits(self, val) -> None:
+        self._max_data_node_edits = val
+
     @property
     def core_version(self) -> str:
         """The version of the Taipy core library."""
@@ -265,6 +288,7 @@ class CoreSection(UniqueSection):
             cls._DEFAULT_VERSION_NUMBER,
             cls._DEFAULT_FORCE,
             cls._CURRENT_CORE_VERSION,
+            cls._DEFAULT_MAX_DATA_NODE_EDITS,
         )
 
     def _clean(self):
@@ -277,6 +301,7 @@ class CoreSection(UniqueSection):
         self.mode = self._DEFAULT_MODE
         self.version_number = self._DEFAULT_VERSION_NUMBER
         self.force = self._DEFAULT_FORCE
+        self._max_data_node_edits = self._DEFAULT_MAX_DATA_NODE_EDITS
         self._core_version = self._CURRENT_CORE_VERSION
         self._properties.clear()
 
@@ -300,6 +325,8 @@ class CoreSection(UniqueSection):
             as_dict[self._VERSION_NUMBER_KEY] = self.version_number
         if self.force is not None:
             as_dict[self._FORCE_KEY] = self.force
+        if self._max_data_node_edits is not None:
+            as_dict[self._MAX_DATA_NODE_EDITS_KEY] = self._max_data_node_edits
         if self._core_version is not None:
             as_dict[self._CORE_VERSION_KEY] = self._core_version
         as_dict.update(self._properties)
@@ -317,6 +344,7 @@ class CoreSection(UniqueSection):
         version_nb = as_dict.pop(cls._VERSION_NUMBER_KEY, None)
         force = as_dict.pop(cls._FORCE_KEY, None)
         core_version = as_dict.pop(cls._CORE_VERSION_KEY, None)
+        max_data_node_edits = as_dict.pop(cls._MAX_DATA_NODE_EDITS_KEY, None)
         return CoreSection(
             root_folder,
             storage_folder,
@@ -328,6 +356,7 @@ class CoreSection(UniqueSection):
             version_nb,
             force,
             core_version,
+            max_data_node_edits,
             **as_dict,
         )
 
@@ -348,6 +377,7 @@ class CoreSection(UniqueSection):
         self._mode = as_dict.pop(self._MODE_KEY, self.mode)
         self._version_number = as_dict.pop(self._VERSION_NUMBER_KEY, self.version_number)
         self._force = as_dict.pop(self._FORCE_KEY, self.force)
+        self._max_data_node_edits = as_dict.pop(self._MAX_DATA_NODE_EDITS_KEY, self._max_data_node_edits)
 
         core_version = as_dict.pop(self._CORE_VERSION_KEY, None)
         self._check_compatibility(core_version)
@@ -386,6 +416,7 @@ class CoreSection(UniqueSection):
         mode: Optional[str] = None,
         version_number: Optional[str] = None,
         force: Optional[bool] = None,
+        max_data_node_edits: Optional[int] = None,
         **properties,
     ) -> "CoreSection":
         """Configure the Orchestrator service.
@@ -414,6 +445,9 @@ class CoreSection(UniqueSection):
                  In development mode, the version number is ignored.
             force (Optional[bool]): If True, Taipy will override a version even if the configuration
                 has changed and run the application.
+            max_data_node_edits (Optional[int]): Maximum number of edits kept in each data node. The oldest
+                edits are moved to an append-only log. The default value is None, meaning that all the edits
+                are kept in the data node.
             **properties (Dict[str, Any]): A keyworded variable length list of additional arguments configure the
                 behavior of the `Orchestrator^` service.
 
@@ -431,6 +465,7 @@ class CoreSection(UniqueSection):
             version_number=version_number,
             force=force,
             core_version=_read_version(),
+            max_data_node_edits=max_data_node_edits,
             **properties,
         )
         Config._register(section)
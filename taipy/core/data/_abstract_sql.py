@@ -18,7 +18,6 @@ from typing import Dict, List, Optional, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
-from sqlalchemy import create_engine, text
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common.scope import Scope
@@ -162,6 +161,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
 
     def _get_engine(self):
         if self._engine is None:
+            from sqlalchemy import create_engine
+
             self._engine = create_engine(self._conn_string())
         return self._engine
 
@@ -213,6 +214,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         return self._read_as()
 
     def _read_as(self, operators: Optional[Union[List, Tuple]] = None, join_operator=JoinOperator.AND):
+        from sqlalchemy import text
+
         custom_class = self.properties[self._EXPOSED_TYPE_PROPERTY]
         with self._get_engine().connect() as connection:
             query_result = connection.execute(text(self._get_read_query(operators, join_operator)))
@@ -229,6 +232,8 @@ class _AbstractSQLDataNode(DataNode, _TabularDataNodeMixin):
         operators: Optional[Union[List, Tuple]] = None,
         join_operator=JoinOperator.AND,
     ):
+        from sqlalchemy import text
+
         with self._get_engine().connect() as conn:
             result = conn.execute(text(self._get_read_query(operators, join_operator)))
 
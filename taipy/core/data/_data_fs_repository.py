@@ -8,11 +8,94 @@
 # Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
+import json
+import os
+import pathlib
+import shutil
+from typing import Iterator, List
+
+from .._repository._decoder import _Decoder
+from .._repository._encoder import _Encoder
 from .._repository._filesystem_repository import _FileSystemRepository
 from ._data_converter import _DataNodeConverter
 from ._data_model import _DataNodeModel
+from .data_node_id import EDIT_TIMESTAMP_KEY, Edit
 
 
 class _DataFSRepository(_FileSystemRepository):
+    # Edits removed from the data nodes are appended to one JSON lines file per data node
+    _EDITS_DIR_NAME = "data_node_edits"
+
     def __init__(self) -> None:
         super().__init__(model_type=_DataNodeModel, converter=_DataNodeConverter, dir_name="data_nodes")
+
+    @property
+    def _edits_dir_path(self) -> pathlib.Path:
+        return self._storage_folder / self._EDITS_DIR_NAME
+
+    def _delete(self, entity_id: str):
+        super()._delete(entity_id)
+        self._delete_edits(entity_id)
+
+    def _delete_all(self):
+        super()._delete_all()
+        shutil.rmtree(self._edits_dir_path, ignore_errors=True)
+
+    def _append_edits(self, entity_id: str, edits: List[Edit]):
+        # The same edits may be archived again when the data node could not be saved after they were
+        # archived, or when they are archived from two copies of the data node
+        archived = self.__load_recent_edits(entity_id, min(edit[EDIT_TIMESTAMP_KEY] for edit in edits))
+        if not (edits := [edit for edit in edits if edit not in archived]):
+            return
+        self._edits_dir_path.mkdir(parents=True, exist_ok=True)
+        with self.__get_edits_path(entity_id).open("a", encoding="UTF-8") as edits_file:
+            edits_file.writelines(json.dumps(edit, ensure_ascii=False, cls=_Encoder) + "\n" for edit in edits)
+
+    def _load_edits(self, entity_id: str) -> List[Edit]:
+        try:
+            with self.__get_edits_path(entity_id).open(encoding="UTF-8") as edits_file:
+                return [json.loads(line, cls=_Decoder) for line in edits_file if line.strip()]
+        except FileNotFoundError:
+            return []
+
+    def _count_edits(self, entity_id: str) -> int:
+        try:
+            with self.__get_edits_path(entity_id).open("rb") as edits_file:
+                return sum(chunk.count(b"\n") for chunk in iter(lambda: edits_file.read(1 << 16), b""))
+        except FileNotFoundError:
+            return 0
+
+    def _delete_edits(self, entity_id: str):
+        self.__get_edits_path(entity_id).unlink(missing_ok=True)
+
+    def __get_edits_path(self, entity_id: str) -> pathlib.Path:
+        return self._edits_dir_path / f"{entity_id}.jsonl"
+
+    def __load_recent_edits(self, entity_id: str, since) -> List[Edit]:
+        """Load the archived edits from the most recent one back to the first one older than *since*."""
+        edits: List[Edit] = []
+        try:
+            for line in self.__read_lines_backward(self.__get_edits_path(entity_id)):
+                if not line.strip():
+                    continue
+                edit = json.loads(line, cls=_Decoder)
+                if edit[EDIT_TIMESTAMP_KEY] < since:
+                    break
+                edits.append(edit)
+        except FileNotFoundError:
+            pass
+        return edits
+
+    @staticmethod
+    def __read_lines_backward(path: pathlib.Path, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        with path.open("rb") as edits_file:
+            position = edits_file.seek(0, os.SEEK_END)
+            remainder = b""
+            while position > 0:
+                size = min(chunk_size, position)
+                position -= size
+                edits_file.seek(position)
+                lines = (edits_file.read(size) + remainder).split(b"\n")
+                remainder = lines.pop(0)
+                yield from reversed(lines)
+            yield remainder
@@ -15,6 +15,7 @@ from typing import Dict, Iterable, List, Optional, Set, Union
 from taipy.common.config import Config
 from taipy.common.config._config import _Config
 
+from .._manager._entity_cache import _EntityCache
 from .._manager._manager import _Manager
 from .._version._version_mixin import _VersionMixin
 from ..common.scope import Scope
@@ -159,6 +160,9 @@ class _DataManager(_Manager[DataNode], _VersionMixin):
         data_nodes = cls._get_all(version_number)
         cls._clean_generated_files(data_nodes)
         cls._repository._delete_by(attribute="version", value=version_number)
+        _EntityCache._discard()
+        for data_node in data_nodes:
+            cls._repository._delete_edits(data_node.id)
         Notifier.publish(
             Event(EventEntityType.DATA_NODE, EventOperation.DELETION, metadata={"delete_by_version": version_number})
         )
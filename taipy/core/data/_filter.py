@@ -13,7 +13,7 @@ from collections.abc import Hashable
 from functools import reduce
 from itertools import chain
 from operator import and_, or_
-from typing import Dict, Iterable, List, Tuple, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -40,6 +40,38 @@ class _FilterDataNode:
     def __is_list_of_dict(data) -> bool:
         return all(isinstance(x, Dict) for x in data)
 
+    @staticmethod
+    def _iter_chunks(
+        data,
+        columns: Optional[List[str]] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Iterate over the rows of *data* from *start* to *stop*, by chunks of at most *chunk_size* rows.
+
+        Only the *columns* of tabular data are kept. Data that is not made of rows is returned as is.
+        """
+        if data is None:
+            return
+        if _FilterDataNode.__is_pandas_object(data):
+            if columns and isinstance(data, pd.DataFrame):
+                data = data[columns]
+            get_rows = data.iloc.__getitem__
+        elif isinstance(data, np.ndarray):
+            get_rows = data.__getitem__
+        elif isinstance(data, List):
+            if columns and _FilterDataNode.__is_list_of_dict(data):
+                data = [{column: row.get(column) for column in columns} for row in data]
+            get_rows = data.__getitem__
+        else:
+            yield data
+            return
+        stop = len(data) if stop is None else min(stop, len(data))
+        step = chunk_size or max(stop - start, 1)
+        for chunk_start in range(start, stop, step):
+            yield get_rows(slice(chunk_start, min(chunk_start + step, stop)))
+
     @staticmethod
     def _filter_by_key(data, key):
         if isinstance(key, int):
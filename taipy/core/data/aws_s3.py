@@ -10,15 +10,10 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime, timedelta
-from importlib import util
 from typing import Any, Dict, List, Optional, Set
 
-from ..common._check_dependencies import _check_dependency_is_installed
-
-if util.find_spec("boto3"):
-    import boto3
-
 from .._version._version_manager_factory import _VersionManagerFactory
+from ..common._check_dependencies import _check_dependency_is_installed
 from ..common.scope import Scope
 from ..exceptions.exceptions import MissingRequiredProperty
 from .data_node import DataNode
@@ -117,6 +112,8 @@ class S3ObjectDataNode(DataNode):
             **properties,
         )
 
+        import boto3
+
         self._s3_client = boto3.client(
             "s3",
             aws_access_key_id=properties.get(self.__AWS_ACCESS_KEY_ID),
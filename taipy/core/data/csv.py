@@ -11,7 +11,7 @@
 
 import csv
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set
 
 import numpy as np
 import pandas as pd
@@ -139,6 +139,40 @@ class CSVDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
             return self._read_as_numpy(path=path)
         return self._read_as(path=path)
 
+    def _read_chunks(
+        self,
+        columns: Optional[List[str]] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        properties = self.properties
+        exposed_type = properties[self._EXPOSED_TYPE_PROPERTY]
+        is_numpy = exposed_type in [self._EXPOSED_TYPE_NUMPY, self._EXPOSED_TYPE_NUMPY_NDARRAY]
+        if not properties[self._HAS_HEADER_PROPERTY] or (
+            not is_numpy and exposed_type not in [self._EXPOSED_TYPE_PANDAS, self._EXPOSED_TYPE_PANDAS_DATAFRAME]
+        ):
+            yield from super()._read_chunks(columns, start, stop, chunk_size)
+            return
+        if not self.last_edit_date or (stop is not None and stop <= start):
+            return
+        # Only the requested rows and columns are parsed, chunk by chunk
+        try:
+            chunks = pd.read_csv(
+                self._path,
+                encoding=properties[self.__ENCODING_KEY],
+                usecols=columns or None,
+                skiprows=range(1, start + 1) if start else None,
+                nrows=None if stop is None else stop - start,
+                chunksize=chunk_size or None,
+            )
+        except pd.errors.EmptyDataError:
+            return
+        for chunk in chunks if chunk_size else [chunks]:
+            if columns:
+                chunk = chunk[columns]
+            yield chunk.to_numpy() if is_numpy else chunk
+
     def _read_as(self, path: str):
         properties = self.properties
         with open(path, encoding=properties[self.__ENCODING_KEY]) as csvFile:
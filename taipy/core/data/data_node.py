@@ -15,7 +15,7 @@ import typing
 import uuid
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union, cast
 
 import networkx as nx
 
@@ -199,6 +199,9 @@ class DataNode(_Entity, _Labeled):
             <li>job_id: Only populated when the data node is written by a task execution and
                 corresponds to the job's id.</li></ul>
         Additional metadata related to the edition made to the data node can also be provided in Edits.
+
+        When `Config.core.max_data_node_edits` is set, only the most recent edits are kept in this
+        list. `(DataNode.)get_edit_history()^` returns all the edits.
         """
         return self._edits
 
@@ -422,6 +425,21 @@ class DataNode(_Entity, _Labeled):
             )
             return None
 
+    def _read_chunks(
+        self,
+        columns: Optional[List[str]] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Read the rows from *start* to *stop* by chunks of at most *chunk_size* rows.
+
+        Only the *columns* of tabular data are read. Nothing is returned if the data has not been
+        written yet.<br/>
+        Data nodes that cannot read their data by chunks read it entirely before splitting it.
+        """
+        return _FilterDataNode._iter_chunks(self.read(), columns, start, stop, chunk_size)
+
     def append(self, data, editor_id: Optional[str] = None, comment: Optional[str] = None, **kwargs: Any):
         """Append some data to this data node.
 
@@ -501,8 +519,36 @@ class DataNode(_Entity, _Labeled):
         edit[EDIT_TIMESTAMP_KEY] = timestamp
         self.last_edit_date = edit.get(EDIT_TIMESTAMP_KEY)
         self._edits.append(typing.cast(Edit, edit))
+        self.__archive_edits()
         self.edits = self._edits
 
+    def get_edit_history(self) -> List[Edit]:
+        """Get all the edits of this data node, from the oldest to the most recent.
+
+        This includes the edits that were moved out of the data node according to
+        `Config.core.max_data_node_edits`.
+
+        Returns:
+            The list of all the edits of this data node.
+        """
+        from ._data_manager_factory import _DataManagerFactory
+
+        return _DataManagerFactory._build_manager()._repository._load_edits(self.id) + self.edits
+
+    def _count_archived_edits(self) -> int:
+        from ._data_manager_factory import _DataManagerFactory
+
+        return _DataManagerFactory._build_manager()._repository._count_edits(self.id)
+
+    def __archive_edits(self):
+        if not (max_edits := Config.core.max_data_node_edits) or len(self._edits) <= int(max_edits):
+            return
+        from ._data_manager_factory import _DataManagerFactory
+
+        nb_archived = len(self._edits) - int(max_edits)
+        _DataManagerFactory._build_manager()._repository._append_edits(self.id, self._edits[:nb_archived])
+        self._edits = self._edits[nb_archived:]
+
     def lock_edit(self, editor_id: Optional[str] = None):
         """Lock the data node modification.
 
@@ -14,7 +14,6 @@ from typing import Any, Dict, List, Optional, Set, Union
 
 import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
 
 from .._entity._reload import _Reloader
 from .._version._version_manager_factory import _VersionManagerFactory
@@ -169,6 +168,8 @@ class ExcelDataNode(DataNode, _FileDataNodeMixin, _TabularDataNodeMixin):
         return None
 
     def _read_as(self, path: str):
+        from openpyxl import load_workbook
+
         try:
             properties = self.properties
             excel_file = load_workbook(path, read_only=True)
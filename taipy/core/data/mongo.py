@@ -10,17 +10,12 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime, timedelta
-from importlib import util
 from inspect import isclass
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common._check_dependencies import _check_dependency_is_installed
 from ..common.scope import Scope
-
-if util.find_spec("pymongo"):
-    from ..common._mongo_connector import _connect_mongodb
-
 from ..data.operator import JoinOperator, Operator
 from ..exceptions.exceptions import InvalidCustomDocument, MissingRequiredProperty
 from .data_node import DataNode
@@ -111,6 +106,8 @@ class MongoCollectionDataNode(DataNode):
             **properties,
         )
 
+        from ..common._mongo_connector import _connect_mongodb
+
         mongo_client = _connect_mongodb(
             db_host=properties.get(self.__DB_HOST_KEY, self.__DB_HOST_DEFAULT),
             db_port=properties.get(self.__DB_PORT_KEY, self.__DB_PORT_DEFAULT),
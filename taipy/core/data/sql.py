@@ -12,8 +12,6 @@
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Set
 
-from sqlalchemy import text
-
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common.scope import Scope
 from ..exceptions.exceptions import MissingAppendQueryBuilder, MissingRequiredProperty
@@ -126,6 +124,8 @@ class SQLDataNode(_AbstractSQLDataNode):
         self.__execute_queries(queries, connection)
 
     def __execute_queries(self, queries, connection) -> None:
+        from sqlalchemy import text
+
         if not isinstance(queries, List):
             queries = [queries]
         for query in queries:
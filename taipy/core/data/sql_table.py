@@ -10,10 +10,9 @@
 # specific language governing permissions and limitations under the License.
 
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
 
 import pandas as pd
-from sqlalchemy import MetaData, Table
 
 from .._version._version_manager_factory import _VersionManagerFactory
 from ..common.scope import Scope
@@ -21,6 +20,9 @@ from ..exceptions.exceptions import MissingRequiredProperty
 from ._abstract_sql import _AbstractSQLDataNode
 from .data_node_id import DataNodeId, Edit
 
+if TYPE_CHECKING:
+    from sqlalchemy import Table
+
 
 class SQLTableDataNode(_AbstractSQLDataNode):
     """Data Node stored in a SQL table.
@@ -110,7 +112,9 @@ class SQLTableDataNode(_AbstractSQLDataNode):
             delete_table,
         )
 
-    def _create_table(self, engine) -> Table:
+    def _create_table(self, engine) -> "Table":
+        from sqlalchemy import MetaData, Table
+
         return Table(
             self.properties[self.__TABLE_KEY],
             MetaData(),
@@ -153,6 +153,13 @@ class NonExistingJob(RuntimeError):
         self.message = f"Job: {job_id} does not exist."
 
 
+class NonExistingSubmission(RuntimeError):
+    """Raised if a requested submission is not known by the Submission manager."""
+
+    def __init__(self, submission_id: str):
+        self.message = f"Submission: {submission_id} does not exist."
+
+
 class SubmissionNotDeletedException(RuntimeError):
     """Raised if there is an attempt to delete a submission that cannot be deleted.
 
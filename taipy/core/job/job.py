@@ -485,6 +485,7 @@ def _make_event_for_job(
     metadata = {
         "creation_date": job._creation_date,
         "task_config_id": job._task.config_id,
+        "submission_id": job._submit_id,
         "version": job._version,
         **kwargs,
     }
@@ -29,11 +29,13 @@ class _Registration:
         entity_id: Optional[str] = None,
         operation: Optional[EventOperation] = None,
         attribute_name: Optional[str] = None,
+        batch: bool = False,
     ):
 
         self.registration_id: str = self._new_id()
         self.topic: _Topic = _Topic(entity_type, entity_id, operation, attribute_name)
         self.queue: SimpleQueue = SimpleQueue()
+        self.batch = batch
 
     @staticmethod
     def _new_id() -> RegistrationId:
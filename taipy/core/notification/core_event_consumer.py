@@ -11,9 +11,13 @@
 
 import abc
 import threading
+import time
 from queue import Empty, SimpleQueue
+from typing import Dict, List, Optional, Tuple
 
-from .event import Event
+from taipy.common.logger._taipy_logger import _TaipyLogger
+
+from .event import Event, EventEntityType, EventOperation
 
 
 class CoreEventConsumerBase(threading.Thread):
@@ -51,9 +55,29 @@ class CoreEventConsumerBase(threading.Thread):
         Then, we would specify the type of event we want to receive by registering with the Notifier.
         After that, we create an object of the consumer class by providing
         the registration_id and registered_queue and start consuming the event.
+
+    ??? example "Batch mode"
+
+        When *max_batch_size* is set, the consumer drains up to *max_batch_size* events,
+        waiting at most *max_batch_delay* seconds for more events once the first one is
+        received. Successive updates of the same attribute of the same entity are coalesced:
+        only the most recent one is kept. The resulting events are passed to
+        `process_events()`, that calls `process_event()` for each of them unless it is
+        overridden.
+
+        ```python
+        consumer = MyEventConsumer(registration_id, registered_queue, max_batch_size=100)
+        ```
     """
 
-    def __init__(self, registration_id: str, queue: SimpleQueue) -> None:
+    def __init__(
+        self,
+        registration_id: str,
+        queue: SimpleQueue,
+        max_batch_size: Optional[int] = None,
+        max_batch_delay: float = 0.05,
+        max_queue_size: Optional[int] = None,
+    ) -> None:
         """Initialize a CoreEventConsumerBase instance.
 
         Arguments:
@@ -61,12 +85,28 @@ class CoreEventConsumerBase(threading.Thread):
                 registration id invoking `Notifier.register()^` method.
             queue (SimpleQueue): The queue from which events will be consumed. You can get a
                 queue invoking `Notifier.register()^` method.
+            max_batch_size (Optional[int]): If provided, the consumer runs in batch mode and
+                passes up to *max_batch_size* events at a time to `process_events()`.
+            max_batch_delay (float): In batch mode, the maximum time in seconds to wait for
+                more events once the first event of a batch is received. The default value is 0.05.
+            max_queue_size (Optional[int]): If provided, the maximum number of events that
+                can wait in the queue. When the consumer falls behind, the oldest events
+                beyond that limit are discarded and a warning is logged.
         """
         threading.Thread.__init__(self, name=f"Thread-Taipy-Core-Consumer-{registration_id}")
         self.daemon = True
         self.queue = queue
         self.__STOP_FLAG = False
         self._TIMEOUT = 0.1
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        self._max_queue_size = max_queue_size
+        self.__metrics = {
+            "processed_events": 0,
+            "coalesced_events": 0,
+            "discarded_events": 0,
+            "max_queue_size": 0,
+        }
 
     def start(self) -> None:
         """Start the event consumer thread."""
@@ -77,15 +117,100 @@ class CoreEventConsumerBase(threading.Thread):
         """Stop the event consumer thread."""
         self.__STOP_FLAG = True
 
+    def get_metrics(self) -> Dict[str, int]:
+        """Get the metrics of the event queue of this consumer.
+
+        Returns:
+            A dictionary holding:
+
+            - *queue_size*: the number of items currently waiting in the queue.
+            - *max_queue_size*: the largest number of items seen waiting in the queue.
+            - *processed_events*: the number of events that were processed.
+            - *coalesced_events*: the number of events that were dropped because a more
+                recent update of the same attribute was in the same batch.
+            - *discarded_events*: the number of events that were discarded because the queue
+                exceeded *max_queue_size*.
+        """
+        return {"queue_size": self.queue.qsize(), **self.__metrics}
+
     def run(self) -> None:
         while not self.__STOP_FLAG:
             try:
-                event: Event = self.queue.get(block=True, timeout=self._TIMEOUT)
-                self.process_event(event)
+                item = self.queue.get(block=True, timeout=self._TIMEOUT)
             except Empty:
-                pass
+                continue
+            # Registrations made with batch=True receive lists of events
+            events = list(item) if isinstance(item, list) else [item]
+            self.__check_queue_size()
+            if self._max_batch_size:
+                self.__fill_batch(events)
+                events = self.__coalesce(events)
+                self.__metrics["processed_events"] += len(events)
+                self.process_events(events)
+            else:
+                for event in events:
+                    self.__metrics["processed_events"] += 1
+                    self.process_event(event)
+
+    def process_events(self, events: List[Event]) -> None:
+        """Process a batch of events.
+
+        This method is only called in batch mode. It calls `process_event()` for each event
+        and can be overridden in subclasses to process the events together.
+
+        Arguments:
+            events (List[Event^]): The events to process, in the order they were published.
+        """
+        for event in events:
+            self.process_event(event)
 
     @abc.abstractmethod
     def process_event(self, event: Event) -> None:
         """This method should be overridden in subclasses to define how events are processed."""
         raise NotImplementedError
+
+    def __fill_batch(self, events: List[Event]) -> None:
+        deadline = time.monotonic() + self._max_batch_delay
+        while len(events) < self._max_batch_size:  # type: ignore[operator]
+            if (remaining := deadline - time.monotonic()) <= 0:
+                break
+            try:
+                item = self.queue.get(block=True, timeout=remaining)
+            except Empty:
+                break
+            if isinstance(item, list):
+                events.extend(item)
+            else:
+                events.append(item)
+
+    def __coalesce(self, events: List[Event]) -> List[Event]:
+        # Only the last update of an entity attribute is kept
+        last_updates: Dict[Tuple[EventEntityType, str, str], int] = {}
+        for index, event in enumerate(events):
+            if event.operation == EventOperation.UPDATE and event.entity_id and event.attribute_name:
+                last_updates[(event.entity_type, event.entity_id, event.attribute_name)] = index
+        coalesced_events = [
+            event
+            for index, event in enumerate(events)
+            if not (event.operation == EventOperation.UPDATE and event.entity_id and event.attribute_name)
+            or last_updates[(event.entity_type, event.entity_id, event.attribute_name)] == index  # type: ignore
+        ]
+        self.__metrics["coalesced_events"] += len(events) - len(coalesced_events)
+        return coalesced_events
+
+    def __check_queue_size(self) -> None:
+        queue_size = self.queue.qsize()
+        self.__metrics["max_queue_size"] = max(self.__metrics["max_queue_size"], queue_size)
+        if self._max_queue_size is None or queue_size <= self._max_queue_size:
+            return
+        discarded = 0
+        for _ in range(queue_size - self._max_queue_size):
+            try:
+                item = self.queue.get_nowait()
+            except Empty:
+                break
+            discarded += len(item) if isinstance(item, list) else 1
+        self.__metrics["discarded_events"] += discarded
+        _TaipyLogger._get_logger().warning(
+            f"{self.name}: {discarded} event(s) discarded because the queue exceeded {self._max_queue_size} items."
+        )
@@ -9,8 +9,9 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+from collections import defaultdict
 from queue import SimpleQueue
-from typing import Any, Dict, Optional, Set, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from ._registration import _Registration
 from ._topic import _Topic
@@ -55,6 +56,12 @@ class Notifier:
 
     _topics_registrations_list: Dict[_Topic, Set[_Registration]] = {}
 
+    # Topics by (entity type, operation, entity id), any of them being None when the topic does not filter on it.
+    # The index is rebuilt when _topics_registrations_list is replaced.
+    __topics_index: Dict[Tuple[Optional[EventEntityType], Optional[EventOperation], Optional[str]], Set[_Topic]] = {}
+    __indexed_topics_registrations_list: Optional[Dict[_Topic, Set[_Registration]]] = None
+    __registrations: Dict[str, _Registration] = {}
+
     @classmethod
     def register(
         cls,
@@ -62,6 +69,7 @@ class Notifier:
         entity_id: Optional[str] = None,
         operation: Optional[EventOperation] = None,
         attribute_name: Optional[str] = None,
+        batch: bool = False,
     ) -> Tuple[str, SimpleQueue]:
         """Register a listener for a specific event topic.
 
@@ -118,16 +126,23 @@ class Notifier:
             attribute_name (Optional[str]): If provided, the listener will be notified
                 for all events related to this entity's attribute. Otherwise, the listener
                 will be notified for events related to all attributes.
+            batch (bool): If True, the events that are published together (when an entity
+                leaves a `with` block or when several entities are deleted at once) are put
+                in the queue as a single list of events. Otherwise, each event is put in the
+                queue individually. `CoreEventConsumerBase^` handles both.
 
         Returns:
             A tuple containing the registration id and the event queue.
         """
-        registration = _Registration(entity_type, entity_id, operation, attribute_name)
+        registration = _Registration(entity_type, entity_id, operation, attribute_name, batch)
+        cls.__check_index()
 
         if registrations := cls._topics_registrations_list.get(registration.topic, None):
             registrations.add(registration)
         else:
             cls._topics_registrations_list[registration.topic] = {registration}
+            cls.__index_topic(registration.topic)
+        cls.__registrations[registration.registration_id] = registration
 
         return registration.registration_id, registration.queue
 
@@ -150,19 +165,13 @@ class Notifier:
         Arguments:
             registration_id (`RegistrationId`): The registration id returned by the `register` method.
         """
-        to_remove_registration: Optional[_Registration] = None
-
-        for _, registrations in cls._topics_registrations_list.items():
-            for registration in registrations:
-                if registration.registration_id == registration_id:
-                    to_remove_registration = registration
-                    break
-
-        if to_remove_registration:
+        cls.__check_index()
+        if to_remove_registration := cls.__registrations.pop(registration_id, None):
             registrations = cls._topics_registrations_list[to_remove_registration.topic]
             registrations.remove(to_remove_registration)
             if len(registrations) == 0:
                 del cls._topics_registrations_list[to_remove_registration.topic]
+                cls.__unindex_topic(to_remove_registration.topic)
 
     @classmethod
     def publish(cls, event: Event) -> None:
@@ -171,11 +180,72 @@ class Notifier:
         Arguments:
             event (`Event^`): The event to publish.
         """
-        for topic, registrations in cls._topics_registrations_list.items():
-            if Notifier._is_matching(event, topic):
-                for registration in registrations:
+        for registration in cls.__get_registrations(event):
+            registration.queue.put(event)
+
+    @classmethod
+    def _publish_batch(cls, events: Iterable[Event]) -> None:
+        """Publish several events at once.
+
+        Registrations made with *batch* set to True receive the events that match their topic
+        as a single list. The other registrations receive the events one by one.
+        """
+        events_by_registration: Dict[_Registration, List[Event]] = defaultdict(list)
+        for event in events:
+            for registration in cls.__get_registrations(event):
+                events_by_registration[registration].append(event)
+        for registration, registration_events in events_by_registration.items():
+            if registration.batch:
+                registration.queue.put(registration_events)
+            else:
+                for event in registration_events:
                     registration.queue.put(event)
 
+    @classmethod
+    def __get_registrations(cls, event: Event) -> List[_Registration]:
+        cls.__check_index()
+        if not cls.__topics_index:
+            return []
+        entity_types = (event.entity_type, None) if event.entity_type is not None else (None,)
+        operations = (event.operation, None) if event.operation is not None else (None,)
+        entity_ids = (event.entity_id, None) if event.entity_id is not None else (None,)
+        matching_registrations: List[_Registration] = []
+        for entity_type in entity_types:
+            for operation in operations:
+                for entity_id in entity_ids:
+                    if topics := cls.__topics_index.get((entity_type, operation, entity_id)):
+                        for topic in tuple(topics):
+                            if (
+                                topic.attribute_name is None
+                                or not event.attribute_name
+                                or event.attribute_name == topic.attribute_name
+                            ):
+                                matching_registrations.extend(cls._topics_registrations_list.get(topic, ()))
+        return matching_registrations
+
+    @classmethod
+    def __check_index(cls) -> None:
+        if cls.__indexed_topics_registrations_list is not cls._topics_registrations_list:
+            cls.__topics_index = {}
+            cls.__registrations = {}
+            for topic, registrations in cls._topics_registrations_list.items():
+                cls.__index_topic(topic)
+                for registration in registrations:
+                    cls.__registrations[registration.registration_id] = registration
+            cls.__indexed_topics_registrations_list = cls._topics_registrations_list
+
+    @classmethod
+    def __index_topic(cls, topic: _Topic) -> None:
+        cls.__topics_index.setdefault((topic.entity_type, topic.operation, topic.entity_id), set()).add(topic)
+
+    @classmethod
+    def __unindex_topic(cls, topic: _Topic) -> None:
+        key = (topic.entity_type, topic.operation, topic.entity_id)
+        if (topics := cls.__topics_index.get(key)) is not None:
+            topics.discard(topic)
+            if not topics:
+                del cls.__topics_index[key]
+
     @staticmethod
     def _is_matching(event: Event, topic: _Topic) -> bool:
         """Check if an event matches a topic."""
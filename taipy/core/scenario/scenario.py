@@ -564,16 +564,18 @@ class Scenario(_Entity, Submittable, _Labeled):
             sequence_names (List[str]): A list of sequence names to remove.
         """
         _sequences = _Reloader()._reload(self._MANAGER_NAME, self)._sequences
+        events = []
         for sequence_name in sequence_names:
             seq_id = self.sequences[sequence_name].id
             _sequences.pop(sequence_name)
-            Notifier.publish(
+            events.append(
                 Event(
                     EventEntityType.SEQUENCE,
                     EventOperation.DELETION,
                     entity_id=seq_id,
                 )
             )
+        Notifier._publish_batch(events)
         self.sequences = _sequences  # type: ignore
 
     def rename_sequence(self, old_name, new_name) -> None:
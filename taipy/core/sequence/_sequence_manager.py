@@ -95,8 +95,10 @@ class _SequenceManager(_Manager[Sequence], _VersionMixin):
                 scenario_manager._set(scenario)
 
             if hasattr(cls, "_EVENT_ENTITY_TYPE"):
-                for sequence_id in sequence_ids:
-                    Notifier.publish(Event(cls._EVENT_ENTITY_TYPE, EventOperation.DELETION, entity_id=sequence_id))
+                Notifier._publish_batch(
+                    Event(cls._EVENT_ENTITY_TYPE, EventOperation.DELETION, entity_id=sequence_id)
+                    for sequence_id in sequence_ids
+                )
         except (ModelNotFound, KeyError):
             cls.__log_error_entity_not_found(sequence_id)
             raise ModelNotFound(cls._model_name, sequence_id) from None
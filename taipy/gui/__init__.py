@@ -77,8 +77,10 @@ from ._renderers import Html, Markdown
 from ._renderers.json import JsonAdapter
 from .gui_actions import (
     broadcast_callback,
+    cancel_long_callback,
     close_notification,
     download,
+    get_long_callback_status,
     get_module_context,
     get_module_name_from_state,
     get_state_id,
@@ -110,3 +112,7 @@ if find_spec("taipy") and find_spec("taipy.common.config"):
         [("configure_gui", _GuiSection._configure)],
         add_to_unconflicted_sections=True,
     )
+
+if find_spec("taipy") and find_spec("taipy.gui_core"):
+    # Register the scenario management visual elements
+    import taipy.gui_core  # noqa: F401
@@ -56,10 +56,13 @@ default_config: Config = {
     "flask_log": False,
     "host": "127.0.0.1",
     "light_theme": None,
+    "long_callback_client_limit": 0,
+    "long_callback_max_workers": None,
     "margin": "1em",
     "ngrok_token": "",
     "notebook_proxy": True,
     "notification_duration": 3000,
+    "page_render_cache": False,
     "port": 5000,
     "port_auto_ranges": [(49152, 65535)],
     "propagate": True,
@@ -69,6 +72,8 @@ default_config: Config = {
     "server_config": None,
     "single_client": False,
     "state_retention_period": 0,
+    "state_spill_folder": None,
+    "state_spill_period": 0,
     "system_notification": False,
     "theme": None,
     "time_zone": None,
@@ -79,4 +84,5 @@ default_config: Config = {
     "use_reloader": False,
     "watermark": "Taipy inside",
     "webapp_path": None,
+    "ws_batch_window": 0,
 }
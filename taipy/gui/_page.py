@@ -37,9 +37,24 @@ class _Page(object):
         self._head: t.Optional[list] = None
         self._script_paths: t.Optional[t.Union[str, Path, t.List[t.Union[str, Path]]]] = None
 
+    def __get_render_cache_key(self, gui: Gui) -> t.Optional[t.Tuple[t.Any, ...]]:
+        # Only pages generated from text are cached: builder pages can be modified in place
+        content = getattr(self._renderer, "_content", None)
+        if getattr(self._renderer, "_base_element", True) is not None or not isinstance(content, str):
+            return None
+        return (type(self._renderer), content, gui._get_render_version())
+
     def render(self, gui: Gui, silent: t.Optional[bool] = False):
         if self._renderer is None:
             raise RuntimeError(f"Can't render page {self._route}: no renderer found")
+        render_cache = gui._get_page_render_cache()
+        cache_key = self.__get_render_cache_key(gui) if render_cache is not None else None
+        if cache_key is not None and (cached := render_cache.get(self._route)) is not None:  # type: ignore[union-attr]
+            key, jsx, head, module_name = cached
+            if key == cache_key:
+                self._rendered_jsx = jsx
+                self._head = head
+                return module_name
         with warnings.catch_warnings(record=True) as w:
             warnings.resetwarnings()
             module_name = self._renderer._get_module_name()
@@ -54,17 +69,7 @@ class _Page(object):
                     logging.warning("\033[1;31m\n" + s)
 
             else:
-                if (
-                    self._rendered_jsx
-                    and isinstance(self._rendered_jsx, str)
-                    and (
-                        result := _DETECT_CLOSING_TAGS.sub(
-                            _SUBSTR_CLOSING_TAG,
-                            self._rendered_jsx.replace(">style</TaipyStyle>", "/>"),
-                        )
-                    )
-                ):
-                    self._rendered_jsx = result
+                self.__close_tags()
                 if w:
                     s = "\033[1;31m\n"
                     s += (
@@ -78,5 +83,22 @@ class _Page(object):
                     logging.warning(s)
         if hasattr(self._renderer, "head"):
             self._head = list(self._renderer.head)  # type: ignore
+        if cache_key is not None:
+            if silent:
+                self.__close_tags()
+            render_cache[self._route] = (cache_key, self._rendered_jsx, self._head, module_name)  # type: ignore[index]
         # return renderer module_name from frame
         return module_name
+
+    def __close_tags(self):
+        if (
+            self._rendered_jsx
+            and isinstance(self._rendered_jsx, str)
+            and (
+                result := _DETECT_CLOSING_TAGS.sub(
+                    _SUBSTR_CLOSING_TAG,
+                    self._rendered_jsx.replace(">style</TaipyStyle>", "/>"),
+                )
+            )
+        ):
+            self._rendered_jsx = result
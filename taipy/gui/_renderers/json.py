@@ -10,11 +10,14 @@
 # specific language governing permissions and limitations under the License.
 from __future__ import annotations
 
+import json
+import re
 import typing as t
 from abc import ABC, abstractmethod
 from datetime import date, datetime, time, timedelta
 from json import JSONEncoder
 from pathlib import Path
+from uuid import uuid4
 
 import numpy
 import pandas
@@ -83,3 +86,43 @@ class _TaipyJsonEncoder(JSONEncoder):
 class _TaipyJsonProvider(DefaultJSONProvider):
     default = staticmethod(_TaipyJsonAdapter().parse)  # type: ignore
     sort_keys = False
+
+
+class _TaipyJsonFragment:
+    """A value that has already been encoded to JSON."""
+
+    __slots__ = ("json",)
+
+    def __init__(self, json: str) -> None:
+        self.json = json
+
+
+class _TaipyWsJson:
+    """JSON module used by the WebSocket transport.
+
+    Encodes Taipy specific types like _TaipyJsonProvider does, and inserts `_TaipyJsonFragment`
+    instances as they are, so that values that were encoded beforehand are not encoded again.
+    """
+
+    __FRAGMENT_PREFIX = f"__taipy_json_fragment_{uuid4().hex}_"
+    __FRAGMENT_RE = re.compile(f'"{__FRAGMENT_PREFIX}(\\d+)"')
+
+    @staticmethod
+    def dumps(obj: t.Any, **kwargs) -> str:
+        fragments: t.List[str] = []
+
+        def default(o):
+            if isinstance(o, _TaipyJsonFragment):
+                fragments.append(o.json)
+                return f"{_TaipyWsJson.__FRAGMENT_PREFIX}{len(fragments) - 1}"
+            return _TaipyJsonAdapter().parse(o)
+
+        kwargs["default"] = default
+        encoded = json.dumps(obj, **kwargs)
+        if not fragments:
+            return encoded
+        return _TaipyWsJson.__FRAGMENT_RE.sub(lambda m: fragments[int(m.group(1))], encoded)
+
+    @staticmethod
+    def loads(s: t.Union[str, bytes], **kwargs) -> t.Any:
+        return json.loads(s, **kwargs)
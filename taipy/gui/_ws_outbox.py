@@ -0,0 +1,91 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+import typing as t
+
+from ._warnings import _warn
+from .types import _WsType
+
+_Receiver = t.Union[str, t.Tuple[str, ...], None]
+
+
+class _WsOutbox:
+    """Outgoing WebSocket messages, queued per receiver.
+
+    Messages queued for the same receiver within *window* milliseconds are sent as a single
+    MULTIPLE_MESSAGE by a background task, started with the Socket.IO server so that it
+    cooperates with its asynchronous mode.
+    """
+
+    def __init__(self, socketio: t.Any, window: float) -> None:
+        self.__socketio = socketio
+        self.__window = window / 1000
+        self.__lock = threading.Lock()
+        self.__queues: t.Dict[_Receiver, t.List[dict]] = {}
+        self.__flushing = False
+
+    def _is_bound_to(self, socketio: t.Any, window: float) -> bool:
+        return self.__socketio is socketio and self.__window == window / 1000
+
+    @staticmethod
+    def __get_receiver(to: t.Union[str, t.List[str], None]) -> _Receiver:
+        return tuple(sorted(to)) if isinstance(to, (list, set, tuple)) else to
+
+    def _put(self, payload: dict, to: t.Union[str, t.List[str], None]) -> None:
+        with self.__lock:
+            self.__queues.setdefault(_WsOutbox.__get_receiver(to), []).append(payload)
+            if self.__flushing:
+                return
+            self.__flushing = True
+        self.__socketio.start_background_task(self.__run)
+
+    def _send(self, payload: dict, to: t.Union[str, t.List[str], None]) -> None:
+        """Send *payload* now, after the messages already queued for the same receiver."""
+        receiver = _WsOutbox.__get_receiver(to)
+        with self.__lock:
+            pending = self.__queues.pop(receiver, None)
+        if pending:
+            self.__emit(receiver, pending)
+        self.__emit(receiver, [payload])
+
+    def _flush(self) -> None:
+        with self.__lock:
+            queues = self.__queues
+            self.__queues = {}
+        for receiver, payloads in queues.items():
+            self.__emit(receiver, payloads)
+
+    def __run(self) -> None:
+        while True:
+            self.__socketio.sleep(self.__window)
+            self._flush()
+            with self.__lock:
+                if not self.__queues:
+                    self.__flushing = False
+                    return
+
+    def __emit(self, receiver: _Receiver, payloads: t.List[dict]) -> None:
+        if len(payloads) > 1:
+            messages: t.List[dict] = []
+            for payload in payloads:
+                # Messages grouped by the application are merged in the same list
+                if payload.get("type") == _WsType.MULTIPLE_MESSAGE.value:
+                    messages.extend(payload.get("payload", []))
+                else:
+                    messages.append(payload)
+            payload = {"type": _WsType.MULTIPLE_MESSAGE.value, "payload": messages}
+        else:
+            payload = payloads[0]
+        try:
+            self.__socketio.emit("message", payload, to=list(receiver) if isinstance(receiver, tuple) else receiver)
+        except Exception as e:  # pragma: no cover
+            _warn("Exception raised in WebSocket communication", e)
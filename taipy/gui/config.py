@@ -45,10 +45,13 @@ ConfigParameter = t.Literal[
     "flask_log",
     "host",
     "light_theme",
+    "long_callback_client_limit",
+    "long_callback_max_workers",
     "margin",
     "ngrok_token",
     "notebook_proxy",
     "notification_duration",
+    "page_render_cache",
     "port",
     "port_auto_ranges",
     "propagate",
@@ -62,12 +65,15 @@ ConfigParameter = t.Literal[
     "time_zone",
     "title",
     "state_retention_period",
+    "state_spill_folder",
+    "state_spill_period",
     "stylekit",
     "upload_folder",
     "use_arrow",
     "use_reloader",
     "watermark",
     "webapp_path",
+    "ws_batch_window",
 ]
 
 Stylekit = t.TypedDict(
@@ -120,10 +126,13 @@ Config = t.TypedDict(
         "flask_log": bool,
         "host": str,
         "light_theme": t.Optional[t.Dict[str, t.Any]],
+        "long_callback_client_limit": int,
+        "long_callback_max_workers": t.Optional[int],
         "margin": t.Optional[str],
         "ngrok_token": str,
         "notebook_proxy": bool,
         "notification_duration": int,
+        "page_render_cache": bool,
         "port": t.Union[t.Literal["auto"], int],
         "port_auto_ranges": t.List[t.Union[int, t.Tuple[int, int]]],
         "propagate": bool,
@@ -133,6 +142,8 @@ Config = t.TypedDict(
         "server_config": t.Optional[ServerConfig],
         "single_client": bool,
         "state_retention_period": int,
+        "state_spill_folder": t.Optional[str],
+        "state_spill_period": int,
         "stylekit": t.Union[bool, Stylekit],
         "system_notification": bool,
         "theme": t.Optional[t.Dict[str, t.Any]],
@@ -143,6 +154,7 @@ Config = t.TypedDict(
         "use_reloader": bool,
         "watermark": t.Optional[str],
         "webapp_path": t.Optional[str],
+        "ws_batch_window": int,
     },
     total=False,
 )
@@ -11,12 +11,20 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import sys
+import threading
+import time
 import typing as t
 from types import SimpleNamespace
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
 from .._warnings import _warn
+from ..utils._map_dict import _MapDict
+from ..utils.types import _TaipyBase
 
 if t.TYPE_CHECKING:
     from ..gui import Gui
@@ -26,7 +34,19 @@ class _DataScopes:
     _GLOBAL_ID = "global"
     _META_PRE_RENDER = "pre_render"
     _META_LOCAL_STORAGE = "local_storage"
-    _DEFAULT_METADATA = {_META_PRE_RENDER: False, _META_LOCAL_STORAGE: {}}
+    # Names of the variables that this scope does not share with the other scopes anymore
+    _META_OWNED = "owned"
+    _META_LAST_ACCESS = "last_access"
+    # { page route: (cache key, rendered jsx, head, module name) }
+    _META_PAGE_RENDERS = "page_renders"
+    _DEFAULT_METADATA = {
+        _META_PRE_RENDER: False,
+        _META_LOCAL_STORAGE: {},
+        _META_OWNED: set(),
+        _META_LAST_ACCESS: 0.0,
+        _META_PAGE_RENDERS: {},
+    }
+    __MAX_SIZE_DEPTH = 4
 
     def __init__(self, gui: "Gui") -> None:
         self.__gui = gui
@@ -36,11 +56,17 @@ class _DataScopes:
             _DataScopes._GLOBAL_ID: _DataScopes._get_new_default_metadata()
         }
         self.__single_client = True
+        # { scope_name: path of the file holding the variables spilled to disk }
+        self.__spilled: t.Dict[str, str] = {}
+        self.__spill_lock = threading.RLock()
 
     @staticmethod
     def _get_new_default_metadata() -> t.Dict[str, t.Any]:
         metadata = _DataScopes._DEFAULT_METADATA.copy()
         metadata[_DataScopes._META_LOCAL_STORAGE] = {}
+        metadata[_DataScopes._META_OWNED] = set()
+        metadata[_DataScopes._META_PAGE_RENDERS] = {}
+        metadata[_DataScopes._META_LAST_ACCESS] = time.monotonic()
         return metadata
 
     def set_single_client(self, value: bool) -> None:
@@ -62,7 +88,11 @@ class _DataScopes:
                 f"Session id {client_id} not found in data scope. Taipy will automatically create a scope for this session id but you may have to reload your page."  # noqa: E501
             )
             self.create_scope(client_id)
-        return self.__scopes[client_id], self.__scopes_metadata[client_id]
+        metadata = self.__scopes_metadata[client_id]
+        metadata[_DataScopes._META_LAST_ACCESS] = time.monotonic()
+        if client_id in self.__spilled:
+            self.__restore_scope(client_id)
+        return self.__scopes[client_id], metadata
 
     def get_all_scopes(self) -> t.Dict[str, SimpleNamespace]:
         return self.__scopes
@@ -90,3 +120,197 @@ class _DataScopes:
         if id in self.__scopes:
             del self.__scopes[id]
             del self.__scopes_metadata[id]
+        with self.__spill_lock:
+            if path := self.__spilled.pop(id, None):
+                _DataScopes.__remove_file(path)
+
+    @staticmethod
+    def __remove_file(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:  # pragma: no cover
+            pass
+
+    def spill_idle_scopes(self, folder: str, idle_period: float) -> t.List[str]:
+        """Move the variables of the scopes that were not accessed for *idle_period* seconds to disk.
+
+        Only the values that the scope does not share with other scopes are spilled, since the
+        shared ones would stay in memory anyway. Values that cannot be pickled are kept in memory.
+
+        Returns:
+            The identifiers of the scopes that were spilled.
+        """
+        if self.__single_client:
+            return []
+        spilled: t.List[str] = []
+        now = time.monotonic()
+        with self.__spill_lock:
+            references = self.__count_references()
+            for scope_id, scope in list(self.__scopes.items()):
+                if (
+                    scope_id == _DataScopes._GLOBAL_ID
+                    or scope_id in self.__spilled
+                    or now - self.__scopes_metadata[scope_id][_DataScopes._META_LAST_ACCESS] < idle_period
+                ):
+                    continue
+                values: t.Dict[str, bytes] = {}
+                for name, value in vars(scope).items():
+                    if references[id(_DataScopes.__unwrap(value))] > 1:
+                        continue
+                    try:
+                        # protocol 5 stores numpy and pandas blocks as raw buffers
+                        values[name] = pickle.dumps(value, protocol=5)
+                    except Exception:
+                        _TaipyLogger._get_logger().debug(f"Variable {name} of session {scope_id} cannot be spilled.")
+                if not values:
+                    continue
+                path = os.path.join(folder, f"{hashlib.sha1(scope_id.encode()).hexdigest()}.pkl")  # noqa: S324
+                try:
+                    os.makedirs(folder, mode=0o700, exist_ok=True)
+                    # the file is only readable by the current user
+                    with open(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb") as file:
+                        pickle.dump(values, file, protocol=5)
+                except Exception as e:  # pragma: no cover
+                    _warn(f"Cannot spill session {scope_id} to '{folder}'", e)
+                    continue
+                for name in values:
+                    delattr(scope, name)
+                self.__spilled[scope_id] = path
+                spilled.append(scope_id)
+        return spilled
+
+    def __restore_scope(self, id: str) -> None:
+        with self.__spill_lock:
+            if (path := self.__spilled.pop(id, None)) is None:
+                return
+            scope = self.__scopes[id]
+            try:
+                with open(path, "rb") as file:
+                    values: t.Dict[str, bytes] = pickle.load(file)  # noqa: S301
+                for name, value in values.items():
+                    # Variables set while the scope was spilled (broadcast) are more recent
+                    if not hasattr(scope, name):
+                        setattr(scope, name, pickle.loads(value))  # noqa: S301
+            except Exception as e:  # pragma: no cover
+                _warn(f"Cannot restore session {id} from '{path}'", e)
+            _DataScopes.__remove_file(path)
+
+    def remove_spilled_scopes(self) -> None:
+        """Delete the files of the spilled scopes, when the application stops.
+
+        The variables that were spilled are lost.
+        """
+        with self.__spill_lock:
+            for path in self.__spilled.values():
+                _DataScopes.__remove_file(path)
+            self.__spilled.clear()
+
+    def is_spilled(self, id: str) -> bool:
+        return id in self.__spilled
+
+    def copy_on_write(self, client_id: t.Optional[str], name: str) -> None:
+        """Make sure the variable targeted by *name* is owned by the scope before it is modified.
+
+        Bound variables are initialized with a reference to the default value, shared by all the
+        scopes. When a nested element of a shared dictionary is set, the dictionaries are copied
+        so that other scopes are not impacted.
+        """
+        if self.__single_client or not client_id or client_id not in self.__scopes:
+            return
+        var_name, _, path = name.partition(".")
+        owned = self.__scopes_metadata[client_id][_DataScopes._META_OWNED]
+        if var_name in owned:
+            return
+        owned.add(var_name)
+        scope = self.__scopes[client_id]
+        if path and isinstance(value := getattr(scope, var_name, None), _MapDict):
+            setattr(scope, var_name, _MapDict(_DataScopes.__copy_dicts(value._dict)))
+
+    @staticmethod
+    def __copy_dicts(value: dict) -> dict:
+        return {k: _DataScopes.__copy_dicts(v) if isinstance(v, dict) else v for k, v in value.items()}
+
+    @staticmethod
+    def __unwrap(value: t.Any) -> t.Any:
+        if isinstance(value, _MapDict):
+            return value._dict
+        if isinstance(value, _TaipyBase):
+            return _DataScopes.__unwrap(value.get())
+        return value
+
+    @staticmethod
+    def _get_size(value: t.Any, seen: t.Optional[t.Set[int]] = None, depth: int = 0) -> int:
+        """Approximate number of bytes used by *value*."""
+        if seen is None:
+            seen = set()
+        if id(value) in seen:
+            return 0
+        seen.add(id(value))
+        if callable(memory_usage := getattr(value, "memory_usage", None)):
+            # pandas
+            try:
+                usage = memory_usage(deep=True)
+                return int(usage.sum() if hasattr(usage, "sum") else usage)
+            except Exception:  # pragma: no cover
+                pass
+        if callable(estimated_size := getattr(value, "estimated_size", None)):
+            # polars
+            try:
+                return int(estimated_size())
+            except Exception:  # pragma: no cover
+                pass
+        if isinstance(nbytes := getattr(value, "nbytes", None), int):
+            # numpy, pyarrow
+            return nbytes
+        size = sys.getsizeof(value, 0)
+        if depth < _DataScopes.__MAX_SIZE_DEPTH:
+            if isinstance(value, dict):
+                size += sum(
+                    _DataScopes._get_size(k, seen, depth + 1) + _DataScopes._get_size(v, seen, depth + 1)
+                    for k, v in value.items()
+                )
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                size += sum(_DataScopes._get_size(v, seen, depth + 1) for v in value)
+        return size
+
+    def __count_references(self) -> t.Dict[int, int]:
+        references: t.Dict[int, int] = {}
+        for scope in self.__scopes.values():
+            for value in vars(scope).values():
+                value = _DataScopes.__unwrap(value)
+                references[id(value)] = references.get(id(value), 0) + 1
+        return references
+
+    def get_memory_usage(self) -> t.Dict[str, t.Any]:
+        """Report the approximate memory used by the scopes.
+
+        Values that are referenced by several scopes, directly or through the wrappers used for
+        bound variables, are reported as shared and counted once in the total size.
+        """
+        references = self.__count_references()
+        sizes: t.Dict[int, int] = {}
+        scopes: t.Dict[str, t.Dict[str, t.Any]] = {}
+        for scope_id, scope in self.__scopes.items():
+            variables: t.Dict[str, int] = {}
+            own_size = 0
+            shared_size = 0
+            for name, value in vars(scope).items():
+                value = _DataScopes.__unwrap(value)
+                size = sizes.get(id(value))
+                if size is None:
+                    size = sizes[id(value)] = _DataScopes._get_size(value)
+                variables[name] = size
+                if references[id(value)] > 1:
+                    shared_size += size
+                else:
+                    own_size += size
+            scopes[scope_id] = {"size": own_size, "shared_size": shared_size, "variables": variables}
+        return {
+            # in single client mode, the global scope is the state of the client
+            "scope_count": 1
+            if self.__single_client
+            else sum(1 for scope_id in self.__scopes if scope_id != _DataScopes._GLOBAL_ID),
+            "spilled_scope_count": len(self.__spilled),
+            "size": sum(sizes.values()),
+            "scopes": scopes,
+        }
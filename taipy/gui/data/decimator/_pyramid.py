@@ -0,0 +1,109 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from __future__ import annotations
+
+import typing as t
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_datetime64_dtype, is_numeric_dtype
+
+
+class _DecimationPyramid:
+    """Multi-resolution index over a series sorted on its x values.
+
+    Level 0 is the original data. Each next level keeps the minimum and maximum y value of every
+    bucket of `_BUCKET_SIZE` points of the previous level, so that peaks are preserved while the
+    number of points is divided by `_BUCKET_SIZE / 2`.
+    Levels are stored as arrays of row positions in the original data.
+    """
+
+    _BUCKET_SIZE = 8
+    _MIN_LEVEL_SIZE = 1024
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, is_date: bool = False) -> None:
+        self.__x = x
+        self.__is_date = is_date
+        self.__levels: t.List[np.ndarray] = []
+        positions: t.Optional[np.ndarray] = None
+        size = len(x)
+        while size > _DecimationPyramid._MIN_LEVEL_SIZE:
+            positions = _DecimationPyramid.__reduce(y, positions)
+            if len(positions) >= size * 0.9:
+                break
+            self.__levels.append(positions)
+            size = len(positions)
+
+    @property
+    def nb_levels(self) -> int:
+        return len(self.__levels) + 1
+
+    @staticmethod
+    def __reduce(y: np.ndarray, positions: t.Optional[np.ndarray]) -> np.ndarray:
+        values = y if positions is None else y[positions]
+        size = len(values)
+        bucket_size = _DecimationPyramid._BUCKET_SIZE
+        nb_buckets = size // bucket_size
+        buckets = values[: nb_buckets * bucket_size].reshape((nb_buckets, bucket_size))
+        offsets = np.arange(nb_buckets) * bucket_size
+        kept = np.unique(
+            np.concatenate(
+                (
+                    [0, size - 1],
+                    offsets + np.argmin(buckets, axis=1),
+                    offsets + np.argmax(buckets, axis=1),
+                    np.arange(nb_buckets * bucket_size, size),
+                )
+            )
+        )
+        return kept if positions is None else positions[kept]
+
+    @staticmethod
+    def _to_sortable(values: t.Union[pd.Series, pd.Index]) -> t.Optional[np.ndarray]:
+        """Return a numpy array that can be binary searched, or None if the values are not supported."""
+        if is_datetime64_dtype(values.dtype):
+            return values.to_numpy(dtype="datetime64[ns]").view("int64")
+        if is_numeric_dtype(values.dtype) and values.dtype != bool:
+            return values.to_numpy()
+        return None
+
+    def __to_bound(self, bound: t.Any) -> t.Any:
+        if bound is not None and self.__is_date:
+            # datetime x axis: plotly sends range values as strings
+            return pd.Timestamp(bound).value
+        return bound
+
+    @staticmethod
+    def _build(x_values: t.Union[pd.Series, pd.Index], y_values: pd.Series) -> t.Optional[_DecimationPyramid]:
+        x = _DecimationPyramid._to_sortable(x_values)
+        if x is None or len(x) == 0 or not is_numeric_dtype(y_values.dtype) or y_values.dtype == bool:
+            return None
+        # missing x values cannot be binary searched
+        if x_values.hasnans or np.any(x[1:] < x[:-1]):
+            return None
+        return _DecimationPyramid(x, y_values.to_numpy(), is_date=is_datetime64_dtype(x_values.dtype))
+
+    def _select(self, x0: t.Any, x1: t.Any, target: int) -> t.Tuple[t.Union[np.ndarray, slice], int]:
+        """Return the positions of the rows strictly inside ]x0, x1[ taken from the coarsest level that
+        still holds at least *target* points in that range, along with the level used."""
+        x = self.__x
+        x0 = self.__to_bound(x0)
+        x1 = self.__to_bound(x1)
+        start = 0 if x0 is None else int(np.searchsorted(x, x0, side="right"))
+        end = len(x) if x1 is None else int(np.searchsorted(x, x1, side="left"))
+        if end - start > target:
+            for level in range(len(self.__levels), 0, -1):
+                positions = self.__levels[level - 1]
+                level_start, level_end = np.searchsorted(positions, (start, end), side="left")
+                if level_end - level_start >= target:
+                    return positions[level_start:level_end], level
+        return slice(start, max(start, end)), 0
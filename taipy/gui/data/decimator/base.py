@@ -12,12 +12,14 @@
 from __future__ import annotations
 
 import typing as t
+import weakref
 from abc import ABC, abstractmethod
 
 import numpy as np
 import pandas as pd
 
 from ..._warnings import _warn
+from ._pyramid import _DecimationPyramid
 
 
 class Decimator(ABC):
@@ -33,6 +35,13 @@ class Decimator(ABC):
 
     _CHART_MODES: t.List[str] = []
 
+    # Decimators that can answer requests from a pre-computed multi-resolution pyramid
+    _USE_PYRAMID = False
+    # Minimum number of rows before a pyramid is built
+    _PYRAMID_MIN_ROWS = 100_000
+    # Number of points, relative to the requested output, to select from the pyramid before decimating
+    _PYRAMID_OVERSAMPLING = 4
+
     def __init__(
         self,
         threshold: t.Optional[int],
@@ -57,6 +66,7 @@ class Decimator(ABC):
         self._zoom = zoom if zoom is not None else True
         self.__user_defined_on_decimate = None
         self.__user_defined_apply_decimator = None
+        self.__pyramids: t.Dict[t.Tuple[int, str, str], t.Tuple[weakref.ref, int, _DecimationPyramid]] = {}
 
     def _is_applicable(self, data: t.Any, nb_rows_max: int, chart_mode: str):
         if chart_mode not in self._CHART_MODES:
@@ -124,6 +134,52 @@ class Decimator(ABC):
             df.drop(x_column, axis=1, inplace=True)
         return df, is_copied
 
+    def __is_pyramid_applicable(
+        self, dataframe: pd.DataFrame, z_column: t.Optional[str], chart_mode: str, version: t.Optional[int]
+    ) -> bool:
+        return (
+            self._USE_PYRAMID
+            # without a version of the data, a change of its values could not be detected
+            and version is not None
+            and not z_column
+            and chart_mode in ["lines+markers", "lines"]
+            and len(dataframe) >= self._PYRAMID_MIN_ROWS
+            and self.__user_defined_apply_decimator is None
+        )
+
+    def __get_pyramid(
+        self,
+        dataframe: pd.DataFrame,
+        x_column: t.Optional[str],
+        y_column: str,
+        source: t.Optional[pd.DataFrame],
+        version: int,
+    ) -> t.Optional[_DecimationPyramid]:
+        # The pyramid is attached to the data the caller holds, not to the copy it may have made of it
+        owner = dataframe if source is None else source
+        key = (id(owner), x_column or "", y_column)
+        if cached := self.__pyramids.get(key):
+            df_ref, pyramid_version, pyramid = cached
+            if df_ref() is owner and pyramid_version == version:
+                return pyramid
+            del self.__pyramids[key]
+        pyramid = _DecimationPyramid._build(dataframe[x_column] if x_column else dataframe.index, dataframe[y_column])
+        if pyramid is not None:
+            pyramids = self.__pyramids
+            self.__pyramids[key] = (weakref.ref(owner, lambda _: pyramids.pop(key, None)), version, pyramid)
+        return pyramid
+
+    def _get_pyramid_target(self, nb_rows_max: int) -> int:
+        n_out = getattr(self, "_n_out", None) or 0
+        return max(self._PYRAMID_OVERSAMPLING * max(nb_rows_max, n_out), self.threshold or 0)
+
+    @staticmethod
+    def __select_columns(dataframe: pd.DataFrame, columns: t.List[str]) -> pd.DataFrame:
+        if not dataframe.columns.is_unique:
+            return dataframe.filter(columns, axis=1)
+        # A new DataFrame that shares the column data: no values are copied
+        return pd.DataFrame({c: dataframe[c] for c in columns if c in dataframe.columns}, copy=False)
+
     def _df_apply_decimator(
         self,
         dataframe: pd.DataFrame,
@@ -148,6 +204,8 @@ class Decimator(ABC):
         decimator_payload: t.Dict[str, t.Any],
         is_copied: bool = False,
         filter_unused_columns: bool = True,
+        source: t.Optional[pd.DataFrame] = None,
+        version: t.Optional[int] = None,
     ):
         decimator_var_name = decimator_instance_payload.get("decimator")
         x_column, y_column, z_column = (
@@ -156,19 +214,39 @@ class Decimator(ABC):
             decimator_instance_payload.get("zAxis", ""),
         )
         chart_mode = decimator_instance_payload.get("chartMode", "")
-        if self._zoom and "relayoutData" in decimator_payload is not None and not z_column:
+        x0 = x1 = y0 = y1 = None
+        is_relayout = self._zoom and "relayoutData" in decimator_payload and not z_column
+        if is_relayout:
             relayout_data = decimator_payload.get("relayoutData", {})
             x0 = relayout_data.get("xaxis.range[0]")
             x1 = relayout_data.get("xaxis.range[1]")
             y0 = relayout_data.get("yaxis.range[0]")
             y1 = relayout_data.get("yaxis.range[1]")
 
+        nb_rows_max = decimator_payload.get("width")
+        is_decimator_applied = False
+        pyramid = None
+        if nb_rows_max and self.__is_pyramid_applicable(df, z_column, chart_mode, version):
+            try:
+                pyramid = self.__get_pyramid(df, x_column, y_column, source, t.cast(int, version))
+            except Exception as e:
+                _warn(f"Cannot build decimation pyramid with {decimator_var_name} for Dataframe", e)
+        if pyramid is not None:
+            # only select the rows in the zoomed range, from the coarsest sufficient level
+            positions, level = pyramid._select(x0, x1, self._get_pyramid_target(t.cast(int, nb_rows_max)))
+            df = df.iloc[positions]
+            is_copied = not isinstance(positions, slice)
+            is_decimator_applied = level > 0
+        decimator_columns = [x_column, y_column, z_column] if z_column else [x_column, y_column]
+        if filter_unused_columns:
+            # only keep the columns involving the decimator, before any row is filtered
+            df = self.__select_columns(df, decimator_columns)
+            is_copied = True
+        if pyramid is None and is_relayout:
             df, is_copied = self._df_relayout(
                 t.cast(pd.DataFrame, df), x_column, y_column, chart_mode, x0, x1, y0, y1, is_copied
             )
 
-        nb_rows_max = decimator_payload.get("width")
-        is_decimator_applied = False
         if nb_rows_max and self._is_applicable(df, nb_rows_max, chart_mode):
             try:
                 df, is_copied = self._apply_decimator(
@@ -182,10 +260,9 @@ class Decimator(ABC):
                 is_decimator_applied = True
             except Exception as e:
                 _warn(f"Limit rows error with {decimator_var_name} for Dataframe", e)
-        # only include columns involving the decimator
-        if filter_unused_columns:
-            filterd_columns = [x_column, y_column, z_column] if z_column else [x_column, y_column]
-            df = df.filter(filterd_columns, axis=1)
+        # drop the temporary columns that the decimation may have added
+        if filter_unused_columns and len(df.columns) > len(decimator_columns):
+            df = df.filter(decimator_columns, axis=1)
         return df, is_decimator_applied, is_copied
 
     def _on_decimate(
@@ -195,6 +272,8 @@ class Decimator(ABC):
         decimator_payload: t.Dict[str, t.Any],
         is_copied: bool = False,
         filter_unused_columns: bool = True,
+        source: t.Optional[pd.DataFrame] = None,
+        version: t.Optional[int] = None,
     ) -> t.Tuple:
         """NOT DOCUMENTED
         This function is executed whenever a decimator is found during runtime.
@@ -210,6 +289,10 @@ class Decimator(ABC):
             is_copied (bool): A flag to indicate if the DataFrame is copied.
             filter_unused_columns (bool): A flag to indicate if the DataFrame columns should be filtered to only
                 include the columns that are involved with the decimator.
+            source (Optional[pandas.DataFrame]): The DataFrame *df* is a shallow copy of, if any. Data computed
+                from *df* is cached for *source*.
+            version (Optional[int]): The version of the data, that changes whenever its values change. Data
+                computed from *df* is only cached when the version is known.
 
         Returns:
             A tuple containing the decimated DataFrame, a flag indicating if the decimator is applied,
@@ -222,7 +305,15 @@ class Decimator(ABC):
                 )
             except Exception as e:
                 _warn("Error executing user defined on_decimate function: ", e)
-        return self._on_decimate_df(df, decimator_instance_payload, decimator_payload, filter_unused_columns)
+        return self._on_decimate_df(
+            df,
+            decimator_instance_payload,
+            decimator_payload,
+            is_copied=is_copied,
+            filter_unused_columns=filter_unused_columns,
+            source=source,
+            version=version,
+        )
 
     def _apply_decimator(
         self,
@@ -27,6 +27,7 @@ class LTTB(Decimator):
     """
 
     _CHART_MODES = ["lines+markers", "lines", "markers"]
+    _USE_PYRAMID = True
 
     def __init__(
         self,
@@ -52,12 +53,6 @@ class LTTB(Decimator):
         super().__init__(threshold, zoom)
         self._n_out = n_out
 
-    @staticmethod
-    def _areas_of_triangles(a, bs, c):
-        bs_minus_a = bs - a
-        a_minus_bs = a - bs
-        return 0.5 * abs((a[0] - c[0]) * (bs_minus_a[:, 1]) - (a_minus_bs[:, 0]) * (c[1] - a[1]))
-
     def _decimate(self, data: np.ndarray, payload: t.Dict[str, t.Any]) -> np.ndarray:
         n_out = self._n_out
         if n_out >= data.shape[0]:
@@ -66,12 +61,26 @@ class LTTB(Decimator):
         if n_out < 3:
             raise ValueError("Can only down-sample to a minimum of 3 points")
 
-        # Split data into bins
+        # Split data into bins, following the np.array_split() layout:
+        # the first 'remainder' bins hold one more point than the others.
         n_bins = n_out - 2
-        data_bins = np.array_split(data[1:-1], n_bins)
-
-        prev_a = data[0]
-        start_pos = 0
+        bin_size, remainder = divmod(data.shape[0] - 2, n_bins)
+        bin_indexes = np.arange(n_bins + 1)
+        bounds = bin_indexes * bin_size + np.minimum(bin_indexes, remainder) + 1
+
+        # Centroids of all the bins, computed at once on the bin-reshaped data.
+        # The last point is the 'next bin' of the last bin.
+        split = bounds[remainder]
+        n_cols = data.shape[1]
+        centroids = np.concatenate(
+            (
+                data[1:split].reshape((remainder, bin_size + 1, n_cols)).mean(axis=1),
+                data[split:-1].reshape((n_bins - remainder, bin_size, n_cols)).mean(axis=1),
+                data[-1:],
+            )
+        )
+        x = data[:, 0]
+        y = data[:, 1]
 
         # Prepare output mask array
         # First and last points are the same as in the input.
@@ -83,17 +92,14 @@ class LTTB(Decimator):
         # In each bin, find the point that makes the largest triangle
         # with the point saved in the previous bin
         # and the centroid of the points in the next bin.
-        for i in range(len(data_bins)):
-            this_bin = data_bins[i]
-            next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
-            a = prev_a
-            bs = this_bin
-            c = next_bin.mean(axis=0)
-
-            areas = LTTB._areas_of_triangles(a, bs, c)
-            bs_pos = np.argmax(areas)
-            prev_a = bs[bs_pos]
-            out_mask[start_pos + bs_pos] = True
-            start_pos += len(this_bin)
+        a_x, a_y = x[0], y[0]
+        for i in range(n_bins):
+            start, end = bounds[i], bounds[i + 1]
+            c_x, c_y = centroids[i + 1, 0], centroids[i + 1, 1]
+            areas = np.abs((a_x - c_x) * (y[start:end] - a_y) - (a_x - x[start:end]) * (c_y - a_y))
+            selected = start + np.argmax(areas)
+            # The mask index is relative to the inner points (data[1:-1]), as it always has been
+            out_mask[selected - 1] = True
+            a_x, a_y = x[selected], y[selected]
 
         return out_mask
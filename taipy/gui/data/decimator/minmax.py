@@ -26,6 +26,7 @@ class MinMaxDecimator(Decimator):
     """
 
     _CHART_MODES = ["lines+markers", "lines", "markers"]
+    _USE_PYRAMID = True
 
     def __init__(
         self,
@@ -27,6 +27,7 @@ class RDP(Decimator):
     """
 
     _CHART_MODES = ["lines+markers", "lines", "markers"]
+    _USE_PYRAMID = True
 
     def __init__(
         self,
@@ -60,15 +61,45 @@ class RDP(Decimator):
         self._n_out = n_out
 
     @staticmethod
-    def __dsquared_line_points(P1, P2, points):
+    def __split_segments(
+        data: np.ndarray, starts: np.ndarray, ends: np.ndarray
+    ) -> t.Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find the farthest inner point of all the segments at once.
+
+        The squared distances to the segment lines are computed with the same operations
+        for every point, so that the results are identical to processing the segments one by one.
+
+        Returns:
+            The index of the farthest point of each segment, its squared distance (NaN if
+            any distance is NaN, like np.amax() does) and the maximum squared distance
+            ignoring NaNs.
         """
-        Calculate only squared distance, only needed for comparison
-        """
-        xdiff = P2[0] - P1[0]
-        ydiff = P2[1] - P1[1]
-        nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + P2[0] * P1[1] - P2[1] * P1[0]) ** 2
+        x = data[:, 0]
+        y = data[:, 1]
+        lengths = ends - starts - 1
+        offsets = np.cumsum(lengths) - lengths
+        segments = np.repeat(np.arange(len(starts)), lengths)
+        points = np.arange(len(segments)) + np.repeat(starts + 1 - offsets, lengths)
+        x_start, y_start, x_end, y_end = x[starts], y[starts], x[ends], y[ends]
+        xdiff = x_end - x_start
+        ydiff = y_end - y_start
+        nom = (
+            ydiff[segments] * x[points]
+            - xdiff[segments] * y[points]
+            + (x_end * y_start)[segments]
+            - (y_end * x_start)[segments]
+        ) ** 2
         denom = ydiff**2 + xdiff**2
-        return np.divide(nom, denom)
+        dsq = np.divide(nom, denom[segments])
+        max_dsq = np.maximum.reduceat(dsq, offsets)
+        # First occurrence of the maximum (or of NaN) in each segment, as np.argmax() would return
+        is_max = (dsq == max_dsq[segments]) | np.isnan(dsq)
+        first_max = np.minimum.reduceat(np.where(is_max, np.arange(len(dsq)), len(dsq)), offsets)
+        return (
+            points[first_max],
+            max_dsq,
+            np.fmax.reduceat(dsq, offsets) if np.isnan(max_dsq).any() else max_dsq,
+        )
 
     @staticmethod
     def __rdp_epsilon(data, epsilon: int):
@@ -79,35 +110,27 @@ class RDP(Decimator):
         # Assume all points are valid and falsify those which are found
         mask.fill(True)
 
-        # The stack to select start and end index
-        stack: t.List[t.Tuple[int, int]] = [(0, data.shape[0] - 1)]  # type: ignore
-
-        while stack:
-            # Pop the last item
-            (start, end) = stack.pop()
+        # All the segments of the same depth are processed at once
+        starts = np.array([0])
+        ends = np.array([data.shape[0] - 1])
 
+        while len(starts):
             # nothing to calculate if no points in between
-            if end - start <= 1:
-                continue
-            # Calculate distance to points
-            P1 = data[start]
-            P2 = data[end]
-            points = data[start + 1 : end]
-            dsq = RDP.__dsquared_line_points(P1, P2, points)
-
-            mask_eps = dsq > epsilon**2
-
-            if mask_eps.any():
-                # max point outside eps
-                # Include index that was sliced out
-                # Also include the start index to get absolute index
-                # And not relative
-                mid = np.argmax(dsq) + 1 + start
-                stack.append((start, mid))  # type: ignore
-                stack.append((mid, end))  # type: ignore
-            else:
-                # Points in between are redundant
-                mask[start + 1 : end] = False
+            to_split = ends - starts > 1
+            starts, ends = starts[to_split], ends[to_split]
+            if not len(starts):
+                break
+            mid, _, max_dsq = RDP.__split_segments(data, starts, ends)
+            outside = max_dsq > epsilon**2
+            # Points in between are redundant
+            if not outside.all():
+                redundant = np.zeros(data.shape[0] + 1, dtype=int)
+                np.add.at(redundant, starts[~outside] + 1, 1)
+                np.add.at(redundant, ends[~outside], -1)
+                mask[np.cumsum(redundant[:-1]) > 0] = False
+            # max point outside eps
+            mid = mid[outside]
+            starts, ends = np.concatenate((starts[outside], mid)), np.concatenate((mid, ends[outside]))
         return mask
 
     @staticmethod
@@ -123,17 +146,18 @@ class RDP(Decimator):
         weights[0] = float("inf")
         weights[M_len - 1] = float("inf")
 
-        stack = [(0, M_len - 1)]
-
-        while stack:
-            (start, end) = stack.pop()
-            if end - start <= 1:
-                continue
-            dsq = RDP.__dsquared_line_points(M[start], M[end], M[start + 1 : end])
-            max_dist_index = np.argmax(dsq) + start + 1
-            weights[max_dist_index] = np.amax(dsq)
-            stack.append((start, max_dist_index))
-            stack.append((max_dist_index, end))
+        # All the segments of the same depth are processed at once
+        starts = np.array([0])
+        ends = np.array([M_len - 1])
+
+        while len(starts):
+            to_split = ends - starts > 1
+            starts, ends = starts[to_split], ends[to_split]
+            if not len(starts):
+                break
+            max_dist_index, max_dsq, _ = RDP.__split_segments(M, starts, ends)
+            weights[max_dist_index] = max_dsq
+            starts, ends = np.concatenate((starts, max_dist_index)), np.concatenate((max_dist_index, ends))
         maxTolerance = np.sort(weights)[M_len - n_out]
 
         return weights >= maxTolerance
@@ -9,9 +9,12 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 import os
 import typing as t
+import weakref
 from datetime import datetime
+from functools import reduce
 from importlib import util
 from tempfile import mkstemp
 
@@ -22,7 +25,7 @@ from pandas.api.types import is_numeric_dtype
 from .._warnings import _warn
 from ..gui import Gui
 from ..types import PropertyType
-from ..utils import _RE_PD_TYPE, _get_date_col_str_name
+from ..utils import _RE_PD_TYPE, _get_date_col_str_name, _getscopeattr, _TaipyData
 from .comparison import _compare_function
 from .data_accessor import _DataAccessor
 from .data_format import _DataFormat
@@ -41,6 +44,24 @@ class _PandasDataAccessor(_DataAccessor):
     __INDEX_COL = "_tp_index"
 
     __AGGREGATE_FUNCTIONS: t.List[str] = ["count", "sum", "mean", "median", "min", "max", "std", "first", "last"]
+    # How the results of an aggregate function on consecutive row ranges are combined
+    __AGGREGATE_COMBINE: t.Dict[str, str] = {
+        "count": "sum",
+        "sum": "sum",
+        "min": "min",
+        "max": "max",
+        "first": "first",
+        "last": "last",
+    }
+
+    # Number of aggregated tables cached for a given variable
+    __AGGREGATION_CACHE_SIZE = 4
+
+    def __init__(self, gui: Gui) -> None:
+        super().__init__(gui)
+        self.__aggregations: weakref.WeakKeyDictionary[_TaipyData, t.Dict[t.Tuple, t.Dict[str, t.Any]]] = (
+            weakref.WeakKeyDictionary()
+        )
 
     @staticmethod
     def get_supported_classes() -> t.List[t.Type]:
@@ -253,34 +274,14 @@ class _PandasDataAccessor(_DataAccessor):
     def is_dataframe_supported(self, df: pd.DataFrame) -> bool:
         return not isinstance(df.columns, pd.MultiIndex)
 
-    def __get_data(  # noqa: C901
-        self,
-        var_name: str,
-        df: pd.DataFrame,
-        payload: t.Dict[str, t.Any],
-        data_format: _DataFormat,
-        col_prefix: t.Optional[str] = "",
-    ) -> t.Dict[str, t.Any]:
-        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
-        if not self.is_dataframe_supported(df):
-            ret_payload["value"] = {}
-            ret_payload["error"] = "MultiIndex columns are not supported."
-            _warn("MultiIndex columns are not supported.")
-            return ret_payload
-        columns = payload.get("columns", [])
-        if col_prefix:
-            columns = [c[len(col_prefix) :] if c.startswith(col_prefix) else c for c in columns]
-        paged = not payload.get("alldata", False)
+    def __prepare_rows(
+        self, var_name: str, df: pd.DataFrame, columns: t.List[str], payload: t.Dict[str, t.Any], paged: bool
+    ) -> t.Tuple[pd.DataFrame, t.List[str], int, bool]:
         is_copied = False
-
-        orig_df = df
         # add index if not chart
-        if paged:
-            if _PandasDataAccessor.__INDEX_COL not in df.columns:
-                is_copied = True
-                df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index.to_numpy()})
-            if columns and _PandasDataAccessor.__INDEX_COL not in columns:
-                columns.append(_PandasDataAccessor.__INDEX_COL)
+        if paged and _PandasDataAccessor.__INDEX_COL not in df.columns:
+            is_copied = True
+            df = df.assign(**{_PandasDataAccessor.__INDEX_COL: df.index.to_numpy()})
         # optional columns
         df, optional_columns = self.add_optional_columns(df, columns)
         is_copied = is_copied or bool(optional_columns)
@@ -329,30 +330,205 @@ class _PandasDataAccessor(_DataAccessor):
                     is_copied = True
             except Exception as e:
                 _warn(f"Dataframe filtering: invalid query '{query}' on {df.head()}", e)
+        return df, optional_columns, fullrowcount, is_copied
+
+    def __aggregate(
+        self, var_name: str, df: pd.DataFrame, aggregates: t.List[str], applies: t.Dict[str, t.Any]
+    ) -> t.Tuple[pd.DataFrame, t.Optional[t.Dict[str, t.Any]]]:
+        applies_with_fn = {
+            self.__get_column_names(df, k): v
+            if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS
+            else self._gui._get_user_function(v)
+            for k, v in applies.items()
+        }
+
+        for col in df.columns:
+            if col not in applies_with_fn:
+                applies_with_fn[col] = "first"
+        try:
+            col_names = self.__get_column_names(df, *aggregates)
+            if col_names:
+                return t.cast(pd.DataFrame, df).groupby(aggregates).agg(applies_with_fn), applies_with_fn
+        except Exception:
+            pass
+        _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
+        return df, None
+
+    @staticmethod
+    def __get_aggregation_key(columns: t.List[str], payload: t.Dict[str, t.Any]) -> t.Optional[t.Tuple]:
+        try:
+            return (
+                tuple(columns),
+                json.dumps(
+                    [payload.get("aggregates"), payload.get("applies"), payload.get("filters")],
+                    sort_keys=True,
+                    default=str,
+                ),
+            )
+        except Exception:
+            return None
+
+    @staticmethod
+    def __hash_rows(df: pd.DataFrame, offset: int = 0) -> int:
+        # Position weighted sum of the row hashes: the hash of appended rows can be added to the hash of the
+        # previous rows, and moved rows change the result
+        hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+        weights = np.arange(offset + 1, offset + len(hashes) + 1, dtype=np.uint64)
+        return int((hashes * weights).sum(dtype=np.uint64))
+
+    def __get_holder(self, var_name: str, value: t.Any) -> t.Optional[_TaipyData]:
+        try:
+            holder = _getscopeattr(self._gui, var_name, None)
+        except Exception:
+            return None
+        return holder if isinstance(holder, _TaipyData) and holder.get() is value else None
+
+    def __cache_aggregation(
+        self,
+        holder: _TaipyData,
+        orig_df: pd.DataFrame,
+        columns: t.List[str],
+        payload: t.Dict[str, t.Any],
+        df: pd.DataFrame,
+        optional_columns: t.List[str],
+        fullrowcount: int,
+        applies_with_fn: t.Dict[str, t.Any],
+    ):
+        key = _PandasDataAccessor.__get_aggregation_key(columns, payload)
+        if key is None:
+            return
+        # Aggregated tables can be updated when rows are appended if all the aggregate functions can be combined
+        combine: t.Optional[t.Dict[t.Hashable, str]] = {
+            col: _PandasDataAccessor.__AGGREGATE_COMBINE.get(fn, "") if isinstance(fn, str) else ""
+            for col, fn in applies_with_fn.items()
+            if col in df.columns
+        }
+        rows_hash = 0
+        if combine and all(combine.values()):
+            try:
+                rows_hash = _PandasDataAccessor.__hash_rows(orig_df)
+            except Exception:
+                combine = None
+        else:
+            combine = None
+        entries = self.__aggregations.setdefault(holder, {})
+        entries[key] = {
+            "version": holder._version,
+            "df": df,
+            "optional_columns": optional_columns,
+            "fullrowcount": fullrowcount,
+            "nb_rows": len(orig_df),
+            "hash": rows_hash,
+            "combine": combine,
+        }
+        while len(entries) > _PandasDataAccessor.__AGGREGATION_CACHE_SIZE:
+            entries.pop(next(iter(entries)), None)
+
+    def __get_cached_aggregation(
+        self,
+        holder: _TaipyData,
+        var_name: str,
+        orig_df: pd.DataFrame,
+        columns: t.List[str],
+        payload: t.Dict[str, t.Any],
+    ) -> t.Optional[t.Tuple[pd.DataFrame, t.List[str], int]]:
+        key = _PandasDataAccessor.__get_aggregation_key(columns, payload)
+        entries = self.__aggregations.get(holder)
+        entry = entries.pop(key, None) if entries is not None and key is not None else None
+        if entry is None:
+            return None
+        if entry["version"] != holder._version and not self.__update_aggregation(
+            var_name, orig_df, columns, payload, entry
+        ):
+            return None
+        entry["version"] = holder._version
+        # Keep the most recently used entries last
+        t.cast(dict, entries)[key] = entry
+        return entry["df"], entry["optional_columns"], entry["fullrowcount"]
+
+    def __update_aggregation(
+        self,
+        var_name: str,
+        orig_df: pd.DataFrame,
+        columns: t.List[str],
+        payload: t.Dict[str, t.Any],
+        entry: t.Dict[str, t.Any],
+    ) -> bool:
+        """Aggregate the rows that were appended since the entry was computed, and merge them into the entry."""
+        nb_rows = entry["nb_rows"]
+        combine = entry["combine"]
+        if combine is None or len(orig_df) <= nb_rows:
+            return False
+        try:
+            if entry["hash"] != _PandasDataAccessor.__hash_rows(orig_df.iloc[:nb_rows]):
+                return False
+            tail = orig_df.iloc[nb_rows:]
+            tail_hash = _PandasDataAccessor.__hash_rows(tail, nb_rows)
+        except Exception:
+            return False
+        tail, _, tail_rowcount, _ = self.__prepare_rows(var_name, tail, columns, payload, True)
+        tail, applies_with_fn = self.__aggregate(
+            var_name, tail, t.cast(list, payload.get("aggregates")), t.cast(dict, payload.get("applies"))
+        )
+        if applies_with_fn is None:
+            return False
+        df = entry["df"]
+        if len(tail):
+            try:
+                df = pd.concat([df, tail]).groupby(level=list(range(df.index.nlevels))).agg(combine)
+            except Exception:
+                return False
+        entry["df"] = df
+        entry["fullrowcount"] += tail_rowcount
+        entry["nb_rows"] = len(orig_df)
+        entry["hash"] = (entry["hash"] + tail_hash) % (1 << 64)
+        return True
+
+    def __get_data(  # noqa: C901
+        self,
+        var_name: str,
+        df: pd.DataFrame,
+        payload: t.Dict[str, t.Any],
+        data_format: _DataFormat,
+        col_prefix: t.Optional[str] = "",
+        holder: t.Optional[_TaipyData] = None,
+    ) -> t.Dict[str, t.Any]:
+        ret_payload = {"pagekey": payload.get("pagekey", "unknown page")}
+        if not self.is_dataframe_supported(df):
+            ret_payload["value"] = {}
+            ret_payload["error"] = "MultiIndex columns are not supported."
+            _warn("MultiIndex columns are not supported.")
+            return ret_payload
+        columns = payload.get("columns", [])
+        if col_prefix:
+            columns = [c[len(col_prefix) :] if c.startswith(col_prefix) else c for c in columns]
+        paged = not payload.get("alldata", False)
+
+        orig_df = df
+        if paged and columns and _PandasDataAccessor.__INDEX_COL not in columns:
+            columns.append(_PandasDataAccessor.__INDEX_COL)
+        aggregates = payload.get("aggregates")
+        applies = payload.get("applies")
+        is_aggregated = paged and isinstance(aggregates, list) and len(aggregates) > 0 and isinstance(applies, dict)
+        aggregation = (
+            self.__get_cached_aggregation(holder, var_name, orig_df, columns, payload)
+            if is_aggregated and holder is not None
+            else None
+        )
+        if aggregation is not None:
+            df, optional_columns, fullrowcount = aggregation
+            is_copied = True
+        else:
+            df, optional_columns, fullrowcount, is_copied = self.__prepare_rows(var_name, df, columns, payload, paged)
+            if is_aggregated:
+                df, applies_with_fn = self.__aggregate(var_name, df, t.cast(list, aggregates), t.cast(dict, applies))
+                if holder is not None and applies_with_fn is not None:
+                    self.__cache_aggregation(
+                        holder, orig_df, columns, payload, df, optional_columns, fullrowcount, applies_with_fn
+                    )
 
         dict_ret: t.Optional[t.Dict[str, t.Any]]
         if paged:
-            aggregates = payload.get("aggregates")
-            applies = payload.get("applies")
-            if isinstance(aggregates, list) and len(aggregates) and isinstance(applies, dict):
-                applies_with_fn = {
-                    self.__get_column_names(df, k): v
-                    if v in _PandasDataAccessor.__AGGREGATE_FUNCTIONS
-                    else self._gui._get_user_function(v)
-                    for k, v in applies.items()
-                }
-
-                for col in df.columns:
-                    if col not in applies_with_fn:
-                        applies_with_fn[col] = "first"
-                try:
-                    col_names = self.__get_column_names(df, *aggregates)
-                    if col_names:
-                        df = t.cast(pd.DataFrame, df).groupby(aggregates).agg(applies_with_fn)
-                    else:
-                        raise Exception()
-                except Exception:
-                    _warn(f"Cannot aggregate {var_name} with groupby {aggregates} and aggregates {applies}.")
             inf = payload.get("infinite")
             if inf is not None:
                 ret_payload["infinite"] = inf
@@ -446,54 +622,65 @@ class _PandasDataAccessor(_DataAccessor):
             ret_payload["alldata"] = True
             decimator_payload: t.Dict[str, t.Any] = payload.get("decimatorPayload", {})
             decimators = decimator_payload.get("decimators", [])
-            decimated_dfs: t.List[pd.DataFrame] = []
+            # Rows (positions) to keep for each column used by a trace (None: all rows)
+            trace_columns: t.Dict[t.Any, t.Optional[np.ndarray]] = {}
+            source_df: t.Optional[pd.DataFrame] = None
+            if decimators and not df.index.is_unique:
+                # decimated rows are found back from their index
+                source_df = df
+                df = df.copy(deep=False)
+                df.index = pd.RangeIndex(len(df))
             for decimator_pl in decimators:
                 if decimator_pl is None:
                     continue
+                x_column = decimator_pl.get("xAxis", "")
+                y_column = decimator_pl.get("yAxis", "")
+                z_column = decimator_pl.get("zAxis", "")
+                rows: t.Optional[np.ndarray] = None
                 decimator = decimator_pl.get("decimator")
-                if decimator is None:
-                    x_column = decimator_pl.get("xAxis", "")
-                    y_column = decimator_pl.get("yAxis", "")
-                    z_column = decimator_pl.get("zAxis", "")
-                    filtered_columns = [x_column, y_column, z_column] if z_column else [x_column, y_column]
-                    decimated_df = df.copy().filter(filtered_columns, axis=1)
-                    decimated_dfs.append(decimated_df)
-                    continue
-                decimator_instance = (
-                    self._gui._get_user_instance(decimator, PropertyType.decimator.value)
-                    if decimator is not None
-                    else None
-                )
-                if isinstance(decimator_instance, PropertyType.decimator.value):
+                if decimator is not None:
+                    decimator_instance = self._gui._get_user_instance(decimator, PropertyType.decimator.value)
+                    if not isinstance(decimator_instance, PropertyType.decimator.value):
+                        continue
                     # Run the on_decimate method -> check if the decimator should be applied
                     # -> apply the decimator
-                    decimated_df, is_decimator_applied, is_copied = decimator_instance._on_decimate(
-                        df, decimator_pl, decimator_payload, is_copied
+                    decimated_df, is_decimator_applied, _ = decimator_instance._on_decimate(
+                        df,
+                        decimator_pl,
+                        decimator_payload,
+                        source=source_df,
+                        version=holder._version if holder is not None else None,
                     )
-                    # add decimated dataframe to the list of decimated
-                    decimated_dfs.append(decimated_df)
+                    rows = df.index.get_indexer(decimated_df.index)
                     if is_decimator_applied:
                         self._gui._call_on_change(f"{var_name}.{decimator}.nb_rows", len(decimated_df))
-            # merge the decimated dataFrames
-            if len(decimated_dfs) > 1:
-                # get the unique columns from all decimated dataFrames
-                decimated_columns = pd.Index([])
-                for _df in decimated_dfs:
-                    decimated_columns = decimated_columns.append(_df.columns)
-                # find the columns that are duplicated across dataFrames
-                overlapping_columns = decimated_columns[decimated_columns.duplicated()].unique()
-                # concatenate the dataFrames without overwriting columns
-                merged_df = pd.concat(decimated_dfs, axis=1)
-                # resolve overlapping columns by combining values
-                for col in overlapping_columns:
-                    # for each overlapping column, combine the values across dataFrames
-                    # (e.g., take the first non-null value)
-                    cols_to_combine = merged_df.loc[:, col].columns
-                    merged_df[col] = merged_df[cols_to_combine].bfill(axis=1).iloc[:, 0]
-                # drop duplicated col since they are now the same
-                df = merged_df.loc[:, ~merged_df.columns.duplicated()]
-            elif len(decimated_dfs) == 1:
-                df = decimated_dfs[0]
+                for col in [x_column, y_column, z_column] if z_column else [x_column, y_column]:
+                    if col in df.columns:
+                        if col not in trace_columns:
+                            trace_columns[col] = rows
+                        else:
+                            col_rows = trace_columns[col]
+                            trace_columns[col] = (
+                                None if rows is None or col_rows is None else np.union1d(col_rows, rows)
+                            )
+            if trace_columns:
+                # union of the rows of all the traces
+                all_rows = (
+                    None
+                    if any(r is None for r in trace_columns.values())
+                    else reduce(np.union1d, t.cast(t.List[np.ndarray], trace_columns.values()))
+                )
+                columns_data = {}
+                for col, col_rows in trace_columns.items():
+                    col_data = df[col] if all_rows is None else df[col].iloc[all_rows]
+                    if col_rows is not None and len(col_rows) < len(col_data):
+                        # this column has no values for the rows that only other traces use
+                        col_data = col_data.where(
+                            np.isin(np.arange(len(df)) if all_rows is None else all_rows, col_rows)
+                        )
+                    columns_data[col] = col_data
+                df = pd.DataFrame(columns_data, copy=False)
+                is_copied = all_rows is not None
             if data_format is _DataFormat.CSV:
                 df = self.__build_transferred_cols(
                     columns,
@@ -543,7 +730,9 @@ class _PandasDataAccessor(_DataAccessor):
                 return ret_payload
             else:
                 value = value[0]
-        return self.__get_data(var_name, self._to_dataframe(value), payload, data_format)
+        return self.__get_data(
+            var_name, self._to_dataframe(value), payload, data_format, holder=self.__get_holder(var_name, value)
+        )
 
     def _get_index_value(self, index: t.Any) -> t.Any:
         return tuple(index) if isinstance(index, list) else index
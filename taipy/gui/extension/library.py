@@ -449,6 +449,7 @@ class ElementLibrary(ABC):
 class _ElementWithInnerProps(Element):
     __RE_PROP_VAR = re.compile(r"<tp:prop:(\w+)>")
     __RE_UNIQUE_VAR = re.compile(r"<tp:uniq:(\w+)>")
+    __RE_NUMBER = re.compile(r"[+-]?\d+(\.\d*)?")
 
     def __init__(
         self,
@@ -491,6 +492,12 @@ class _ElementWithInnerProps(Element):
                     # handling property replacement in inner properties <tp:prop:...>
                     while m := _ElementWithInnerProps.__RE_PROP_VAR.search(val):
                         var = attributes.get(m.group(1))
+                        if isinstance(var, (int, float)) or (
+                            isinstance(var, str) and _ElementWithInnerProps.__RE_NUMBER.fullmatch(var.strip())
+                        ):
+                            # literal numbers are inserted as is
+                            val = val[: m.start()] + str(var).strip() + val[m.end() :]
+                            continue
                         hash_value = None if var is None else gui._evaluate_expr(var)
                         if hash_value:
                             names = gui._get_real_var_name(hash_value)
@@ -11,12 +11,14 @@
 
 from __future__ import annotations
 
+import atexit
 import contextlib
 import importlib
 import json
 import math
 import os
 import re
+import shutil
 import sys
 import tempfile
 import time
@@ -58,9 +60,10 @@ from ._page import _Page
 from ._renderers import _EmptyPage
 from ._renderers._markdown import _TaipyMarkdownExtension
 from ._renderers.factory import _Factory
-from ._renderers.json import _TaipyJsonEncoder
+from ._renderers.json import _TaipyJsonEncoder, _TaipyJsonFragment
 from ._renderers.utils import _get_columns_dict
 from ._warnings import TaipyGuiWarning, _warn
+from ._ws_outbox import _WsOutbox
 from .builder import _ElementApiGenerator
 from .config import Config, ConfigParameter, _Config
 from .custom import Page as CustomPage
@@ -112,6 +115,7 @@ from .utils import (
 from .utils._adapter import _Adapter
 from .utils._bindings import _Bindings
 from .utils._evaluator import _Evaluator
+from .utils._long_callback_executor import _LongCallbackExecutor
 from .utils._variable_directory import _is_moduled_variable, _VariableDirectory
 from .utils.chart_config_builder import _build_chart_config
 from .utils.table_col_builder import _enhance_columns
@@ -373,6 +377,17 @@ class Gui:
 
         # sid from client_id
         self.__client_id_2_sid: t.Dict[str, t.Set[str]] = {}
+        self.__ws_outbox: t.Optional[_WsOutbox] = None
+        self.__state_spill_timer: t.Optional[Timer] = None
+        # Folder where idle states are spilled when the state_spill_folder configuration setting is not set
+        self.__private_state_spill_folder: t.Optional[str] = None
+        self.__is_state_spill_cleanup_registered = False
+        self.__long_callback_executor: t.Optional[_LongCallbackExecutor] = None
+        # Incremented each time the application is run, invalidates the page render caches
+        self.__render_version = 0
+        # Duration in seconds of the phases of the last call to run()
+        self.__startup_timings: t.Dict[str, float] = {}
+        self.__startup_phase_start = 0.0
 
         # Load default config
         self._flask_blueprint: t.List[Blueprint] = []
@@ -696,6 +711,57 @@ class Gui:
             except Exception as e:
                 _warn(f"Unexpected error removing state {client_id}", e)
 
+    def _get_long_callback_executor(self) -> _LongCallbackExecutor:
+        max_workers = self._get_config("long_callback_max_workers", None)
+        client_limit = self._get_config("long_callback_client_limit", 0) or 0
+        if self.__long_callback_executor is None or not self.__long_callback_executor._is_configured(
+            max_workers, client_limit
+        ):
+            if self.__long_callback_executor is not None:
+                # the running callbacks finish in the threads of the previous executor
+                self.__long_callback_executor._shutdown(wait=False)
+            self.__long_callback_executor = _LongCallbackExecutor(max_workers, client_limit)
+        return self.__long_callback_executor
+
+    def __schedule_state_spill(self):
+        if self.__state_spill_timer is not None or self._bindings()._is_single_client():
+            return
+        if (period := self._get_config("state_spill_period", 0)) > 0:
+            self.__state_spill_timer = Timer(period, self.__spill_idle_states)
+            self.__state_spill_timer.daemon = True
+            self.__state_spill_timer.start()
+
+    def __spill_idle_states(self):
+        self.__state_spill_timer = None
+        if not self.__is_state_spill_cleanup_registered:
+            atexit.register(self.__remove_spilled_states)
+            self.__is_state_spill_cleanup_registered = True
+        try:
+            self._bindings()._spill_idle_scopes(
+                self.__get_state_spill_folder(), self._get_config("state_spill_period", 0)
+            )
+        except Exception as e:  # pragma: no cover
+            _warn("Unexpected error spilling idle states", e)
+        self.__schedule_state_spill()
+
+    def __get_state_spill_folder(self) -> str:
+        if folder := self._get_config("state_spill_folder", None):
+            return folder
+        if self.__private_state_spill_folder is None:
+            # Spilled states are unpickled when they are restored: the folder must only be accessible
+            # to the current user (mkdtemp creates it with mode 0700)
+            self.__private_state_spill_folder = tempfile.mkdtemp(prefix="taipy_states_")
+        return self.__private_state_spill_folder
+
+    def __remove_spilled_states(self):
+        if self.__state_spill_timer is not None:
+            self.__state_spill_timer.cancel()
+            self.__state_spill_timer = None
+        self._bindings()._remove_spilled_scopes()
+        if self.__private_state_spill_folder is not None:
+            shutil.rmtree(self.__private_state_spill_folder, ignore_errors=True)
+            self.__private_state_spill_folder = None
+
     def _manage_message(self, msg_type: _WsType, message: dict) -> None:
         try:
             client_id = None
@@ -813,12 +879,18 @@ class Gui:
         # set to broadcast mode if hash_expr is in shared_variable
         if hash_expr in self._get_shared_variables():
             self._set_broadcast()
+        # Shared variables are broadcast right away
+        is_batched = self.__is_holding_var_updates() and not self._is_broadcasting()
         # Use custom attrsetter function to allow value binding for _MapDict
         if propagate:
             _setscopeattr_drill(self, hash_expr, value)
             # In case expression == hash (which is when there is only a single variable in expression)
             if var_name == hash_expr or hash_expr.startswith("tpec_"):
-                derived_vars.update(self._re_evaluate_expr(var_name))
+                if is_batched:
+                    # dependent expressions are re-evaluated once, when the batch is released
+                    g.batch_pending_vars[var_name] = None
+                else:
+                    derived_vars.update(self._re_evaluate_expr(var_name))
         elif holder:
             derived_vars.update(self._evaluate_holders(hash_expr))
         if forward:
@@ -836,7 +908,76 @@ class Gui:
                 )
             derived_modified = self.__clean_vars_on_exit()
             if derived_modified is not None:
-                self.__send_var_list_update(list(derived_modified), var_name)
+                if is_batched:
+                    g.batch_modified_vars.update(derived_modified)
+                    g.batch_front_var = var_name
+                else:
+                    self.__send_var_list_update(list(derived_modified), var_name)
+
+    def __hold_var_updates(self):
+        """Defer the re-evaluation of expressions and the update messages until the matching release.
+
+        Batches can be nested: only the outermost release processes the variables updated in the batch.
+        """
+        if not has_app_context():
+            return
+        batch_depth = getattr(g, "batch_depth", 0)
+        if batch_depth == 0:
+            g.batch_pending_vars = {}
+            g.batch_modified_vars = set()
+            g.batch_front_var = None
+        g.batch_depth = batch_depth + 1
+
+    def __is_holding_var_updates(self) -> bool:
+        return has_app_context() and getattr(g, "batch_depth", 0) > 0
+
+    def __release_var_updates(self, send: bool = True) -> t.Set[str]:
+        """Process the variables updated in the batch when the outermost batch is released.
+
+        If *send* is False, the names of the modified variables are returned instead of being sent.
+        """
+        if not self.__is_holding_var_updates():
+            return set()
+        g.batch_depth -= 1
+        if g.batch_depth > 0:
+            return set()
+        modified_vars, front_var = self.__process_var_updates()
+        for name in ["batch_pending_vars", "batch_modified_vars", "batch_front_var", "batch_depth"]:
+            g.pop(name)
+        if not send or not modified_vars:
+            return modified_vars
+        if (derived_vars := getattr(g, "derived_vars", None)) is not None:
+            # the batch happened in the on_change callback of a variable update: it will send all the updates
+            derived_vars.update(modified_vars)
+        else:
+            self.__send_var_list_update(list(modified_vars), front_var)
+        return set()
+
+    def __process_var_updates(self) -> t.Tuple[t.Set[str], t.Optional[str]]:
+        """Re-evaluate the expressions depending on the variables updated in the batch, and empty the batch.
+
+        Returns the names of all the modified variables, and the name of the last variable updated in the batch,
+        used to locate the content of the modified content variables.
+        """
+        pending_vars: t.Dict[str, None] = g.batch_pending_vars
+        modified_vars: t.Set[str] = g.batch_modified_vars
+        front_var: t.Optional[str] = g.batch_front_var
+        g.batch_pending_vars = {}
+        g.batch_modified_vars = set()
+        g.batch_front_var = None
+        # every expression depending on the updated variables is evaluated once
+        if pending_vars:
+            modified_vars.update(self.__evaluator.re_evaluate_exprs(self, pending_vars))
+        return modified_vars, front_var
+
+    def __flush_var_updates(self):
+        """Send the variable updates of the current batch, which stays open."""
+        # In the on_change callback of a variable update, the update sends the changes after the callback
+        if not self.__is_holding_var_updates() or getattr(g, "derived_vars", None) is not None:
+            return
+        modified_vars, front_var = self.__process_var_updates()
+        if modified_vars:
+            self.__send_var_list_update(list(modified_vars), front_var)
 
     def _get_real_var_name(self, var_name: str) -> t.Tuple[str, str]:
         if not var_name:
@@ -1114,16 +1255,30 @@ class Gui:
                     setattr(self._bindings(), var_name, newvalue)
         return ("", 200)
 
-    def __send_var_list_update(  # noqa C901
+    def __send_var_list_update(
         self,
         modified_vars: t.List[str],
         front_var: t.Optional[str] = None,
     ):
-        ws_dict = {}
+        ws_dict = self.__get_ws_update_dict(modified_vars, front_var)
+        if ws_dict is not None:
+            # TODO: What if value == newvalue?
+            self.__send_ws_update_with_dict(ws_dict)
+
+    def __get_ws_update_dict(  # noqa C901
+        self,
+        modified_vars: t.List[str],
+        front_var: t.Optional[str] = None,
+    ) -> t.Optional[t.Dict[str, t.Any]]:
+        """Return the values to send to the front-end for the variables in *modified_vars*, encoded to JSON.
+
+        Returns None if none of these variables can be sent.
+        """
+        ws_dict: t.Dict[str, t.Any] = {}
         is_custom_page = is_in_custom_page_context()
         values = {v: _getscopeattr_drill(self, v) for v in modified_vars if is_custom_page or _is_moduled_variable(v)}
         if not values:
-            return
+            return None
         for k, v in values.items():
             if isinstance(v, (_TaipyData, _TaipyContentHtml)) and v.get_name() in modified_vars:
                 modified_vars.remove(v.get_name())
@@ -1161,10 +1316,15 @@ class Gui:
                     # do not let NaN go through json, it is not handle well (dies silently through websocket)
                     newvalue = None
                 if newvalue is not None and not isinstance(newvalue, str):
+                    # Encode the value once here: non-serializable values are detected and the WebSocket
+                    # transport inserts the encoded value as is in the message
+                    ws_value = newvalue if isinstance(newvalue, dict) and "value" in newvalue else {"value": newvalue}
                     debug_warnings: t.List[warnings.WarningMessage] = []
                     with warnings.catch_warnings(record=True) as warns:
                         warnings.resetwarnings()
-                        json.dumps(newvalue, cls=_TaipyJsonEncoder)
+                        newvalue = _TaipyJsonFragment(
+                            json.dumps(ws_value, cls=_TaipyJsonEncoder, separators=(",", ":"))
+                        )
                         if len(warns):
                             keep_value = True
                             for w in warns:
@@ -1179,8 +1339,7 @@ class Gui:
                     for w in debug_warnings:
                         warnings.warn(w.message, w.category)  # noqa: B028
             ws_dict[_var] = newvalue
-        # TODO: What if value == newvalue?
-        self.__send_ws_update_with_dict(ws_dict)
+        return ws_dict
 
     def __update_state_context(self, payload: dict):
         # apply state context if any
@@ -1403,15 +1562,13 @@ class Gui:
         return ls_items
 
     def __send_ws(self, payload: dict, allow_grouping=True, send_back_only=False) -> None:
+        if payload.get("type") != _WsType.MULTIPLE_UPDATE.value:
+            # the client must receive the variable updates that were made before this message first
+            self.__flush_var_updates()
         grouping_message = self.__get_message_grouping() if allow_grouping else None
         if grouping_message is None:
             try:
-                self._server._ws.emit(
-                    "message",
-                    payload,
-                    to=t.cast(str, self.__get_ws_receiver(send_back_only)),
-                )
-                time.sleep(0.001)
+                self.__emit_ws(payload, self.__get_ws_receiver(send_back_only), allow_grouping)
             except Exception as e:  # pragma: no cover
                 _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
         else:
@@ -1420,23 +1577,36 @@ class Gui:
     def __broadcast_ws(self, payload: dict, client_id: t.Optional[str] = None):
         try:
             to = list(self.__get_sids(client_id)) if client_id else []
-            self._server._ws.emit("message", payload, to=t.cast(str, to) if to else None, include_self=True)
-            time.sleep(0.001)
+            self.__emit_ws(payload, to or None)
         except Exception as e:  # pragma: no cover
             _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
 
     def __send_ack(self, ack_id: t.Optional[str]) -> None:
         if ack_id:
             try:
-                self._server._ws.emit(
-                    "message",
-                    {"type": _WsType.ACKNOWLEDGEMENT.value, "id": ack_id},
-                    to=t.cast(str, self.__get_ws_receiver(True)),
-                )
-                time.sleep(0.001)
+                self.__emit_ws({"type": _WsType.ACKNOWLEDGEMENT.value, "id": ack_id}, self.__get_ws_receiver(True))
             except Exception as e:  # pragma: no cover
                 _warn(f"Exception raised in WebSocket communication (send ack) in '{self.__frame.f_code.co_name}'", e)
 
+    def __get_ws_outbox(self) -> t.Optional[_WsOutbox]:
+        window = self._get_config("ws_batch_window", 0)
+        if not window or window <= 0:
+            return None
+        if self.__ws_outbox is None or not self.__ws_outbox._is_bound_to(self._server._ws, window):
+            if self.__ws_outbox is not None:
+                self.__ws_outbox._flush()
+            self.__ws_outbox = _WsOutbox(self._server._ws, window)
+        return self.__ws_outbox
+
+    def __emit_ws(self, payload: dict, to: t.Union[str, t.List[str], None], batch=True) -> None:
+        if outbox := self.__get_ws_outbox():
+            if batch:
+                outbox._put(payload, to)
+            else:
+                outbox._send(payload, to)
+        else:
+            self._server._ws.emit("message", payload, to=t.cast(str, to), include_self=True)
+
     def _send_ws_id(self, id: str) -> None:
         self.__send_ws(
             {
@@ -1505,16 +1675,35 @@ class Gui:
         self.__send_ws({"type": _WsType.NAVIGATE.value, "to": to, "params": params, "tab": tab, "force": force})
 
     def __send_ws_update_with_dict(self, modified_values: dict) -> None:
-        payload = [
-            {"name": _get_client_var_name(k), "payload": v if isinstance(v, dict) and "value" in v else {"value": v}}
-            for k, v in modified_values.items()
-        ]
+        payload = self.__get_ws_update_payload(modified_values)
         if self._is_broadcasting():
             self.__broadcast_ws({"type": _WsType.MULTIPLE_UPDATE.value, "payload": payload})
             self._set_broadcast(False)
         else:
             self.__send_ws({"type": _WsType.MULTIPLE_UPDATE.value, "payload": payload})
 
+    def __get_ws_update_payload(self, modified_values: dict) -> t.List[t.Dict[str, t.Any]]:
+        return [
+            {
+                "name": _get_client_var_name(k),
+                "payload": v
+                if isinstance(v, _TaipyJsonFragment) or (isinstance(v, dict) and "value" in v)
+                else {"value": v},
+            }
+            for k, v in modified_values.items()
+        ]
+
+    def __fan_out_ws_update(self, modified_values: dict, client_ids: t.List[str]):
+        payload = {"type": _WsType.MULTIPLE_UPDATE.value, "payload": self.__get_ws_update_payload(modified_values)}
+        # Every sid is a Socket.IO room: the message is encoded once for all of them
+        sids = [sid for client_id in client_ids for sid in self.__get_sids(client_id)]
+        if not sids:
+            return
+        try:
+            self.__emit_ws(payload, sids)
+        except Exception as e:  # pragma: no cover
+            _warn(f"Exception raised in WebSocket communication in '{self.__frame.f_code.co_name}'", e)
+
     def __send_ws_broadcast(
         self,
         var_name: str,
@@ -1554,10 +1743,12 @@ class Gui:
 
     def __enter__(self):
         self.__hold_messages()
+        self.__hold_var_updates()
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
         try:
+            self.__release_var_updates()
             self.__send_messages()
         except Exception as e:  # pragma: no cover
             _warn("Exception raised while sending messages", e)
@@ -1674,8 +1865,11 @@ class Gui:
         with self.__event_manager:
             if iscoroutinefunction(user_function):
                 return _invoke_async_callback(user_function, cp_args)
-            else:
+            self.__hold_var_updates()
+            try:
                 return user_function(*cp_args)
+            finally:
+                self.__release_var_updates()
 
     def _set_module_context(self, module_context: t.Optional[str]) -> t.ContextManager[None]:
         return self._set_locals_context(module_context) if module_context is not None else contextlib.nullcontext()
@@ -1762,13 +1956,7 @@ class Gui:
             var_name: The name of the variable to change.
             value: The new value for the variable.
         """
-        self.broadcast_callback(lambda s, n, v: s.assign(n, v), [var_name, value])
-
-    @staticmethod
-    def __broadcast_changes_fn(state: State, values: dict[str, t.Any]) -> None:
-        with state:
-            for n, v in values.items():
-                state.assign(n, v)
+        self.__fan_out_changes({var_name: value})
 
     def broadcast_changes(self, values: t.Optional[dict[str, t.Any]] = None, **kwargs):
         """Propagates new values for several variables to all states.
@@ -1789,7 +1977,58 @@ class Gui:
             values = values.copy() if values else {}
             for n, v in kwargs.items():
                 values[n] = v
-        self.broadcast_callback(Gui.__broadcast_changes_fn, [values])
+        self.__fan_out_changes(values or {})
+
+    def __fan_out_changes(self, values: t.Dict[str, t.Any]):
+        """Assign *values* in every state and send the resulting updates.
+
+        Updates that are the same for all the clients (the assigned variables themselves) are encoded once
+        and emitted in a single message to all the connected clients. The updates of expressions that
+        depend on other, client specific, variables are sent to each client.
+        """
+        if not values:
+            return
+        value_ids = {id(v) for v in values.values()}
+        # key = names of the variables that are sent to all clients, value = (encoded updates, client ids)
+        fan_outs: t.Dict[t.FrozenSet[str], t.Tuple[t.Dict[str, t.Any], t.List[str]]] = {}
+        this_sid = None
+        if request:
+            # avoid messing with the client_id => Set(ws id)
+            this_sid = getattr(request, "sid", None)
+            request.sid = None  # type: ignore[attr-defined]
+        try:
+            for client_id in [id for id in self.__bindings._get_all_scopes() if id != _DataScopes._GLOBAL_ID]:
+                with self.get_flask_app().app_context():
+                    setattr(g, Gui.__ARG_CLIENT_ID, client_id)
+                    self.__hold_var_updates()
+                    try:
+                        state = self.__get_state()
+                        for name, value in values.items():
+                            state.assign(name, value)
+                    except Exception as e:  # pragma: no cover
+                        if not self._call_on_exception("broadcast_changes", e):
+                            _warn("Gui.broadcast_changes(): Exception raised", e)
+                    finally:
+                        modified_vars = self.__release_var_updates(send=False)
+                    shared_vars = frozenset(v for v in modified_vars if self.__is_fan_out_value(v, value_ids))
+                    if shared_vars:
+                        if shared_vars not in fan_outs:
+                            fan_outs[shared_vars] = (self.__get_ws_update_dict(list(shared_vars)) or {}, [])
+                        fan_outs[shared_vars][1].append(client_id)
+                    if client_vars := modified_vars - shared_vars:
+                        self.__send_var_list_update(list(client_vars))
+        finally:
+            if this_sid:
+                request.sid = this_sid  # type: ignore[attr-defined]
+        for ws_dict, client_ids in fan_outs.values():
+            if ws_dict:
+                self.__fan_out_ws_update(ws_dict, client_ids)
+
+    def __is_fan_out_value(self, var_name: str, value_ids: t.Set[int]) -> bool:
+        value = _getscopeattr_drill(self, var_name)
+        if isinstance(value, _TaipyBase):
+            value = value.get()
+        return id(value) in value_ids
 
     def _is_in_brdcst_callback(self):
         try:
@@ -2520,6 +2759,7 @@ class Gui:
         scope_metadata = self._get_data_scope_metadata()
         if scope_metadata[_DataScopes._META_PRE_RENDER]:
             return
+        start = time.perf_counter()
         for page in self._config.pages:
             if page is not None:
                 with contextlib.suppress(Exception):
@@ -2539,6 +2779,20 @@ class Gui:
                             new_page.render(self, silent=True)
 
         scope_metadata[_DataScopes._META_PRE_RENDER] = True
+        duration = time.perf_counter() - start
+        if "pre_render" not in self.__startup_timings:
+            self.__startup_timings["pre_render"] = duration
+        _TaipyLogger._get_logger().debug(
+            f"Gui pages pre-rendered for client '{self._get_client_id()}' in {duration * 1000:.1f}ms"
+        )
+
+    def _get_render_version(self) -> int:
+        return self.__render_version
+
+    def _get_page_render_cache(self) -> t.Optional[t.Dict[t.Optional[str], t.Tuple[t.Any, ...]]]:
+        if not self._get_config("page_render_cache", False):
+            return None
+        return self._get_data_scope_metadata()[_DataScopes._META_PAGE_RENDERS]
 
     def _get_navigated_page(self, page_name: str) -> t.Any:
         nav_page = page_name
@@ -2667,6 +2921,24 @@ class Gui:
             return t.cast(Flask, self._server.get_flask())
         raise RuntimeError("get_flask_app() cannot be invoked before run() has been called.")
 
+    def get_memory_usage(self) -> t.Dict[str, t.Any]:
+        """Get an estimate of the memory used by the states of the application.
+
+        Values that are referenced by several states (such as the default value of a variable
+        that a state has not modified) are reported as shared and counted only once in the
+        total size.
+
+        Returns:
+            A dictionary with the following keys:
+
+            - *scope_count*: the number of live states.
+            - *size*: the approximate number of bytes used by all the states.
+            - *scopes*: a dictionary that holds, for each state identifier, a dictionary with the
+              *size* of the values only referenced by this state, the *shared_size* of the values
+              referenced by other states as well, and the size of each of its *variables*.
+        """
+        return self.__bindings._get_memory_usage()
+
     def _get_port(self) -> int:
         return self._server.get_port()
 
@@ -2946,6 +3218,9 @@ class Gui:
         #
         #         The default value is None.
         # --------------------------------------------------------------------------------
+        self.__startup_timings = {}
+        self.__startup_phase_start = time.perf_counter()
+
         app_config = self._config.config
 
         run_root_dir = os.path.dirname(getabsfile(self.__frame))
@@ -2969,13 +3244,16 @@ class Gui:
 
         self._config.resolve()
         TaipyGuiWarning.set_debug_mode(self._get_config("debug", False))
+        self.__end_startup_phase("config")
 
         # setup run function with gui hooks
         _Hooks().run(self, **kwargs)
+        self.__end_startup_phase("hooks")
 
         self.__init_server()
 
         self.__init_ngrok()
+        self.__end_startup_phase("server")
 
         locals_bind = _filter_locals(self.__frame.f_locals)
 
@@ -2985,6 +3263,9 @@ class Gui:
 
         self.__bind_default_function()
 
+        self.__render_version += 1
+        self.__end_startup_phase("variables")
+
         if self.__state is None or is_reloading:
             self.__state = _GuiState(
                 self, self.__locals_context.get_all_keys(), self.__locals_context.get_all_context()
@@ -3029,6 +3310,7 @@ class Gui:
                 except Exception as e:  # pragma: no cover
                     if not self._call_on_exception(f"{name}.on_init", e):
                         _warn(f"Method {name}.on_init() raised an exception", e)
+        self.__end_startup_phase("libraries")
 
         # Initiate the Evaluator with the right context
         self.__evaluator = _Evaluator(glob_ctx, self.__shared_variables)
@@ -3043,6 +3325,14 @@ class Gui:
         # Use multi user or not
         self._bindings()._set_single_client(bool(app_config.get("single_client")))
 
+        # Move idle states to disk
+        self.__schedule_state_spill()
+        self.__end_startup_phase("blueprint")
+        _TaipyLogger._get_logger().debug(
+            "Gui startup: "
+            + ", ".join(f"{phase} {duration * 1000:.1f}ms" for phase, duration in self.__startup_timings.items())
+        )
+
         # Start Flask Server
         if not run_server:
             return self.get_flask_app()
@@ -3060,6 +3350,19 @@ class Gui:
             port_auto_ranges=app_config.get("port_auto_ranges"),
         )
 
+    def __end_startup_phase(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.__startup_timings[phase] = now - self.__startup_phase_start
+        self.__startup_phase_start = now
+
+    def _get_startup_timings(self) -> t.Dict[str, float]:
+        """Duration in seconds of the phases of the last call to `run()`, in order.
+
+        The "pre_render" entry is added when the pages are first rendered for a client, which
+        happens when the client connects.
+        """
+        return dict(self.__startup_timings)
+
     def reload(self):  # pragma: no cover
         """Reload the web server.
 
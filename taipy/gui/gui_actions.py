@@ -9,7 +9,6 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-import threading
 import typing as t
 
 from ._warnings import _warn
@@ -340,10 +339,14 @@ def invoke_long_callback(
     user_status_function: t.Optional[t.Callable] = None,
     user_status_function_args: t.Optional[t.Union[t.Tuple, t.List]] = None,
     period=0,
-):
+) -> t.Optional[str]:
     """Invoke a long-running user callback.
 
-    Long-running callbacks are run in a separate thread to not block the application itself.
+    Long-running callbacks are run in a separate thread to not block the application itself.<br/>
+    These threads are taken from a pool whose size is set by the *long_callback_max_workers*
+    configuration parameter; the number of long-running callbacks that can run at the same time
+    for a given client can be limited with the *long_callback_client_limit* configuration parameter.
+    Callbacks are queued until they can run.
 
     This function expects to be provided a function to run in the background (in *user_function*).<br/>
     It can also be specified a *status function* that is called when the operation performed by
@@ -380,10 +383,14 @@ def invoke_long_callback(
             terminates (then the second parameter of that call will be ).</br>
             When set to a value smaller than 500, *user_status_function* is called only when *user_function*
             terminates (as if *period* was set to 0).
+
+    Returns:
+        The identifier of the long-running callback, that can be used with `cancel_long_callback()^` and
+        `get_long_callback_status()^`.
     """
     if not state or not isinstance(state._gui, Gui):
         _warn("'invoke_long_callback()' must be called in the context of a callback.")
-        return
+        return None
 
     if user_status_function_args is None:
         user_status_function_args = []
@@ -395,7 +402,7 @@ def invoke_long_callback(
     state_id = this_gui._get_client_id()
     module_context = this_gui._get_locals_context()
     if not isinstance(state_id, str) or not isinstance(module_context, str):
-        return
+        return None
 
     def callback_on_exception(state: State, function_name: str, e: Exception):
         if not this_gui._call_on_exception(function_name, e):
@@ -425,23 +432,51 @@ def invoke_long_callback(
                 str(module_context),
             )
 
-    def user_function_in_thread(*uf_args):
-        try:
-            res = user_function(*uf_args)
-            callback_on_status(True, function_result=res)
-        except Exception as e:
-            callback_on_status(False, e, user_function.__name__)
-
-    def thread_status(name: str, period_s: float, count: int):
-        active_thread = next((t for t in threading.enumerate() if t.name == name), None)
-        if active_thread:
-            callback_on_status(count)
-            threading.Timer(period_s, thread_status, (name, period_s, count + 1)).start()
-
-    thread = threading.Thread(target=user_function_in_thread, args=user_function_args)
-    thread.start()
-    if isinstance(period, int) and period >= 500 and _is_function(user_status_function):
-        thread_status(thread.name, period / 1000.0, 0)
+    return this_gui._get_long_callback_executor()._submit(
+        state_id,
+        user_function,
+        user_function_args,
+        callback_on_status,
+        period / 1000.0 if isinstance(period, int) and period >= 500 and _is_function(user_status_function) else 0,
+    )
+
+
+def cancel_long_callback(state: State, callback_id: str) -> bool:
+    """Cancel a long-running callback that has not started yet.
+
+    Long-running callbacks are queued when all the workers are busy, or when the client has
+    reached its limit of concurrent long-running callbacks (see the *long_callback_max_workers*
+    and *long_callback_client_limit* configuration parameters). A callback that is already
+    running cannot be interrupted.
+
+    Arguments:
+        state (State^): The `State^` instance, as received in any callback.
+        callback_id (str): The identifier returned by `invoke_long_callback()^`.
+
+    Returns:
+        True if the callback was removed from the queue, False otherwise.
+    """
+    if not state or not isinstance(state._gui, Gui):
+        _warn("'cancel_long_callback()' must be called in the context of a callback.")
+        return False
+    return state.get_gui()._get_long_callback_executor()._cancel(callback_id)
+
+
+def get_long_callback_status(state: State, callback_id: str) -> t.Optional[str]:
+    """Get the status of a long-running callback.
+
+    Arguments:
+        state (State^): The `State^` instance, as received in any callback.
+        callback_id (str): The identifier returned by `invoke_long_callback()^`.
+
+    Returns:
+        One of "pending", "running", "done", "failed", or "cancelled"; or None if *callback_id*
+        is unknown, or refers to a callback that finished long ago.
+    """
+    if not state or not isinstance(state._gui, Gui):
+        _warn("'get_long_callback_status()' must be called in the context of a callback.")
+        return None
+    return state.get_gui()._get_long_callback_executor()._get_status(callback_id)
 
 
 def query_local_storage(state: State, *keys: str) -> t.Optional[t.Union[str, t.Dict[str, str]]]:
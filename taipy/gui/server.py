@@ -26,7 +26,6 @@ from random import choices, randint
 from flask import (
     Blueprint,
     Flask,
-    json,
     jsonify,
     make_response,
     render_template,
@@ -43,7 +42,7 @@ from werkzeug.serving import is_running_from_reloader
 import __main__
 from taipy.common.logger._taipy_logger import _TaipyLogger
 
-from ._renderers.json import _TaipyJsonProvider
+from ._renderers.json import _TaipyJsonProvider, _TaipyWsJson
 from .config import ServerConfig
 from .custom._page import _ExternalResourceHandlerManager
 from .utils import _is_in_notebook, _is_port_open, _RuntimeManager
@@ -94,7 +93,7 @@ class _Server:
             "cors_allowed_origins": "*",
             "ping_timeout": 10,
             "ping_interval": 5,
-            "json": json,
+            "json": _TaipyWsJson,
             "async_mode": async_mode,
             "allow_upgrades": allow_upgrades,
         }
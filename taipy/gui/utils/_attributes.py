@@ -39,6 +39,7 @@ def _setscopeattr_drill(gui: "Gui", name: str, value: t.Any):
         for scope in gui._get_all_data_scopes().values():
             _attrsetter(scope, name, value)
     else:
+        gui._bindings()._copy_on_write(name)
         _attrsetter(gui._get_data_scope(), name, value)
 
 
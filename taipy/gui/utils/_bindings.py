@@ -82,3 +82,15 @@ class _Bindings:
 
     def _get_all_scopes(self):
         return self.__scopes.get_all_scopes()
+
+    def _copy_on_write(self, name: str):
+        self.__scopes.copy_on_write(self.__gui._get_client_id(), name)
+
+    def _spill_idle_scopes(self, folder: str, idle_period: float):
+        return self.__scopes.spill_idle_scopes(folder, idle_period)
+
+    def _remove_spilled_scopes(self):
+        self.__scopes.remove_spilled_scopes()
+
+    def _get_memory_usage(self):
+        return self.__scopes.get_memory_usage()
@@ -49,6 +49,7 @@ class _Evaluator:
     __IS_TAIPY_EXPR_RE = re.compile(r"TpExPr_(.*)")
     __IS_ARRAY_EXPR_RE = re.compile(r"[^[]*\[(\d+)][^]]*")
     __CLEAN_LAMBDA_RE = re.compile(r"^__lambda_[\d_]+(TPMDL_\d+)?(.*)$")
+    __BUILTIN_NAMES = frozenset(dir(builtins))
 
     def __init__(self, default_bindings: t.Dict[str, t.Any], shared_variable: t.List[str]) -> None:
         # key = expression, value = hashed value of the expression
@@ -69,6 +70,10 @@ class _Evaluator:
         self.__expr_to_holders: t.Dict[str, t.Set[t.Type[_TaipyBase]]] = {}
         # shared variables between multiple clients
         self.__shared_variable = shared_variable
+        # key = (expression source, variable names), value = compiled function evaluating the expression
+        self.__expr_functions: t.Dict[t.Tuple[str, t.Tuple[str, ...]], t.Callable[..., t.Any]] = {}
+        # key = expression source, value = names used in the expression (see __get_expression_names())
+        self.__expr_names: t.Dict[str, t.List[t.Tuple[str, bool]]] = {}
 
     @staticmethod
     def _expr_decode(s: str):
@@ -89,51 +94,64 @@ class _Evaluator:
     def _fetch_expression_list(self, expr: str) -> t.List:
         return [v[0] for v in _Evaluator.__EXPR_RE.findall(expr)]
 
+    def __get_expression_names(self, e: str) -> t.List[t.Tuple[str, bool]]:
+        """Names used in expression *e*, paired with True for built-ins that are not called.
+
+        The result only depends on the expression text: it is computed once and reused by every page
+        and client that use this expression.
+        """
+        if (names := self.__expr_names.get(e)) is not None:
+            return names
+        st = ast.parse('f"{' + e + '}"' if _Evaluator.__EXPR_EDGE_CASE_F_STRING.match(e) else e)
+        args = {arg.arg for node in ast.walk(st) if isinstance(node, ast.arguments) for arg in node.args}
+        targets = {
+            comprehension.target.id  # type: ignore[attr-defined]
+            for node in ast.walk(st)
+            if isinstance(node, ast.ListComp)
+            for comprehension in node.generators
+        }
+        names = []
+        functionsCalls = set()
+        for node in ast.walk(st):
+            if isinstance(node, ast.Call):
+                functionsCalls.add(node.func)
+            elif isinstance(node, ast.Name):
+                var_name = node.id.split(sep=".")[0]
+                if var_name in _Evaluator.__BUILTIN_NAMES:
+                    if node not in functionsCalls:
+                        names.append((var_name, True))
+                elif var_name not in args and var_name not in targets:
+                    names.append((var_name, False))
+        self.__expr_names[e] = names
+        return names
+
     def _analyze_expression(
         self, gui: Gui, expr: str, lazy_declare: t.Optional[bool] = False
     ) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, str]]:
         var_val: t.Dict[str, t.Any] = {}
         var_map: t.Dict[str, str] = {}
-        non_vars = list(self.__global_ctx.keys())
-        builtin_vars = dir(builtins)
-        non_vars.extend(builtin_vars)
         # Get a list of expressions (value that has been wrapped in curly braces {}) and find variables to bind
         for e in self._fetch_expression_list(expr):
-            var_name = e.split(sep=".")[0]
-            st = ast.parse('f"{' + e + '}"' if _Evaluator.__EXPR_EDGE_CASE_F_STRING.match(e) else e)
-            args = [arg.arg for node in ast.walk(st) if isinstance(node, ast.arguments) for arg in node.args]
-            targets = [
-                comprehension.target.id  # type: ignore[attr-defined]
-                for node in ast.walk(st)
-                if isinstance(node, ast.ListComp)
-                for comprehension in node.generators
-            ]
-            functionsCalls = set()
-            for node in ast.walk(st):
-                if isinstance(node, ast.Call):
-                    functionsCalls.add(node.func)
-                elif isinstance(node, ast.Name):
-                    var_name = node.id.split(sep=".")[0]
-                    if var_name in builtin_vars:
-                        if node not in functionsCalls:
-                            _warn(
-                                f"Variable '{var_name}' cannot be used in Taipy expressions "
-                                "as its name collides with a Python built-in identifier."
-                            )
-                    elif var_name not in args and var_name not in targets and var_name not in non_vars:
-                        try:
-                            if lazy_declare and var_name.startswith("__"):
-                                with warnings.catch_warnings(record=True) as warns:
-                                    warnings.resetwarnings()
-                                    encoded_var_name = gui._bind_var(var_name)
-                                    if next((w for w in warns if w.category is TaipyGuiWarning), None):
-                                        gui._bind_var_val(var_name, None)
-                            else:
+            for var_name, is_builtin in self.__get_expression_names(e):
+                if is_builtin:
+                    _warn(
+                        f"Variable '{var_name}' cannot be used in Taipy expressions "
+                        "as its name collides with a Python built-in identifier."
+                    )
+                elif var_name not in self.__global_ctx:
+                    try:
+                        if lazy_declare and var_name.startswith("__"):
+                            with warnings.catch_warnings(record=True) as warns:
+                                warnings.resetwarnings()
                                 encoded_var_name = gui._bind_var(var_name)
-                            var_val[var_name] = _getscopeattr_drill(gui, encoded_var_name)
-                            var_map[var_name] = encoded_var_name
-                        except AttributeError as e:
-                            _warn(f"Variable '{var_name}' is not defined (in expression '{expr}')", e)
+                                if next((w for w in warns if w.category is TaipyGuiWarning), None):
+                                    gui._bind_var_val(var_name, None)
+                        else:
+                            encoded_var_name = gui._bind_var(var_name)
+                        var_val[var_name] = _getscopeattr_drill(gui, encoded_var_name)
+                        var_map[var_name] = encoded_var_name
+                    except AttributeError as e:
+                        _warn(f"Variable '{var_name}' is not defined (in expression '{expr}')", e)
         return var_val, var_map
 
     def __save_expression(
@@ -255,14 +273,14 @@ class _Evaluator:
             return self.__expr_to_hash[expr]
         try:
             # evaluate expressions
-            ctx: t.Dict[str, t.Any] = {}
-            ctx.update(self.__global_ctx)
-            if lambda_expr:
-                ctx.update(gui._get_locals_bind())
-            # entries in var_val are not always seen (NameError) when passed as locals
-            ctx.update(var_val)
             with gui._get_authorization():
-                expr_evaluated = eval(not_encoded_expr if is_edge_case else expr_string, ctx)
+                if lambda_expr:
+                    ctx: t.Dict[str, t.Any] = {}
+                    ctx.update(self.__global_ctx)
+                    ctx.update(gui._get_locals_bind())
+                    expr_evaluated = eval(expr_string, ctx)
+                else:
+                    expr_evaluated = self.__evaluate(not_encoded_expr if is_edge_case else expr_string, var_val)
         except Exception as e:
             exception_str = not_encoded_expr if is_edge_case else expr_string
             _warn(
@@ -276,6 +294,19 @@ class _Evaluator:
         # save the expression if it needs to be re-evaluated
         return self.__save_expression(gui, expr, expr_hash, expr_evaluated, var_map, lambda_expr)
 
+    def __evaluate(self, expr_string: str, var_values: t.Dict[str, t.Any]) -> t.Any:
+        """Evaluate *expr_string* in the global context, with the values of its variables.
+
+        The expression is compiled once into a function that takes the variables as parameters, so that
+        the global context does not need to be copied and variables are seen from nested scopes.
+        """
+        key = (expr_string, tuple(var_values))
+        if (function := self.__expr_functions.get(key)) is None:
+            source = f"lambda {', '.join(key[1])}: ({expr_string}\n)"
+            function = eval(compile(source, "<string>", "eval"), self.__global_ctx)
+            self.__expr_functions[key] = function
+        return function(**var_values)
+
     def refresh_expr(self, gui: Gui, var_name: str, holder: t.Optional[_TaipyBase]):
         """
         This function will execute when the __request_var_update function receive a refresh order
@@ -292,25 +323,77 @@ class _Evaluator:
         else:
             expr_string = expr_decoded
         try:
-            ctx: t.Dict[str, t.Any] = {}
-            ctx.update(self.__global_ctx)
-            ctx.update(eval_dict)
-            expr_evaluated = eval(expr_string, ctx)
+            expr_evaluated = self.__evaluate(expr_string, eval_dict)
             _setscopeattr(gui, var_name, expr_evaluated)
             if holder is not None:
                 holder.set(expr_evaluated)
         except Exception as e:
             _warn(f"Exception raised evaluating {_Evaluator._clean_exception_expr(expr_string)}", e)
 
-    def re_evaluate_expr(self, gui: Gui, var_name: str) -> t.Set[str]:  # noqa C901
+    def re_evaluate_expr(self, gui: Gui, var_name: str) -> t.Set[str]:
         """
         This function will execute when the _update_var function is handling
         an expression with only a single variable
         """
+        return self.re_evaluate_exprs(gui, [var_name])
+
+    def re_evaluate_exprs(self, gui: Gui, var_names: t.Iterable[str]) -> t.Set[str]:  # noqa C901
+        """
+        Re-evaluate the expressions and holders that depend on any of the variables in *var_names*.
+
+        Each expression is evaluated once, even if it depends on several of these variables, then the
+        holders that depend on the re-evaluated expressions are refreshed.
+        """
         modified_vars: t.Set[str] = set()
+        resolved_names: t.Set[str] = set()
+        # key = expression, value = None: an ordered set of the expressions to re-evaluate
+        exprs: t.Dict[str, None] = {}
+        for var_name in var_names:
+            if (resolved_name := self.__resolve_var_name(gui, var_name)) is not None:
+                resolved_names.add(resolved_name)
+                exprs.update(dict.fromkeys(self.__var_to_expr_list[resolved_name]))
+        # refresh expressions
+        hash_exprs: t.Dict[str, str] = {}
+        for expr in exprs:
+            expr_decoded, _ = _variable_decode(expr)
+            hash_expr = self.__expr_to_hash.get(expr, "UnknownExpr")
+            if expr not in resolved_names and not expr.startswith(_TaipyBase._HOLDER_PREFIX):
+                expr_var_map = self.__expr_to_var_map.get(expr)  # ["x", "y"]
+                if expr_var_map is None:
+                    _warn(f"Something is amiss with expression list for {expr}.")
+                else:
+                    eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in expr_var_map.items()}
+                    if self._is_expression(expr_decoded):
+                        expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
+                    else:
+                        expr_string = expr_decoded
+                    try:
+                        expr_evaluated = self.__evaluate(expr_string, eval_dict)
+                        _setscopeattr(gui, hash_expr, expr_evaluated)
+                    except Exception as e:
+                        if is_debugging():
+                            _warn(f"Exception raised evaluating {_Evaluator._clean_exception_expr(expr_string)}", e)
+                        hash_expr = ""
+            hash_exprs[expr] = hash_expr
+        # refresh holders if any, once all the expressions they depend on are evaluated
+        for expr, hash_expr in hash_exprs.items():
+            for h in self.__expr_to_holders.get(expr, []):
+                holder_hash = self.__get_holder_hash(h, self.get_hash_from_expr(expr))
+                if holder_hash not in modified_vars:
+                    _setscopeattr(gui, holder_hash, self.__evaluate_holder(gui, h, expr))
+                    modified_vars.add(holder_hash)
+            if hash_expr:
+                modified_vars.add(hash_expr)
+        return modified_vars
+
+    def __resolve_var_name(self, gui: Gui, var_name: str) -> t.Optional[str]:
+        """Return the name of the variable which expressions depend on, or None if there is none.
+
+        Edge case expressions (tpec_...) are assigned back to the variable they were created from.
+        """
         # Verify that the current hash is an edge case one (only a single variable inside the original expression)
         if var_name.startswith("tp_"):
-            return modified_vars
+            return None
         expr_original = None
         # if var_name starts with tpec_ --> it is an edge case with modified var
         if var_name.startswith("tpec_"):
@@ -345,7 +428,7 @@ class _Evaluator:
                     else:
                         key = v
                 if key == "":
-                    return modified_vars
+                    return None
                 _setscopeattr_drill(gui, f"{var_name}.{_getscopeattr(gui, key)}", _getscopeattr(gui, var_name_original))
         # A middle check to see if var_name is from _MapDict
         if "." in var_name:
@@ -353,40 +436,8 @@ class _Evaluator:
         # otherwise, that var_name is correct and doesn't require any resolution
         if var_name not in self.__var_to_expr_list:
             # _warn("{var_name} not found.")
-            return modified_vars
-        # refresh expressions and holders
-        for expr in self.__var_to_expr_list[var_name]:
-            expr_decoded, _ = _variable_decode(expr)
-            hash_expr = self.__expr_to_hash.get(expr, "UnknownExpr")
-            if expr != var_name and not expr.startswith(_TaipyBase._HOLDER_PREFIX):
-                expr_var_map = self.__expr_to_var_map.get(expr)  # ["x", "y"]
-                if expr_var_map is None:
-                    _warn(f"Something is amiss with expression list for {expr}.")
-                else:
-                    eval_dict = {k: _getscopeattr_drill(gui, gui._bind_var(v)) for k, v in expr_var_map.items()}
-                    if self._is_expression(expr_decoded):
-                        expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
-                    else:
-                        expr_string = expr_decoded
-                    try:
-                        ctx: t.Dict[str, t.Any] = {}
-                        ctx.update(self.__global_ctx)
-                        ctx.update(eval_dict)
-                        expr_evaluated = eval(expr_string, ctx)
-                        _setscopeattr(gui, hash_expr, expr_evaluated)
-                    except Exception as e:
-                        if is_debugging():
-                            _warn(f"Exception raised evaluating {_Evaluator._clean_exception_expr(expr_string)}", e)
-                        hash_expr = ""
-            # refresh holders if any
-            for h in self.__expr_to_holders.get(expr, []):
-                holder_hash = self.__get_holder_hash(h, self.get_hash_from_expr(expr))
-                if holder_hash not in modified_vars:
-                    _setscopeattr(gui, holder_hash, self.__evaluate_holder(gui, h, expr))
-                    modified_vars.add(holder_hash)
-            if hash_expr:
-                modified_vars.add(hash_expr)
-        return modified_vars
+            return None
+        return var_name
 
     def _get_instance_in_context(self, name: str):
         return self.__global_ctx.get(name)
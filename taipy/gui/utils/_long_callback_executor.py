@@ -0,0 +1,226 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import heapq
+import itertools
+import threading
+import time
+import typing as t
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from .._warnings import _warn
+
+
+class _LongCallbackTask:
+    __slots__ = ("id", "client_id", "function", "args", "on_status", "period", "status")
+
+    def __init__(
+        self,
+        client_id: str,
+        function: t.Callable,
+        args: t.Sequence[t.Any],
+        on_status: t.Callable,
+        period: float,
+    ) -> None:
+        self.id = str(uuid.uuid4())
+        self.client_id = client_id
+        self.function = function
+        self.args = args
+        self.on_status = on_status
+        self.period = period
+        self.status = _LongCallbackExecutor.PENDING
+
+
+class _LongCallbackExecutor:
+    """Run long callbacks in a bounded pool of threads.
+
+    Tasks are queued until a worker is available and the client that submitted them has fewer than
+    *client_limit* running tasks (0 means no limit).<br/>
+    *on_status* follows the contract of the status function of `invoke_long_callback()`: it is
+    called with an int every *period* seconds while the task runs, then with True and the result of
+    the function, or False and the exception that was raised.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    # Number of finished tasks whose status can still be queried
+    __MAX_FINISHED_TASKS = 1024
+
+    def __init__(self, max_workers: t.Optional[int] = None, client_limit: int = 0) -> None:
+        self.__executor = ThreadPoolExecutor(max_workers, thread_name_prefix="taipy_long_callback")
+        self.__max_workers: int = self.__executor._max_workers
+        self.__client_limit = client_limit
+        self.__lock = threading.Condition()
+        self.__tasks: t.OrderedDict[str, _LongCallbackTask] = OrderedDict()
+        self.__pending: t.Deque[_LongCallbackTask] = deque()
+        self.__running: t.Dict[str, int] = {}
+        self.__nb_running = 0
+        self.__nb_finished = 0
+        # Periodic status calls: (time, sequence, task, count)
+        self.__ticks: t.List[t.Tuple[float, int, _LongCallbackTask, int]] = []
+        self.__tick_sequence = itertools.count()
+        self.__ticker: t.Optional[threading.Thread] = None
+        self.__is_shut_down = False
+
+    def _is_configured(self, max_workers: t.Optional[int], client_limit: int) -> bool:
+        return (max_workers is None or max_workers == self.__max_workers) and client_limit == self.__client_limit
+
+    def _submit(
+        self,
+        client_id: str,
+        function: t.Callable,
+        args: t.Sequence[t.Any],
+        on_status: t.Callable,
+        period: float = 0,
+    ) -> str:
+        task = _LongCallbackTask(client_id, function, args, on_status, period)
+        with self.__lock:
+            if self.__is_shut_down:
+                raise RuntimeError("Cannot submit a long callback to an executor that is shut down.")
+            self.__tasks[task.id] = task
+            self.__pending.append(task)
+            self.__dispatch()
+        return task.id
+
+    def _cancel(self, task_id: str) -> bool:
+        """Cancel a task that has not started yet."""
+        with self.__lock:
+            task = self.__tasks.get(task_id)
+            if task is None or task.status != _LongCallbackExecutor.PENDING:
+                return False
+            self.__pending.remove(task)
+            self.__finish(task, _LongCallbackExecutor.CANCELLED)
+            return True
+
+    def _shutdown(self, wait: bool = True) -> None:
+        """Cancel the pending tasks and release the threads once the running tasks are finished.
+
+        No task can be submitted after the executor is shut down.
+        """
+        with self.__lock:
+            self.__is_shut_down = True
+            while self.__pending:
+                self.__finish(self.__pending.popleft(), _LongCallbackExecutor.CANCELLED)
+            self.__ticks.clear()
+            self.__lock.notify_all()
+        self.__executor.shutdown(wait=wait)
+
+    def _get_status(self, task_id: str) -> t.Optional[str]:
+        with self.__lock:
+            task = self.__tasks.get(task_id)
+            return task.status if task else None
+
+    def _get_counts(self, client_id: t.Optional[str] = None) -> t.Dict[str, int]:
+        with self.__lock:
+            if client_id is None:
+                return {
+                    _LongCallbackExecutor.PENDING: len(self.__pending),
+                    _LongCallbackExecutor.RUNNING: self.__nb_running,
+                }
+            return {
+                _LongCallbackExecutor.PENDING: sum(1 for task in self.__pending if task.client_id == client_id),
+                _LongCallbackExecutor.RUNNING: self.__running.get(client_id, 0),
+            }
+
+    def __dispatch(self) -> None:
+        # Called with the lock held
+        if not self.__pending or self.__nb_running >= self.__max_workers:
+            return
+        for task in list(self.__pending):
+            if self.__nb_running >= self.__max_workers:
+                break
+            running = self.__running.get(task.client_id, 0)
+            if self.__client_limit > 0 and running >= self.__client_limit:
+                continue
+            self.__pending.remove(task)
+            self.__running[task.client_id] = running + 1
+            self.__nb_running += 1
+            task.status = _LongCallbackExecutor.RUNNING
+            self.__executor.submit(self.__run, task)
+
+    def __finish(self, task: _LongCallbackTask, status: str) -> None:
+        # Called with the lock held
+        task.status = status
+        task.function = task.on_status = None  # type: ignore[assignment]
+        task.args = ()
+        self.__nb_finished += 1
+        if self.__nb_finished > _LongCallbackExecutor.__MAX_FINISHED_TASKS:
+            # Forget the oldest finished task
+            for task_id, old_task in self.__tasks.items():
+                if old_task.status not in (_LongCallbackExecutor.PENDING, _LongCallbackExecutor.RUNNING):
+                    del self.__tasks[task_id]
+                    self.__nb_finished -= 1
+                    break
+
+    def __run(self, task: _LongCallbackTask) -> None:
+        on_status = task.on_status
+        if task.period > 0:
+            self.__schedule_tick(task, 0, time.monotonic())
+        status = _LongCallbackExecutor.DONE
+        try:
+            result = task.function(*task.args)
+            on_status(True, function_result=result)
+        except Exception as e:
+            status = _LongCallbackExecutor.FAILED
+            try:
+                on_status(False, e, getattr(task.function, "__name__", "long callback"))
+            except Exception as se:  # pragma: no cover
+                _warn("Exception raised in long callback status", se)
+        finally:
+            with self.__lock:
+                self.__running[task.client_id] -= 1
+                if not self.__running[task.client_id]:
+                    del self.__running[task.client_id]
+                self.__nb_running -= 1
+                self.__finish(task, status)
+                self.__dispatch()
+
+    def __schedule_tick(self, task: _LongCallbackTask, count: int, when: float) -> None:
+        with self.__lock:
+            if self.__is_shut_down:
+                return
+            heapq.heappush(self.__ticks, (when, next(self.__tick_sequence), task, count))
+            if self.__ticker is None:
+                self.__ticker = threading.Thread(
+                    target=self.__run_ticks, name="taipy_long_callback_status", daemon=True
+                )
+                self.__ticker.start()
+            else:
+                self.__lock.notify()
+
+    def __run_ticks(self) -> None:
+        # One thread calls the periodic status functions of all the running tasks
+        while True:
+            with self.__lock:
+                while not self.__ticks and not self.__is_shut_down:
+                    self.__lock.wait()
+                if self.__is_shut_down:
+                    self.__ticker = None
+                    return
+                when, _, task, count = self.__ticks[0]
+                if (delay := when - time.monotonic()) > 0:
+                    self.__lock.wait(delay)
+                    continue
+                heapq.heappop(self.__ticks)
+                if task.status != _LongCallbackExecutor.RUNNING:
+                    continue
+                on_status = task.on_status
+            try:
+                on_status(count)
+            except Exception as e:  # pragma: no cover
+                _warn("Exception raised in long callback status", e)
+            self.__schedule_tick(task, count + 1, time.monotonic() + task.period)
@@ -79,6 +79,14 @@ class _MapDict(object):
         else:
             self.__setitem__(attr, value)
 
+    # to be able to pickle (__getattr__ would otherwise be invoked before _dict is set)
+    def __getstate__(self):
+        return self._dict
+
+    def __setstate__(self, state):
+        self._dict = state
+        self._update_var = None  # type: ignore[assignment]
+
     def keys(self):
         return self._dict.keys()
 
@@ -67,6 +67,15 @@ class _TaipyBase(ABC):
 
 
 class _TaipyData(_TaipyBase):
+    def __init__(self, data: t.Any, hash_name: str) -> None:
+        super().__init__(data, hash_name)
+        # Incremented every time the data is set, so that results computed from it can be cached
+        self._version = 0
+
+    def set(self, data: t.Any):
+        super().set(data)
+        self._version += 1
+
     @staticmethod
     def get_hash():
         return _TaipyBase._HOLDER_PREFIX + "D"
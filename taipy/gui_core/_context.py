@@ -16,7 +16,7 @@ import zoneinfo
 from collections import defaultdict
 from numbers import Number
 from pathlib import Path
-from threading import Lock
+from threading import Lock, Timer
 
 import pandas as pd
 from dateutil import parser
@@ -69,6 +69,7 @@ from ._adapters import (
     _GuiCoreScenarioProperties,
     _invoke_action,
 )
+from ._data_node_cache import _DataNodeReadCache
 from ._utils import _ClientStatus
 from .filters import CustomScenarioFilter, ParamType
 
@@ -85,6 +86,14 @@ class _GuiCoreContext(CoreEventConsumerBase):
     __ACTION = "action"
     _CORE_CHANGED_NAME = "core_changed"
     _AUTH_CHANGED_NAME = "auth_changed"
+    # Delay, in seconds, during which core changes are merged before being broadcast
+    _CORE_CHANGED_DELAY = 0.1
+    # Maximum size, in bytes, of the data node values kept for the data node viewers
+    _DATA_NODE_CACHE_SIZE = 256 * 1024 * 1024
+    # Number of edits sent for each page of a data node history
+    _HISTORY_PAGE_SIZE = 50
+    # Maximum number of core events processed together, successive updates of an attribute being coalesced
+    _EVENT_BATCH_SIZE = 100
 
     def __init__(self, gui: Gui) -> None:
         self.gui = gui
@@ -92,18 +101,28 @@ class _GuiCoreContext(CoreEventConsumerBase):
         self.data_nodes_by_owner: t.Optional[t.Dict[t.Optional[str], t.List[DataNode]]] = None
         self.scenario_configs: t.Optional[t.List[t.Tuple[str, str]]] = None
         self.jobs_list: t.Optional[t.List[Job]] = None
+        # filtered and sorted jobs, with the filters they were selected with
+        self.__jobs_selection: t.Optional[t.Tuple[str, t.List[Job]]] = None
+        # (id, label) of the owners of the jobs, by owner id
+        self.__job_owners: t.Dict[str, t.Tuple[str, str]] = {}
+        # sort keys of the scenarios and cycles, by column then entity id
+        self.__scenario_sort_keys: t.Dict[str, t.Dict[str, str]] = {}
         self.client_submission: t.Dict[str, _ClientStatus] = {}
+        self.__data_node_cache = _DataNodeReadCache(_GuiCoreContext._DATA_NODE_CACHE_SIZE)
         # register to taipy core notification
-        reg_id, reg_queue = Notifier.register()
+        reg_id, reg_queue = Notifier.register(batch=True)
         # locks
         self.lock = Lock()
         self.submissions_lock = Lock()
+        # core changes waiting to be broadcast
+        self.__core_changed: t.Optional[t.Dict[str, t.Any]] = None
+        self.__core_changed_lock = Lock()
         # lazy_start
         self.__started = False
         # Gui event listener
         gui._add_event_listener("authorization", self._auth_listener, with_state=True)
         # super
-        super().__init__(reg_id, reg_queue)
+        super().__init__(reg_id, reg_queue, max_batch_size=_GuiCoreContext._EVENT_BATCH_SIZE)
 
     def on_user_init(self, state: State):
         self.gui._fire_event("authorization", get_state_id(state), {})
@@ -116,12 +135,16 @@ class _GuiCoreContext(CoreEventConsumerBase):
 
     def process_event(self, event: Event):
         self.__lazy_start()
+        if event.entity_type not in (EventEntityType.JOB, EventEntityType.SUBMISSION):
+            self.__scenario_sort_keys = {}
+            self.__job_owners = {}
         if event.entity_type is EventEntityType.SCENARIO:
             with self.gui._get_authorization(system=True):
                 self.scenario_refresh(
                     event.entity_id
                     if event.operation is EventOperation.DELETION or is_readable(t.cast(ScenarioId, event.entity_id))
-                    else None
+                    else None,
+                    event.operation,
                 )
         elif event.entity_type is EventEntityType.SEQUENCE and event.entity_id:
             sequence = None
@@ -139,7 +162,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
                 _warn(f"Access to sequence {event.entity_id} failed", e)
         elif event.entity_type is EventEntityType.JOB:
             with self.lock:
-                self.jobs_list = None
+                self.__update_jobs_list(event)
             # no broadcast because the submission status will do the job
             if event.operation is EventOperation.DELETION:
                 self.broadcast_core_changed({"jobs": True})
@@ -147,20 +170,126 @@ class _GuiCoreContext(CoreEventConsumerBase):
             self.submission_status_callback(event.entity_id, event)
         elif event.entity_type is EventEntityType.DATA_NODE:
             with self.lock:
-                self.data_nodes_by_owner = None
+                self.__update_data_nodes_by_owner(event)
+            if event.operation is EventOperation.DELETION:
+                self.__data_node_cache._invalidate(event.entity_id)
             self.broadcast_core_changed(
                 {"datanode": event.entity_id if event.operation != EventOperation.DELETION else True}
             )
 
     def broadcast_core_changed(self, payload: t.Dict[str, t.Any], client_id: t.Optional[str] = None):
-        self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload, client_id)
+        if client_id is not None or _GuiCoreContext._CORE_CHANGED_DELAY <= 0:
+            self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload, client_id)
+            return
+        # Changes sent to all clients are merged for a short time so that a burst of events results in one message
+        with self.__core_changed_lock:
+            if self.__core_changed is not None:
+                _GuiCoreContext.__merge_core_changed(self.__core_changed, payload)
+                return
+            self.__core_changed = dict(payload)
+        timer = Timer(_GuiCoreContext._CORE_CHANGED_DELAY, self.__flush_core_changed)
+        timer.daemon = True
+        timer.start()
+
+    def __flush_core_changed(self):
+        with self.__core_changed_lock:
+            payload = self.__core_changed
+            self.__core_changed = None
+        if payload:
+            self.gui._broadcast(_GuiCoreContext._CORE_CHANGED_NAME, payload)
 
-    def scenario_refresh(self, scenario_id: t.Optional[str]):
+    @staticmethod
+    def __merge_core_changed(pending: t.Dict[str, t.Any], payload: t.Dict[str, t.Any]):
+        # Values are an entity id, a list of entity ids or True when all entities are concerned
+        for key, value in payload.items():
+            current = pending.get(key)
+            if current is None or value is True:
+                pending[key] = value
+            elif current is not True:
+                ids = list(current) if isinstance(current, (list, tuple)) else [current]
+                for entity_id in value if isinstance(value, (list, tuple)) else [value]:
+                    if entity_id not in ids:
+                        ids.append(entity_id)
+                pending[key] = ids
+
+    def scenario_refresh(self, scenario_id: t.Optional[str], operation: t.Optional[EventOperation] = None):
+        self.__scenario_sort_keys = {}
         with self.lock:
-            self.scenario_by_cycle = None
-            self.data_nodes_by_owner = None
+            if scenario_id is None or operation is None:
+                self.scenario_by_cycle = None
+                self.data_nodes_by_owner = None
+            else:
+                self.__update_scenario_by_cycle(scenario_id, operation)
         self.broadcast_core_changed({"scenario": scenario_id or True})
 
+    # The following methods apply an event to the cached entities, with self.lock held.
+    # Cached entities reload their attributes when accessed: updates don't need to be applied.
+    def __update_scenario_by_cycle(self, scenario_id: str, operation: EventOperation):
+        if self.scenario_by_cycle is None:
+            return
+        if operation is EventOperation.DELETION:
+            for cycle, scenarios in list(self.scenario_by_cycle.items()):
+                if remaining := [s for s in scenarios if s.id != scenario_id]:
+                    self.scenario_by_cycle[cycle] = remaining
+                else:
+                    del self.scenario_by_cycle[cycle]
+            if self.data_nodes_by_owner is not None:
+                self.data_nodes_by_owner.pop(scenario_id, None)
+        elif operation is EventOperation.CREATION:
+            with self.gui._get_authorization(system=True):
+                scenario = core_get(scenario_id)
+            if isinstance(scenario, Scenario):
+                scenarios = self.scenario_by_cycle.setdefault(scenario.cycle, [])
+                if scenario not in scenarios:
+                    scenarios.append(scenario)
+            else:
+                self.scenario_by_cycle = None
+
+    def __update_data_nodes_by_owner(self, event: Event):
+        if self.data_nodes_by_owner is None or event.operation is EventOperation.UPDATE:
+            return
+        if not event.entity_id:
+            self.data_nodes_by_owner = None
+        elif event.operation is EventOperation.DELETION:
+            for owner_id, data_nodes in list(self.data_nodes_by_owner.items()):
+                if remaining := [dn for dn in data_nodes if dn.id != event.entity_id]:
+                    self.data_nodes_by_owner[owner_id] = remaining
+                else:
+                    del self.data_nodes_by_owner[owner_id]
+        elif event.operation is EventOperation.CREATION:
+            with self.gui._get_authorization(system=True):
+                data_node = core_get(event.entity_id)
+            if isinstance(data_node, DataNode):
+                data_nodes = self.data_nodes_by_owner.setdefault(data_node.owner_id, [])
+                if data_node not in data_nodes:
+                    data_nodes.append(data_node)
+            else:
+                self.data_nodes_by_owner = None
+
+    def __update_jobs_list(self, event: Event):
+        if self.jobs_list is None:
+            return
+        self.__jobs_selection = None
+        if not event.entity_id:
+            self.jobs_list = None
+        elif event.operation is EventOperation.DELETION:
+            self.jobs_list = [job for job in self.jobs_list if job.id != event.entity_id]
+        else:
+            with self.gui._get_authorization(system=True):
+                job = core_get(event.entity_id)
+            if not isinstance(job, Job):
+                if event.operation is EventOperation.CREATION:
+                    self.jobs_list = None
+            elif event.operation is EventOperation.UPDATE:
+                # Jobs are selected on their cached attributes: the updated job replaces the cached one.
+                # Recent jobs, that are the most likely to change, are at the end of the list.
+                for idx in range(len(self.jobs_list) - 1, -1, -1):
+                    if self.jobs_list[idx].id == job.id:
+                        self.jobs_list[idx] = job
+                        break
+            elif job not in self.jobs_list:
+                self.jobs_list.append(job)
+
     def submission_status_callback(self, submission_id: t.Optional[str] = None, event: t.Optional[Event] = None):
         if not submission_id:
             return
@@ -315,11 +444,26 @@ class _GuiCoreContext(CoreEventConsumerBase):
             for sd in reversed(sorts):
                 col = sd.get("col", "")
                 order = sd.get("order", True)
-                sorted_list = sorted(sorted_list, key=_get_entity_property(col, Scenario, Cycle), reverse=not order)
+                sorted_list = sorted(sorted_list, key=self.__get_scenario_sort_key(col), reverse=not order)
         else:
-            sorted_list = sorted(entities, key=_get_entity_property("creation_date", Scenario, Cycle))
+            sorted_list = sorted(entities, key=self.__get_scenario_sort_key("creation_date"))
         return [self.cycle_adapter(e, sorts) if isinstance(e, Cycle) else e for e in sorted_list]
 
+    def __get_scenario_sort_key(self, col: str):
+        # Sort keys are read from the entities once, then reused until a core event is received
+        sort_key = _get_entity_property(col, Scenario, Cycle)
+        keys = self.__scenario_sort_keys.setdefault(col, {})
+
+        def cached_sort_key(entity: t.Union[Scenario, Cycle]):
+            entity_id = getattr(entity, "id", None)
+            if entity_id is None:
+                return sort_key(entity)
+            if (key := keys.get(entity_id)) is None:
+                key = keys[entity_id] = sort_key(entity)
+            return key
+
+        return cached_sort_key
+
     def get_filtered_scenario_list(
         self,
         entities: t.List[t.Union[t.List, Scenario, None]],
@@ -862,17 +1006,79 @@ class _GuiCoreContext(CoreEventConsumerBase):
 
         return None
 
-    def get_jobs_list(self):
+    def get_jobs_list(self, page: t.Optional[t.Dict[str, t.Any]] = None, page_size: t.Optional[int] = None):
+        self.__lazy_start()
+        with self.lock:
+            if self.jobs_list is None:
+                self.jobs_list = get_jobs()
+                self.__jobs_selection = None
+            if page is None and not page_size:
+                return self.jobs_list
+            jobs = self.__select_jobs(page)
+        start, count = _GuiCoreContext.__get_page_range(page, page_size)
+        return jobs[start : start + count] if count > 0 else jobs[start:]
+
+    def get_jobs_count(self, page: t.Optional[t.Dict[str, t.Any]] = None, page_size: t.Optional[int] = None):
         self.__lazy_start()
         with self.lock:
             if self.jobs_list is None:
                 self.jobs_list = get_jobs()
-            return self.jobs_list
+                self.__jobs_selection = None
+            return len(self.__select_jobs(page)) if page is not None or page_size else len(self.jobs_list)
+
+    @staticmethod
+    def __get_page_range(page: t.Optional[t.Dict[str, t.Any]], page_size: t.Optional[int]) -> t.Tuple[int, int]:
+        page = page if isinstance(page, dict) else {}
+        try:
+            start = max(int(page.get("start", 0)), 0)
+            count = int(page.get("count", page_size or 0))
+        except (TypeError, ValueError):
+            start, count = 0, int(page_size or 0)
+        return start, count
+
+    def __select_jobs(self, page: t.Optional[t.Dict[str, t.Any]]) -> t.List[Job]:
+        # Called with self.lock held: jobs are filtered then sorted by decreasing creation date
+        filters = page.get("filters") if isinstance(page, dict) else None
+        filters = [f for f in filters if isinstance(f, dict) and f.get("col")] if isinstance(filters, list) else []
+        key = json.dumps(filters, sort_keys=True)
+        if self.__jobs_selection is None or self.__jobs_selection[0] != key:
+            jobs = [job for job in t.cast(t.List[Job], self.jobs_list) if self.__job_matches(job, filters)]
+            jobs.sort(key=lambda job: job._creation_date, reverse=True)
+            self.__jobs_selection = (key, jobs)
+        return self.__jobs_selection[1]
+
+    def __job_matches(self, job: Job, filters: t.List[t.Dict[str, t.Any]]) -> bool:
+        for fd in filters:
+            includes = str(fd.get("value", "")).lower() in self.__get_job_column(job, fd["col"]).lower()
+            if includes is (fd.get("operator", "is") == "isnot"):
+                return False
+        return True
+
+    def __get_job_column(self, job: Job, col: str) -> str:
+        # Attributes are read from the cached job to avoid reloading it from the repository
+        if col == "id":
+            return f"{job.id}{job.get_simple_label()}"
+        if col in ("submitted_id", "submitted_label"):
+            owner_id = job._task.id
+            if (owner := self.__job_owners.get(owner_id)) is None:
+                with self.gui._get_authorization(system=True):
+                    entity = core_get(owner_id)
+                owner = self.__job_owners[owner_id] = (
+                    (entity.id, entity.get_simple_label()) if entity else (owner_id, "")
+                )
+            return f"{owner[0]}{owner[1]}"
+        if col == "submission_id":
+            return job._submit_id
+        if col == "creation_date":
+            return str(job._creation_date)
+        if col == "status":
+            return job._status.name
+        return ""
 
     def job_adapter(self, job):
         self.__lazy_start()
         try:
-            if hasattr(job, "id") and is_readable(job.id) and core_get(job.id) is not None:
+            if hasattr(job, "id") and is_readable(job.id):
                 if isinstance(job, Job):
                     entity = core_get(job.owner_id)
                     return (
@@ -1037,30 +1243,47 @@ class _GuiCoreContext(CoreEventConsumerBase):
                         cycles_scenarios.append(entity)
         return sorted(cycles_scenarios, key=_get_entity_property("creation_date", Scenario))
 
-    def get_data_node_history(self, id: str):
+    def get_data_node_history(self, id: str, count: t.Optional[int] = None):
         self.__lazy_start()
         if id and (dn := core_get(id)) and isinstance(dn, DataNode):
+            try:
+                count = int(count) if count else _GuiCoreContext._HISTORY_PAGE_SIZE
+            except (TypeError, ValueError):
+                count = _GuiCoreContext._HISTORY_PAGE_SIZE
+            edits = dn.edits
+            nb_edits = len(edits) + dn._count_archived_edits()
+            if count > len(edits) and nb_edits > len(edits):
+                # the requested page includes edits that were moved out of the data node
+                edits = dn.get_edit_history()
+            edits = sorted(edits, key=lambda e: e.get(EDIT_TIMESTAMP_KEY) or datetime.datetime.min, reverse=True)
+            # jobs often write several data nodes: each job is described once
+            jobs: t.Dict[str, t.Tuple[str, t.Optional[str]]] = {}
             res = []
-            for e in dn.edits:
+            for rank, e in enumerate(edits[:count]):
                 job_id = e.get(EDIT_JOB_ID_KEY)
-                job: t.Optional[Job] = None
+                comment = e.get(EDIT_COMMENT_KEY, "")
                 if job_id:
-                    if not (reason := is_readable(job_id)):
-                        job_id += f" is not readable: {_get_reason(reason)}."
-                    else:
-                        job = core_get(job_id)
+                    if (job_desc := jobs.get(job_id)) is None:
+                        job_desc = jobs[job_id] = _GuiCoreContext.__get_edit_job(job_id)
+                    job_id, comment = job_desc[0], job_desc[1] or comment
                 res.append(
                     (
                         e.get(EDIT_TIMESTAMP_KEY),
                         job_id if job_id else e.get(EDIT_EDITOR_ID_KEY, ""),
-                        f"Execution of task {job.task.get_simple_label()}."
-                        if job and job.task
-                        else e.get(EDIT_COMMENT_KEY, ""),
+                        comment,
+                        nb_edits - rank,
                     )
                 )
-            return sorted(res, key=lambda r: r[0], reverse=True)
+            return res
         return _DoNotUpdate()
 
+    @staticmethod
+    def __get_edit_job(job_id: str) -> t.Tuple[str, t.Optional[str]]:
+        if not (reason := is_readable(t.cast(JobId, job_id))):
+            return f"{job_id} is not readable: {_get_reason(reason)}.", None
+        job = core_get(job_id)
+        return job_id, f"Execution of task {job.task.get_simple_label()}." if job and job.task else None
+
     def __check_readable_editable(self, state: State, id: str, ent_type: str, var: t.Optional[str]):
         if not (reason := is_readable(t.cast(ScenarioId, id))):
             _GuiCoreContext.__assign_var(state, var, f"{ent_type} {id} is not readable: {_get_reason(reason)}")
@@ -1119,7 +1342,8 @@ class _GuiCoreContext(CoreEventConsumerBase):
                     else payload.get("value")
                 )
                 # user_value = payload.get("user_value")
-                data = self.__read_tabular_data(datanode)
+                # the value is modified in place: it must not be shared with the viewers
+                data = datanode.read()
                 new_data: t.Any = None
                 if isinstance(data, (pd.DataFrame, pd.Series)):
                     if isinstance(data, pd.DataFrame):
@@ -1200,7 +1424,7 @@ class _GuiCoreContext(CoreEventConsumerBase):
         return None
 
     def __read_tabular_data(self, datanode: DataNode):
-        return datanode.read()
+        return self.__data_node_cache._read(datanode)
 
     def get_data_node_tabular_data(self, id: str):
         self.__lazy_start()
@@ -0,0 +1,88 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import sys
+import typing as t
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+
+import numpy as np
+import pandas as pd
+
+from taipy.core import DataNode
+
+
+class _DataNodeReadCache:
+    """Values read from data nodes, by data node id.
+
+    A value is returned as long as the last edit date of its data node has not changed: each version
+    of the data is read once.<br/>
+    The least recently used values are evicted when their total size exceeds *max_size* bytes.
+    Values that are larger than *max_size* are not cached.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.__max_size = max_size
+        self.__lock = Lock()
+        # data node id -> (last edit date, value, size)
+        self.__values: t.OrderedDict[str, t.Tuple[datetime, t.Any, int]] = OrderedDict()
+        self.__size = 0
+
+    def _read(self, datanode: DataNode) -> t.Any:
+        last_edit_date = datanode.last_edit_date
+        if last_edit_date is None or self.__max_size <= 0:
+            return datanode.read()
+        with self.__lock:
+            if (cached := self.__values.get(datanode.id)) is not None and cached[0] == last_edit_date:
+                self.__values.move_to_end(datanode.id)
+                return cached[1]
+        value = datanode.read()
+        size = _DataNodeReadCache.__get_size(value)
+        with self.__lock:
+            self.__discard(datanode.id)
+            if size <= self.__max_size:
+                self.__values[datanode.id] = (last_edit_date, value, size)
+                self.__size += size
+                while self.__size > self.__max_size:
+                    _, (_, _, evicted_size) = self.__values.popitem(last=False)
+                    self.__size -= evicted_size
+        return value
+
+    def _invalidate(self, datanode_id: t.Optional[str] = None) -> None:
+        with self.__lock:
+            if datanode_id is None:
+                self.__values.clear()
+                self.__size = 0
+            else:
+                self.__discard(datanode_id)
+
+    def _get_size(self) -> int:
+        return self.__size
+
+    def __discard(self, datanode_id: str) -> None:
+        # Called with the lock held
+        if (cached := self.__values.pop(datanode_id, None)) is not None:
+            self.__size -= cached[2]
+
+    @staticmethod
+    def __get_size(value: t.Any) -> int:
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(deep=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(deep=True))
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, (list, tuple)):
+            return sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value)
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in value.items())
+        return sys.getsizeof(value)
@@ -21,6 +21,7 @@ from taipy.core.exceptions.exceptions import (
     NonExistingScenarioConfig,
     NonExistingSequence,
     NonExistingSequenceConfig,
+    NonExistingSubmission,
     NonExistingTask,
     NonExistingTaskConfig,
 )
@@ -106,3 +107,8 @@ def handle_task_not_found(e):
 @blueprint.errorhandler(NonExistingTaskConfig)
 def handle_task_config_not_found(e):
     return _create_404(e)
+
+
+@blueprint.errorhandler(NonExistingSubmission)
+def handle_submission_not_found(e):
+    return _create_404(e)
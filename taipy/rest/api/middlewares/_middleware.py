@@ -9,26 +9,30 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from functools import wraps
+from functools import lru_cache, wraps
 from importlib import util
 
 from taipy.core.common._utils import _load_fct
 
 
 def _middleware(f):
+    # The function, wrapped by the enterprise middleware when it is installed. Resolved on the first call.
+    resolved = []
+
     @wraps(f)
     def wrapper(*args, **kwargs):
-        if _using_enterprise():
-            return _enterprise_middleware()(f)(*args, **kwargs)
-        else:
-            return f(*args, **kwargs)
+        if not resolved:
+            resolved.append(_enterprise_middleware()(f) if _using_enterprise() else f)
+        return resolved[0](*args, **kwargs)
 
     return wrapper
 
 
+@lru_cache
 def _using_enterprise():
     return util.find_spec("taipy.enterprise") is not None
 
 
+@lru_cache
 def _enterprise_middleware():
     return _load_fct("taipy.enterprise.rest.api.middlewares._middleware", "_middleware")
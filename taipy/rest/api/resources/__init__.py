@@ -14,6 +14,7 @@ from .datanode import DataNodeList, DataNodeReader, DataNodeResource, DataNodeWr
 from .job import JobExecutor, JobList, JobResource
 from .scenario import ScenarioExecutor, ScenarioList, ScenarioResource
 from .sequence import SequenceExecutor, SequenceList, SequenceResource
+from .submission import SubmissionResource
 from .task import TaskExecutor, TaskList, TaskResource
 
 __all__ = [
@@ -35,4 +36,5 @@ __all__ = [
     "JobResource",
     "JobList",
     "JobExecutor",
+    "SubmissionResource",
 ]
@@ -19,6 +19,7 @@ from taipy.core.common.frequency import Frequency
 from taipy.core.cycle._cycle_manager_factory import _CycleManagerFactory
 from taipy.core.exceptions.exceptions import NonExistingCycle
 
+from ...commons.pagination import build_filters, extract_list_arguments, paginate
 from ...commons.to_from_model import _to_model
 from ..middlewares._middleware import _middleware
 from ..schemas import CycleResponseSchema, CycleSchema
@@ -287,6 +288,26 @@ class CycleList(Resource):
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
 
+      arguments:
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of cycles to skip, sorted by id. The default value is 0.
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of cycles to return. All the cycles are returned if not set.
+            The `X-Total-Count` response header holds the number of matching cycles, and the `Link` header
+            the links to the next and previous pages.
+        - in: query
+          name: fields
+          schema:
+            type: string
+          description: A comma-separated list of the fields to return for each of the cycles.
+
       responses:
         200:
           content:
@@ -390,10 +411,11 @@ class CycleList(Resource):
 
     @_middleware
     def get(self):
-        schema = CycleResponseSchema(many=True)
+        arguments = extract_list_arguments()
         manager = _CycleManagerFactory._build_manager()
-        cycles = [_to_model(REPOSITORY, cycle) for cycle in manager._get_all()]
-        return schema.dump(cycles)
+        filters = build_filters(manager, arguments, has_config_id=False)
+        cycles, total = manager._get_page(arguments["offset"], arguments["limit"], filters)
+        return paginate([_to_model(REPOSITORY, cycle) for cycle in cycles], total, arguments, CycleResponseSchema)
 
     @_middleware
     def post(self):
@@ -15,13 +15,23 @@ import numpy as np
 import pandas as pd
 from flask import request
 from flask_restful import Resource
+from marshmallow import ValidationError
 
 from taipy.common.config import Config
 from taipy.core import DataNode
 from taipy.core.data._data_manager_factory import _DataManagerFactory
+from taipy.core.data._filter import _FilterDataNode
 from taipy.core.data.operator import Operator
 from taipy.core.exceptions.exceptions import NonExistingDataNode, NonExistingDataNodeConfig
 
+from ...commons.data_formats import (
+    CHUNK_SIZE,
+    JSON,
+    extract_read_arguments,
+    negotiate_data_format,
+    stream_data,
+)
+from ...commons.pagination import build_filters, extract_list_arguments, paginate
 from ...commons.to_from_model import _to_model
 from ..exceptions.exceptions import ConfigIdMissingException
 from ..middlewares._middleware import _middleware
@@ -362,6 +372,36 @@ class DataNodeList(Resource):
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
 
+      arguments:
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of data nodes to skip, sorted by id. The default value is 0.
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of data nodes to return. All the data nodes are returned if not set.
+            The `X-Total-Count` response header holds the number of matching data nodes, and the `Link` header
+            the links to the next and previous pages.
+        - in: query
+          name: fields
+          schema:
+            type: string
+          description: A comma-separated list of the fields to return for each of the data nodes.
+        - in: query
+          name: config_id
+          schema:
+            type: string
+          description: Only return the data nodes created from this configuration.
+        - in: query
+          name: version
+          schema:
+            type: string
+          description: Only return the data nodes of this version.
+
       responses:
         200:
           content:
@@ -463,10 +503,10 @@ class DataNodeList(Resource):
 
     @_middleware
     def get(self):
-        schema = DataNodeSchema(many=True)
+        arguments = extract_list_arguments()
         manager = _DataManagerFactory._build_manager()
-        datanodes = [_to_model(REPOSITORY, datanode) for datanode in manager._get_all()]
-        return schema.dump(datanodes)
+        datanodes, total = manager._get_page(arguments["offset"], arguments["limit"], build_filters(manager, arguments))
+        return paginate([_to_model(REPOSITORY, datanode) for datanode in datanodes], total, arguments, DataNodeSchema)
 
     @_middleware
     def post(self):
@@ -545,6 +585,11 @@ class DataNodeReader(Resource):
                     ]}
                 ```
 
+        The format of the response is negotiated with the *Accept* header: `application/json` (the default),
+        `application/x-ndjson`, `text/csv`, `application/vnd.apache.arrow.stream` or
+        `application/vnd.apache.parquet`. All the formats but JSON are streamed by chunks of rows. The Arrow and
+        Parquet formats require the `pyarrow` package.
+
         !!! Note
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
@@ -555,6 +600,21 @@ class DataNodeReader(Resource):
           schema:
             type: string
           description: The id of the data node to read.
+        - in: query
+          name: columns
+          schema:
+            type: string
+          description: A comma-separated list of the columns to read. All the columns are read if not set.
+        - in: query
+          name: start
+          schema:
+            type: integer
+          description: The index of the first row to read. The default value is 0.
+        - in: query
+          name: stop
+          schema:
+            type: integer
+          description: The index of the row to stop reading at (excluded). The rows are read to the end if not set.
       requestBody:
         content:
           application/json:
@@ -570,6 +630,12 @@ class DataNodeReader(Resource):
                   data:
                     type: Any
                     description: The data read from the data node.
+            application/x-ndjson: {}
+            text/csv: {}
+            application/vnd.apache.arrow.stream: {}
+            application/vnd.apache.parquet: {}
+        400:
+          description: Some of the requested columns do not exist.
         404:
           description: No data node has the *datanode_id* identifier.
     """
@@ -593,7 +659,24 @@ class DataNodeReader(Resource):
         data = request.get_json(silent=True)
         data_node = _get_or_raise(datanode_id)
         operators = self.__make_operators(schema.load(data)) if data else []
-        data = data_node.filter(operators)
+        arguments = extract_read_arguments()
+        data_format = negotiate_data_format()
+        if data_format == JSON and arguments == {"columns": None, "start": 0, "stop": None}:
+            data = data_node.filter(operators)
+        else:
+            columns, start, stop = arguments["columns"], arguments["start"], arguments["stop"]
+            chunk_size = None if data_format == JSON else CHUNK_SIZE
+            if operators:
+                chunks = _FilterDataNode._iter_chunks(data_node.filter(operators), columns, start, stop, chunk_size)
+            else:
+                # Data nodes that support it only read the requested rows and columns
+                chunks = data_node._read_chunks(columns, start, stop, chunk_size)
+            try:
+                data = next(chunks, None)
+            except (KeyError, ValueError) as e:
+                raise ValidationError({"columns": [str(e)]}) from None
+            if data_format != JSON:
+                return stream_data(data, chunks, data_format)
         if isinstance(data, pd.DataFrame):
             data = data.to_dict(orient="records")
         elif isinstance(data, np.ndarray):
@@ -21,6 +21,7 @@ from taipy.core.exceptions.exceptions import NonExistingJob, NonExistingTaskConf
 from taipy.core.job._job_manager_factory import _JobManagerFactory
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
+from ...commons.pagination import build_filters, extract_list_arguments, paginate
 from ..exceptions.exceptions import ConfigIdMissingException
 from ..middlewares._middleware import _middleware
 from ..schemas import JobSchema
@@ -145,6 +146,31 @@ class JobList(Resource):
           curl -X GET http://localhost:5000/api/v1/jobs
         ```
 
+      arguments:
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of jobs to skip, sorted by id. The default value is 0.
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of jobs to return. All the jobs are returned if not set.
+            The `X-Total-Count` response header holds the number of matching jobs, and the `Link` header
+            the links to the next and previous pages.
+        - in: query
+          name: fields
+          schema:
+            type: string
+          description: A comma-separated list of the fields to return for each of the jobs.
+        - in: query
+          name: version
+          schema:
+            type: string
+          description: Only return the jobs of this version.
+
       responses:
         200:
           content:
@@ -204,10 +230,11 @@ class JobList(Resource):
 
     @_middleware
     def get(self):
-        schema = JobSchema(many=True)
+        arguments = extract_list_arguments()
         manager = _JobManagerFactory._build_manager()
-        jobs = manager._get_all()
-        return schema.dump(jobs)
+        filters = build_filters(manager, arguments, has_config_id=False)
+        jobs, total = manager._get_page(arguments["offset"], arguments["limit"], filters)
+        return paginate(jobs, total, arguments, JobSchema)
 
     @_middleware
     def post(self):
@@ -17,6 +17,8 @@ from taipy.core import Scenario
 from taipy.core.exceptions.exceptions import NonExistingScenario, NonExistingScenarioConfig
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
 
+from ...commons.pagination import build_filters, extract_list_arguments, paginate
+from ...commons.submission_tracker import _SubmissionTracker
 from ...commons.to_from_model import _to_model
 from ..exceptions.exceptions import ConfigIdMissingException
 from ..middlewares._middleware import _middleware
@@ -311,6 +313,36 @@ class ScenarioList(Resource):
             When the authorization feature is activated (available in Taipy Enterprise edition only), this endpoint
             requires the `TAIPY_READER` role.
 
+      arguments:
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of scenarios to skip, sorted by id. The default value is 0.
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of scenarios to return. All the scenarios are returned if not set.
+            The `X-Total-Count` response header holds the number of matching scenarios, and the `Link` header
+            the links to the next and previous pages.
+        - in: query
+          name: fields
+          schema:
+            type: string
+          description: A comma-separated list of the fields to return for each of the scenarios.
+        - in: query
+          name: config_id
+          schema:
+            type: string
+          description: Only return the scenarios created from this configuration.
+        - in: query
+          name: version
+          schema:
+            type: string
+          description: Only return the scenarios of this version.
+
       responses:
         200:
           content:
@@ -423,10 +455,12 @@ class ScenarioList(Resource):
 
     @_middleware
     def get(self):
-        schema = ScenarioResponseSchema(many=True)
+        arguments = extract_list_arguments()
         manager = _ScenarioManagerFactory._build_manager()
-        scenarios = [_to_model(REPOSITORY, scenario) for scenario in manager._get_all()]
-        return schema.dump(scenarios)
+        scenarios, total = manager._get_page(arguments["offset"], arguments["limit"], build_filters(manager, arguments))
+        return paginate(
+            [_to_model(REPOSITORY, scenario) for scenario in scenarios], total, arguments, ScenarioResponseSchema
+        )
 
     @_middleware
     def post(self):
@@ -472,7 +506,7 @@ class ScenarioExecutor(Resource):
 
                 Here is the output message example:
                 ```
-                {"message": "Executed scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c."}
+                {"message": "Scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c was submitted.", "submission": {}}
                 ```
 
             === "Python"
@@ -491,7 +525,7 @@ class ScenarioExecutor(Resource):
                 Here is the output example:
                 ```
                 <Response [202]>
-                {"message": "Executed scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c."}
+                {"message": "Scenario SCENARIO_63cb358d-5834-4d73-84e4-a6343df5e08c was submitted.", "submission": {}}
                 ```
 
         !!! Note
@@ -514,7 +548,9 @@ class ScenarioExecutor(Resource):
                   message:
                     type: string
                     description: Status message.
-                  scenario: ScenarioSchema
+                  submission:
+                    type: object
+                    description: The status of the submission and of its jobs, as returned by the submissions endpoint.
         404:
           description: No scenario has the *scenario_id* identifier.
     """
@@ -526,5 +562,10 @@ class ScenarioExecutor(Resource):
     def post(self, scenario_id):
         _get_or_raise(scenario_id)
         manager = _ScenarioManagerFactory._build_manager()
-        manager._submit(scenario_id)
-        return {"message": f"Scenario {scenario_id} was submitted."}
+        # Started before the submission so that none of its events are missed
+        tracker = _SubmissionTracker._get_instance()
+        submission = manager._submit(scenario_id)
+        return {
+            "message": f"Scenario {scenario_id} was submitted.",
+            "submission": tracker._track(submission),
+        }
@@ -12,12 +12,15 @@
 
 from flask import request
 from flask_restful import Resource
+from marshmallow import ValidationError
 
 from taipy.core import Sequence
 from taipy.core.exceptions.exceptions import NonExistingScenario, NonExistingSequence
 from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
 from taipy.core.sequence._sequence_manager_factory import _SequenceManagerFactory
 
+from ...commons.pagination import extract_list_arguments, paginate
+from ...commons.submission_tracker import _SubmissionTracker
 from ...commons.to_from_model import _to_model
 from ..exceptions.exceptions import ScenarioIdMissingException, SequenceNameMissingException
 from ..middlewares._middleware import _middleware
@@ -146,6 +149,31 @@ class SequenceList(Resource):
           curl -X GET http://localhost:5000/api/v1/sequences
         ```
 
+      arguments:
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of sequences to skip, sorted by id. The default value is 0.
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of sequences to return. All the sequences are returned if not set.
+            The `X-Total-Count` response header holds the number of matching sequences, and the `Link` header
+            the links to the next and previous pages.
+        - in: query
+          name: fields
+          schema:
+            type: string
+          description: A comma-separated list of the fields to return for each of the sequences.
+        - in: query
+          name: version
+          schema:
+            type: string
+          description: Only return the sequences of this version.
+
       responses:
         200:
           content:
@@ -209,10 +237,17 @@ class SequenceList(Resource):
 
     @_middleware
     def get(self):
-        schema = SequenceResponseSchema(many=True)
+        arguments = extract_list_arguments()
+        if arguments["config_id"]:
+            raise ValidationError({"config_id": ["These entities have no config id."]})
         manager = _SequenceManagerFactory._build_manager()
-        sequences = [_to_model(REPOSITORY, sequence) for sequence in manager._get_all()]
-        return schema.dump(sequences)
+        # Sequences are stored in their scenarios: the page is taken from all the sequences of the version
+        sequences = sorted(manager._get_all(arguments["version"]), key=lambda sequence: sequence.id)
+        offset, limit = arguments["offset"], arguments["limit"]
+        page = sequences[offset:] if limit is None else sequences[offset : offset + limit]
+        return paginate(
+            [_to_model(REPOSITORY, sequence) for sequence in page], len(sequences), arguments, SequenceResponseSchema
+        )
 
     @_middleware
     def post(self):
@@ -276,7 +311,9 @@ class SequenceExecutor(Resource):
                   message:
                     type: string
                     description: Status message.
-                  sequence: SequenceSchema
+                  submission:
+                    type: object
+                    description: The status of the submission and of its jobs, as returned by the submissions endpoint.
         404:
             description: No sequence has the *sequence_id* identifier.
     """
@@ -288,5 +325,10 @@ class SequenceExecutor(Resource):
     def post(self, sequence_id):
         _get_or_raise(sequence_id)
         manager = _SequenceManagerFactory._build_manager()
-        manager._submit(sequence_id)
-        return {"message": f"Sequence {sequence_id} was submitted."}
+        # Started before the submission so that none of its events are missed
+        tracker = _SubmissionTracker._get_instance()
+        submission = manager._submit(sequence_id)
+        return {
+            "message": f"Sequence {sequence_id} was submitted.",
+            "submission": tracker._track(submission),
+        }
@@ -0,0 +1,148 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+from typing import Iterator, Optional
+
+from flask import Response, request, stream_with_context
+from flask_restful import Resource
+from marshmallow import EXCLUDE, Schema, fields, validate
+
+from taipy.core.exceptions.exceptions import NonExistingSubmission
+
+from ...commons.submission_tracker import _SubmissionTracker
+from ..middlewares._middleware import _middleware
+
+EVENT_STREAM = "text/event-stream"
+
+# Longest time a request waits for a change of the submission
+MAX_TIMEOUT = 30
+# Time after which an empty comment is sent on an event stream to keep the connection alive
+KEEP_ALIVE_INTERVAL = 15
+
+
+class WaitArgumentsSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    since = fields.Integer(load_default=None, validate=validate.Range(min=0))
+    timeout = fields.Float(load_default=0, validate=validate.Range(min=0, max=MAX_TIMEOUT))
+
+
+class SubmissionResource(Resource):
+    """Single object resource
+
+    ---
+    get:
+      tags:
+        - api
+      summary: Get the status of a submission.
+      description: |
+        Return the status of a submission and of its jobs by *submission_id*. If the submission does not exist,
+        a 404 error is returned.
+
+        The statuses are kept up to date from the Core events: the submission is not read from the repository
+        on each request. Each change of the submission increments its *version*.
+
+        - When *since* is set, the request waits until the version of the submission is greater than *since*,
+          the submission is finished, or *timeout* seconds have passed (long polling).
+        - When the *Accept* header is `text/event-stream`, the changes are sent as server-sent events until the
+          submission is finished.
+
+        !!! Note
+          When the authorization feature is activated (available in the **Enterprise** edition only), the
+          endpoint requires `TAIPY_READER` role.
+
+        Code example:
+
+        ```shell
+          curl -X GET "http://localhost:5000/api/v1/submissions/SUBMISSION_ce1f5c54-6c1e-4a4b/?since=3&timeout=20"
+          curl -N -H "Accept: text/event-stream" http://localhost:5000/api/v1/submissions/SUBMISSION_ce1f5c54-6c1e-4a4b/
+        ```
+
+      arguments:
+        - in: path
+          name: submission_id
+          schema:
+            type: string
+          description: The identifier of the submission.
+        - in: query
+          name: since
+          schema:
+            type: integer
+          description: The version of the submission known by the client.
+        - in: query
+          name: timeout
+          schema:
+            type: number
+          description: The maximum time to wait for a change, in seconds (30 at most, 0 by default).
+      responses:
+        200:
+          content:
+            application/json:
+              schema:
+                type: object
+                properties:
+                  submission:
+                    type: object
+                    properties:
+                      id:
+                        type: string
+                      status:
+                        type: string
+                      jobs:
+                        type: object
+                        description: The status of each job, by job id.
+                      is_finished:
+                        type: boolean
+                      version:
+                        type: integer
+            text/event-stream:
+              schema:
+                type: string
+        404:
+          description: No submission has the *submission_id* identifier.
+    """
+
+    def __init__(self, **kwargs):
+        self.logger = kwargs.get("logger")
+
+    @_middleware
+    def get(self, submission_id):
+        arguments = WaitArgumentsSchema().load(request.args)
+        tracker = _SubmissionTracker._get_instance()
+        if request.accept_mimetypes.best == EVENT_STREAM:
+            since = arguments["since"]
+            if (last_event_id := request.headers.get("Last-Event-ID", "")).isdigit():
+                since = int(last_event_id)
+            # Raise a 404 before the response starts
+            tracker._get(submission_id)
+            return Response(
+                stream_with_context(_generate_events(tracker, submission_id, since)),
+                mimetype=EVENT_STREAM,
+                headers={"Cache-Control": "no-cache"},
+            )
+        return {"submission": tracker._wait(submission_id, arguments["since"], arguments["timeout"])}
+
+
+def _generate_events(tracker: _SubmissionTracker, submission_id: str, since: Optional[int]) -> Iterator[str]:
+    while True:
+        try:
+            state = tracker._wait(submission_id, since, KEEP_ALIVE_INTERVAL)
+        except NonExistingSubmission:
+            return
+        if since is None or state["version"] > since:
+            since = state["version"]
+            yield f"id: {since}\nevent: submission\ndata: {json.dumps(state)}\n\n"
+        else:
+            yield ": keep-alive\n\n"
+        if state["is_finished"]:
+            return
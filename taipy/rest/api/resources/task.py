@@ -17,6 +17,8 @@ from taipy.core import Task
 from taipy.core.exceptions.exceptions import NonExistingTask, NonExistingTaskConfig
 from taipy.core.task._task_manager_factory import _TaskManagerFactory
 
+from ...commons.pagination import build_filters, extract_list_arguments, paginate
+from ...commons.submission_tracker import _SubmissionTracker
 from ...commons.to_from_model import _to_model
 from ..exceptions.exceptions import ConfigIdMissingException
 from ..middlewares._middleware import _middleware
@@ -144,6 +146,36 @@ class TaskList(Resource):
           curl -X GET http://localhost:5000/api/v1/tasks
         ```
 
+      arguments:
+        - in: query
+          name: offset
+          schema:
+            type: integer
+          description: The number of tasks to skip, sorted by id. The default value is 0.
+        - in: query
+          name: limit
+          schema:
+            type: integer
+          description: |
+            The maximum number of tasks to return. All the tasks are returned if not set.
+            The `X-Total-Count` response header holds the number of matching tasks, and the `Link` header
+            the links to the next and previous pages.
+        - in: query
+          name: fields
+          schema:
+            type: string
+          description: A comma-separated list of the fields to return for each of the tasks.
+        - in: query
+          name: config_id
+          schema:
+            type: string
+          description: Only return the tasks created from this configuration.
+        - in: query
+          name: version
+          schema:
+            type: string
+          description: Only return the tasks of this version.
+
       responses:
         200:
           content:
@@ -202,10 +234,10 @@ class TaskList(Resource):
 
     @_middleware
     def get(self):
-        schema = TaskSchema(many=True)
+        arguments = extract_list_arguments()
         manager = _TaskManagerFactory._build_manager()
-        tasks = [_to_model(REPOSITORY, task) for task in manager._get_all()]
-        return schema.dump(tasks)
+        tasks, total = manager._get_page(arguments["offset"], arguments["limit"], build_filters(manager, arguments))
+        return paginate([_to_model(REPOSITORY, task) for task in tasks], total, arguments, TaskSchema)
 
     @_middleware
     def post(self):
@@ -262,7 +294,9 @@ class TaskExecutor(Resource):
                   message:
                     type: string
                     description: Status message.
-                  task: TaskSchema
+                  submission:
+                    type: object
+                    description: The status of the submission and of its jobs, as returned by the submissions endpoint.
         404:
           description: No task has the *task_id* identifier.
     """
@@ -274,5 +308,10 @@ class TaskExecutor(Resource):
     def post(self, task_id):
         manager = _TaskManagerFactory._build_manager()
         task = _get_or_raise(task_id)
-        manager._orchestrator().submit_task(task)
-        return {"message": f"Task {task_id} was submitted."}
+        # Started before the submission so that none of its events are missed
+        tracker = _SubmissionTracker._get_instance()
+        submission = manager._orchestrator().submit_task(task)
+        return {
+            "message": f"Task {task_id} was submitted.",
+            "submission": tracker._track(submission),
+        }
@@ -13,6 +13,7 @@ from flask import Blueprint, current_app
 from flask_restful import Api
 
 from taipy.common.logger._taipy_logger import _TaipyLogger
+from taipy.core._manager._entity_cache import _EntityCache
 from taipy.core.common._utils import _load_fct
 
 from ..extensions import apispec
@@ -33,6 +34,7 @@ from .resources import (
     SequenceExecutor,
     SequenceList,
     SequenceResource,
+    SubmissionResource,
     TaskExecutor,
     TaskList,
     TaskResource,
@@ -46,6 +48,18 @@ blueprint = Blueprint("api", __name__, url_prefix="/api/v1")
 
 api = Api(blueprint)
 
+
+@blueprint.before_request
+def _open_entity_cache():
+    # The entities a request reads several times are loaded once
+    _EntityCache._open()
+
+
+@blueprint.teardown_request
+def _close_entity_cache(exception=None):
+    _EntityCache._close()
+
+
 api.add_resource(
     DataNodeResource,
     "/datanodes/<string:datanode_id>/",
@@ -154,6 +168,13 @@ api.add_resource(
     resource_class_kwargs={"logger": _logger},
 )
 
+api.add_resource(
+    SubmissionResource,
+    "/submissions/<string:submission_id>/",
+    endpoint="submission_by_id",
+    resource_class_kwargs={"logger": _logger},
+)
+
 
 def load_enterprise_resources(api: Api):
     """
@@ -200,6 +221,8 @@ def register_views():
     apispec.spec.path(view=JobList, app=current_app)
     apispec.spec.path(view=JobExecutor, app=current_app)
 
+    apispec.spec.path(view=SubmissionResource, app=current_app)
+
     apispec.spec.components.schema(
         "Any",
         {
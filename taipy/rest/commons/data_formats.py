@@ -0,0 +1,185 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Formats in which the data of a data node can be returned.
+
+The format is negotiated with the *Accept* header of the request:
+
+- `application/json` (the default): the data is returned as a JSON object.
+- `application/x-ndjson`: one JSON document per row, streamed.
+- `text/csv`: the rows as CSV, streamed.
+- `application/vnd.apache.arrow.stream`: an Arrow IPC stream, streamed by record batch.
+- `application/vnd.apache.parquet`: a Parquet file, streamed by row group.
+
+The Arrow and Parquet formats require the `pyarrow` package.
+"""
+
+import io
+import json
+from importlib import util
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+from flask import Response, request, stream_with_context
+from marshmallow import EXCLUDE, Schema, fields, validate
+from werkzeug.exceptions import NotAcceptable
+
+from .encoder import _CustomEncoder
+
+JSON = "application/json"
+NDJSON = "application/x-ndjson"
+CSV = "text/csv"
+ARROW = "application/vnd.apache.arrow.stream"
+PARQUET = "application/vnd.apache.parquet"
+
+_STREAMED_FORMATS = [NDJSON, CSV, ARROW, PARQUET]
+_ARROW_FORMATS = [ARROW, PARQUET]
+
+# Number of rows read, converted and sent at a time
+CHUNK_SIZE = 10_000
+
+
+class ReadArgumentsSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    columns = fields.String(load_default=None)
+    start = fields.Integer(load_default=0, validate=validate.Range(min=0))
+    stop = fields.Integer(load_default=None, validate=validate.Range(min=0))
+
+
+def extract_read_arguments() -> Dict[str, Any]:
+    arguments = ReadArgumentsSchema().load(request.args)
+    columns = arguments["columns"]
+    arguments["columns"] = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+    return arguments
+
+
+def negotiate_data_format() -> str:
+    """Return the format to send the data in, from the *Accept* header of the request."""
+    if not request.accept_mimetypes.provided:
+        return JSON
+    data_format = request.accept_mimetypes.best_match([JSON] + _STREAMED_FORMATS)
+    if data_format is None:
+        raise NotAcceptable(f"The data can be returned as {', '.join([JSON] + _STREAMED_FORMATS)}.")
+    if data_format in _ARROW_FORMATS and util.find_spec("pyarrow") is None:
+        raise NotAcceptable(f"The pyarrow package is required to return the data as {data_format}.")
+    return data_format
+
+
+def stream_data(first_chunk: Any, chunks: Iterator[Any], data_format: str) -> Response:
+    """Build a response that sends the chunks of data one at a time in *data_format*.
+
+    The first chunk is given apart so that it can be checked before the response starts.
+    """
+    if data_format != NDJSON and first_chunk is not None:
+        first_chunk = _to_dataframe(first_chunk)
+    all_chunks = _iter_all(first_chunk, chunks)
+    if data_format == NDJSON:
+        generator = _to_ndjson(all_chunks)
+    elif data_format == CSV:
+        generator = _to_csv(all_chunks)
+    else:
+        generator = _to_arrow(all_chunks, data_format == PARQUET)
+    return Response(stream_with_context(generator), mimetype=data_format)
+
+
+def _iter_all(first_chunk: Any, chunks: Iterator[Any]) -> Iterator[Any]:
+    if first_chunk is not None:
+        yield first_chunk
+        yield from chunks
+
+
+def _to_dataframe(chunk: Any) -> pd.DataFrame:
+    if isinstance(chunk, pd.DataFrame):
+        return chunk
+    if isinstance(chunk, pd.Series):
+        return chunk.to_frame()
+    if isinstance(chunk, (np.ndarray, List)):
+        return pd.DataFrame(chunk)
+    raise NotAcceptable("Only tabular data can be returned in this format.")
+
+
+def _to_ndjson(chunks: Iterable[Any]) -> Iterator[str]:
+    for chunk in chunks:
+        if isinstance(chunk, pd.DataFrame):
+            rows: Iterable[Any] = chunk.to_dict(orient="records")
+        elif isinstance(chunk, (pd.Series, np.ndarray)):
+            rows = chunk.tolist()
+        elif isinstance(chunk, List):
+            rows = chunk
+        else:
+            rows = [chunk]
+        yield "".join(json.dumps(row, cls=_CustomEncoder) + "\n" for row in rows)
+
+
+def _to_csv(chunks: Iterable[Any]) -> Iterator[str]:
+    header = True
+    for chunk in chunks:
+        yield _to_dataframe(chunk).to_csv(index=False, header=header)
+        header = False
+
+
+def _to_arrow(chunks: Iterable[Any], parquet: bool) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    sink = _Sink()
+    writer: Optional[Any] = None
+    schema = None
+    for chunk in chunks:
+        table = pa.Table.from_pandas(_to_dataframe(chunk), preserve_index=False)
+        if writer is None:
+            schema = table.schema
+            writer = pq.ParquetWriter(sink, schema) if parquet else pa.ipc.new_stream(sink, schema)
+        else:
+            # The types inferred for a chunk may differ from the ones of the first chunk
+            table = table.cast(schema)
+        writer.write_table(table)
+        yield sink._flush()
+    if writer is not None:
+        writer.close()
+        yield sink._flush()
+
+
+class _Sink(io.RawIOBase):
+    """A write-only file that hands over the bytes written so far when flushed.
+
+    The position is the number of bytes written since the file was created, as the Parquet
+    writer relies on it.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__buffers: List[bytes] = []
+        self.__position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore[override]
+        data = bytes(b)
+        self.__buffers.append(data)
+        self.__position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.__position
+
+    def close(self) -> None:
+        # The writers close their sink, the pending bytes must still be flushed
+        pass
+
+    def _flush(self) -> bytes:
+        data = b"".join(self.__buffers)
+        self.__buffers = []
+        return data
@@ -9,42 +9,80 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-"""Simple helper to paginate query
+"""Helpers to page, filter and select the fields of the list endpoints.
+
+The list endpoints accept the following query parameters:
+
+- *offset*: the number of entities to skip. The default value is 0.
+- *limit*: the maximum number of entities to return. All the entities are returned if not set.
+- *fields*: a comma-separated list of the fields to return for each entity.
+- *config_id*: only return the entities created from this configuration.
+- *version*: only return the entities of this version.
+
+The entities are sorted by id. The response holds the number of matching entities in the
+`X-Total-Count` header and, when *limit* is set, the links to the next and previous pages
+in the `Link` header.
 """
+
+from typing import Any, Dict, List, Tuple
+
 from flask import request, url_for
+from marshmallow import EXCLUDE, Schema, ValidationError, fields, validate
+
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+class ListArgumentsSchema(Schema):
+    class Meta:
+        unknown = EXCLUDE
+
+    offset = fields.Integer(load_default=0, validate=validate.Range(min=0))
+    limit = fields.Integer(load_default=None, validate=validate.Range(min=0))
+    only = fields.String(data_key="fields", load_default=None)
+    config_id = fields.String(load_default=None)
+    version = fields.String(load_default=None)
+
+
+def extract_list_arguments() -> Dict[str, Any]:
+    return ListArgumentsSchema().load(request.args)
+
+
+def build_filters(manager, arguments: Dict[str, Any], has_config_id: bool = True) -> List[Dict]:
+    """Build the repository filters from the *config_id* and *version* arguments."""
+    filters: List[Dict] = []
+    if hasattr(manager, "_build_filters_with_version"):
+        filters = manager._build_filters_with_version(arguments["version"])
+    elif arguments["version"] is not None:
+        raise ValidationError({"version": ["These entities are not versioned."]})
+    if config_id := arguments["config_id"]:
+        if not has_config_id:
+            raise ValidationError({"config_id": ["These entities have no config id."]})
+        filters = [{**_filter, "config_id": config_id} for _filter in filters] or [{"config_id": config_id}]
+    return filters
+
+
+def paginate(
+    models: List[Any], total: int, arguments: Dict[str, Any], schema_type: type
+) -> Tuple[Any, int, Dict[str, str]]:
+    """Build the response of a list endpoint from the models of the requested page."""
+    only = [f.strip() for f in arguments["only"].split(",") if f.strip()] if arguments["only"] else None
+    try:
+        schema = schema_type(many=True, only=only)
+    except ValueError as e:
+        raise ValidationError({"fields": [str(e)]}) from None
+    headers = {TOTAL_COUNT_HEADER: str(total)}
+    if (limit := arguments["limit"]) is not None:
+        offset = arguments["offset"]
+        links = []
+        if offset + limit < total:
+            links.append(f'<{_page_url(offset + limit, limit)}>; rel="next"')
+        if offset > 0:
+            links.append(f'<{_page_url(max(offset - limit, 0), limit)}>; rel="prev"')
+        if links:
+            headers["Link"] = ", ".join(links)
+    return schema.dump(models), 200, headers
+
 
-DEFAULT_PAGE_SIZE = 50
-DEFAULT_PAGE_NUMBER = 1
-
-
-def extract_pagination(page=None, per_page=None, **request_args):
-    page = int(page) if page is not None else DEFAULT_PAGE_NUMBER
-    per_page = int(per_page) if per_page is not None else DEFAULT_PAGE_SIZE
-    return page, per_page, request_args
-
-
-def paginate(query, schema):
-    page, per_page, other_request_args = extract_pagination(**request.args)
-    page_obj = query.paginate(page=page, per_page=per_page)
-    next_ = url_for(
-        request.endpoint,
-        page=page_obj.next_num if page_obj.has_next else page_obj.page,
-        per_page=per_page,
-        **other_request_args,
-        **request.view_args
-    )
-    prev = url_for(
-        request.endpoint,
-        page=page_obj.prev_num if page_obj.has_prev else page_obj.page,
-        per_page=per_page,
-        **other_request_args,
-        **request.view_args
-    )
-
-    return {
-        "total": page_obj.total,
-        "pages": page_obj.pages,
-        "next": next_,
-        "prev": prev,
-        "results": schema.dump(page_obj.items),
-    }
+def _page_url(offset: int, limit: int) -> str:
+    args = {k: v for k, v in request.args.items() if k not in ("offset", "limit")}
+    return url_for(request.endpoint, offset=offset, limit=limit, **args, **(request.view_args or {}))  # type: ignore
@@ -0,0 +1,213 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from taipy.core import Job, Submission
+from taipy.core.exceptions.exceptions import NonExistingSubmission
+from taipy.core.job.status import Status
+from taipy.core.notification import CoreEventConsumerBase, Event, EventEntityType, EventOperation, Notifier
+from taipy.core.submission._submission_manager_factory import _SubmissionManagerFactory
+from taipy.core.submission.submission_status import SubmissionStatus
+
+_FINISHED_STATUSES = [str(SubmissionStatus.COMPLETED), str(SubmissionStatus.FAILED), str(SubmissionStatus.CANCELED)]
+
+
+class _SubmissionState:
+    def __init__(self, submission_id: str) -> None:
+        self.id = submission_id
+        self.status: Optional[str] = None
+        self.jobs: Dict[str, str] = {}
+        # Incremented on each change so that clients can wait for the next one
+        self.version = 0
+        # False until the submission was read from the repository or from the submit call,
+        # the events may only have told part of the story
+        self.complete = False
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status in _FINISHED_STATUSES
+
+    def _fill(self, submission: Submission, jobs: List[Job]) -> None:
+        # What the events already told is more recent than the snapshot of the submission
+        if self.status is None:
+            self.status = str(submission._submission_status)
+        for job in jobs:
+            self.jobs.setdefault(job.id, str(job._status))
+        self.complete = True
+        self.version += 1
+
+    def _to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "jobs": dict(self.jobs),
+            "is_finished": self.is_finished,
+            "version": self.version,
+        }
+
+
+class _SubmissionTracker(CoreEventConsumerBase):
+    """Statuses of the submissions and of their jobs, kept up to date from the Core events.
+
+    A submission is read from the repository at most once, when it is first requested and was not
+    submitted through the REST API. Clients can then wait for its next change without polling the
+    repository.
+    """
+
+    _MAX_BATCH_SIZE = 100
+    # Finished submissions that are kept, the oldest ones are forgotten first
+    _MAX_FINISHED_SUBMISSIONS = 10_000
+
+    __instance: Optional["_SubmissionTracker"] = None
+    __instance_lock = threading.Lock()
+
+    def __init__(self) -> None:
+        registration_id, queue = Notifier.register(batch=True)
+        super().__init__(registration_id, queue, max_batch_size=self._MAX_BATCH_SIZE)
+        self.__registration_id = registration_id
+        self.__condition = threading.Condition()
+        self.__states: Dict[str, _SubmissionState] = {}
+        self.__finished: OrderedDict[str, None] = OrderedDict()
+
+    @classmethod
+    def _get_instance(cls) -> "_SubmissionTracker":
+        with cls.__instance_lock:
+            if cls.__instance is None:
+                cls.__instance = _SubmissionTracker()
+                cls.__instance.start()
+            return cls.__instance
+
+    @classmethod
+    def _stop_instance(cls) -> None:
+        with cls.__instance_lock:
+            if cls.__instance is not None:
+                cls.__instance.stop()
+                Notifier.unregister(cls.__instance.__registration_id)
+                cls.__instance = None
+
+    def _track(self, submission: Submission, jobs: Optional[List[Job]] = None) -> Dict[str, Any]:
+        """Start tracking a submission and return its state.
+
+        The jobs of the submission are taken from *jobs* if provided, from the submission otherwise.
+        """
+        if jobs is None:
+            jobs = [job for job in submission._jobs if isinstance(job, Job)]
+        with self.__condition:
+            state = self.__get_or_create(submission.id)
+            state._fill(submission, jobs)
+            self.__update_finished(state)
+            self.__condition.notify_all()
+            return state._to_dict()
+
+    def _get(self, submission_id: str) -> Dict[str, Any]:
+        """Return the state of a submission.
+
+        Raises:
+            NonExistingSubmission: If the submission does not exist.
+        """
+        with self.__condition:
+            if (state := self.__states.get(submission_id)) is not None and state.complete:
+                return state._to_dict()
+        if (submission := _SubmissionManagerFactory._build_manager()._get(submission_id)) is None:
+            raise NonExistingSubmission(submission_id)
+        # The jobs are read once, their later changes come from the events
+        return self._track(submission, submission.jobs)
+
+    def _wait(self, submission_id: str, since: Optional[int], timeout: float) -> Dict[str, Any]:
+        """Wait for the state of a submission to change.
+
+        Returns as soon as the version of the state is greater than *since*, when the submission is
+        finished or after *timeout* seconds, whichever comes first.
+
+        Raises:
+            NonExistingSubmission: If the submission does not exist.
+        """
+        state_dict = self._get(submission_id)
+        if since is None or timeout <= 0:
+            return state_dict
+        deadline = time.monotonic() + timeout
+        with self.__condition:
+            state = self.__states.get(submission_id)
+            while state is not None and state.version <= since and not state.is_finished:
+                if (remaining := deadline - time.monotonic()) <= 0:
+                    break
+                self.__condition.wait(remaining)
+                state = self.__states.get(submission_id)
+            return state._to_dict() if state is not None else state_dict
+
+    def process_events(self, events: List[Event]) -> None:
+        with self.__condition:
+            changed = False
+            for event in events:
+                changed = self.__apply(event) or changed
+            if changed:
+                self.__condition.notify_all()
+
+    def process_event(self, event: Event) -> None:
+        self.process_events([event])
+
+    def __apply(self, event: Event) -> bool:
+        # Called with the condition held
+        if event.entity_type == EventEntityType.SUBMISSION and event.entity_id:
+            if event.operation == EventOperation.DELETION:
+                return self.__forget(event.entity_id)
+            if event.operation == EventOperation.CREATION:
+                state = self.__get_or_create(event.entity_id)
+                state.status = state.status or str(SubmissionStatus.SUBMITTED)
+                state.complete = True
+            elif event.operation == EventOperation.UPDATE and event.attribute_name == "submission_status":
+                state = self.__get_or_create(event.entity_id)
+                state.status = str(event.attribute_value)
+            else:
+                return False
+        elif event.entity_type == EventEntityType.JOB and event.entity_id:
+            if not (submission_id := event.metadata.get("submission_id")):
+                return False
+            if event.operation == EventOperation.DELETION:
+                if (state := self.__states.get(submission_id)) is None:
+                    return False
+                state.jobs.pop(event.entity_id, None)
+            elif event.operation == EventOperation.CREATION:
+                state = self.__get_or_create(submission_id)
+                state.jobs.setdefault(event.entity_id, str(Status.SUBMITTED))
+            elif event.operation == EventOperation.UPDATE and event.attribute_name == "status":
+                state = self.__get_or_create(submission_id)
+                state.jobs[event.entity_id] = str(event.attribute_value)
+            else:
+                return False
+        else:
+            return False
+        state.version += 1
+        self.__update_finished(state)
+        return True
+
+    def __get_or_create(self, submission_id: str) -> _SubmissionState:
+        if (state := self.__states.get(submission_id)) is None:
+            state = self.__states[submission_id] = _SubmissionState(submission_id)
+        return state
+
+    def __update_finished(self, state: _SubmissionState) -> None:
+        if not state.is_finished:
+            self.__finished.pop(state.id, None)
+            return
+        self.__finished[state.id] = None
+        self.__finished.move_to_end(state.id)
+        while len(self.__finished) > self._MAX_FINISHED_SUBMISSIONS:
+            submission_id, _ = self.__finished.popitem(last=False)
+            self.__states.pop(submission_id, None)
+
+    def __forget(self, submission_id: str) -> bool:
+        self.__finished.pop(submission_id, None)
+        return self.__states.pop(submission_id, None) is not None
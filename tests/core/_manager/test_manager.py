@@ -13,8 +13,10 @@ import dataclasses
 import pathlib
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, List, Optional, Union
+from unittest import mock
 
 from taipy.common.config import Config
+from taipy.core._manager._entity_cache import _EntityCache
 from taipy.core._manager._manager import _Manager
 from taipy.core._repository._abstract_converter import _AbstractConverter
 from taipy.core._repository._abstract_repository import _AbstractRepository
@@ -143,6 +145,30 @@ class TestManager:
         MockManager._delete(m.id)
         assert MockManager._get(m.id) is None
 
+    def test_get_in_entity_cache(self):
+        m = MockEntity("uuid", "foo")
+        MockManager._set(m)
+        with mock.patch.object(MockRepository, "_load", wraps=MockManager._repository._load) as load_mock:
+            with _EntityCache():
+                fetched = MockManager._get(m.id)
+                assert MockManager._get(m.id) is fetched
+                assert MockManager._exists(m.id)
+                assert load_mock.call_count == 1
+
+                # Saving the entity removes it from the cache
+                MockManager._set(MockEntity("uuid", "bar"))
+                assert MockManager._get(m.id).name == "bar"
+                assert load_mock.call_count == 2
+
+                MockManager._delete(m.id)
+                assert MockManager._get(m.id) is None
+
+            # Nothing is cached outside of the scope
+            MockManager._set(m)
+            MockManager._get(m.id)
+            MockManager._get(m.id)
+            assert load_mock.call_count == 5
+
     def test_delete_all(self):
         objs = []
         for i in range(5):
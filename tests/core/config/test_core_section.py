@@ -102,3 +102,21 @@ def test_clean_config():
 
     assert core_config.force is False
     assert core_config.properties == {}
+
+
+def test_max_data_node_edits():
+    assert Config.core.max_data_node_edits is None
+    Config.configure_core(max_data_node_edits=100)
+    assert Config.core.max_data_node_edits == 100
+
+    toml_config = NamedTemporaryFile(
+        content="""
+[TAIPY]
+
+[CORE]
+max_data_node_edits = "10:int"
+        """
+    )
+    Config.load(toml_config.filename)
+    assert Config.core.max_data_node_edits == 10
+    assert Config.core._to_dict()[CoreSection._MAX_DATA_NODE_EDITS_KEY] == 10
@@ -940,6 +940,53 @@ class TestDataNode:
         assert len(edit_5) == 1
         assert edit_5[EDIT_TIMESTAMP_KEY] == timestamp
 
+    def test_edits_retention(self):
+        Config.configure_core(max_data_node_edits=2)
+        dn_config = Config.configure_data_node("A")
+        data_node = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+
+        for i in range(5):
+            data_node.track_edit(comment=f"edit_{i}")
+        _DataManagerFactory._build_manager()._set(data_node)
+
+        data_node = _DataManager._get(data_node.id)
+        assert [edit[EDIT_COMMENT_KEY] for edit in data_node.edits] == ["edit_3", "edit_4"]
+        assert data_node._count_archived_edits() == 3
+        history = data_node.get_edit_history()
+        assert [edit[EDIT_COMMENT_KEY] for edit in history] == [f"edit_{i}" for i in range(5)]
+        assert isinstance(history[0][EDIT_TIMESTAMP_KEY], datetime)
+
+        # The archived edits are deleted with the data node
+        _DataManager._delete(data_node.id)
+        assert data_node._count_archived_edits() == 0
+
+    def test_edits_archived_once(self):
+        Config.configure_core(max_data_node_edits=2)
+        dn_config = Config.configure_data_node("A")
+        data_node = _DataManager._bulk_get_or_create([dn_config])[dn_config]
+        data_node.track_edit(comment="edit_0")
+        data_node.track_edit(comment="edit_1")
+
+        # The edit is archived but the data node is not saved, the first save is the one of the last edit date
+        repository = type(_DataManagerFactory._build_manager()._repository)
+        with mock.patch.object(repository, "_save", side_effect=[None, OSError]):
+            with pytest.raises(OSError):
+                data_node.track_edit(comment="edit_2")
+        data_node = _DataManager._get(data_node.id)
+        assert data_node._count_archived_edits() == 1
+        data_node.track_edit(comment="edit_2")
+        assert data_node._count_archived_edits() == 1
+        assert [edit[EDIT_COMMENT_KEY] for edit in data_node.get_edit_history()] == ["edit_0", "edit_1", "edit_2"]
+
+        # Two copies of the data node archive the same edit
+        copy_1 = _DataManager._get(data_node.id)
+        copy_2 = _DataManager._get(data_node.id)
+        copy_1.track_edit(comment="edit_3")
+        copy_2.track_edit(comment="edit_4")
+        assert data_node._count_archived_edits() == 2
+        history = data_node.get_edit_history()
+        assert [edit[EDIT_COMMENT_KEY] for edit in history] == ["edit_0", "edit_1", "edit_2", "edit_4"]
+
     def test_normalize_path(self):
         dn = DataNode(
             config_id="foo_bar",
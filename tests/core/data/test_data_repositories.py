@@ -58,6 +58,26 @@ class TestDataNodeRepository:
 
         assert len(data_nodes) == 10
 
+    @pytest.mark.parametrize("repo", [_DataFSRepository])
+    def test_load_page(self, data_node, repo):
+        repository = repo()
+        for i in range(10):
+            data_node.id = DataNodeId(f"data_node-{i}")
+            data_node._owner_id = f"task-{i % 2}"
+            repository._save(data_node)
+
+        data_nodes, total = repository._load_page(offset=2, limit=3)
+        assert [dn.id for dn in data_nodes] == ["data_node-2", "data_node-3", "data_node-4"]
+        assert total == 10
+
+        data_nodes, total = repository._load_page([{"owner_id": "task-1"}], offset=3)
+        assert [dn.id for dn in data_nodes] == ["data_node-7", "data_node-9"]
+        assert total == 5
+
+        data_nodes, total = repository._load_page([{"owner_id": "task-1"}], offset=10, limit=2)
+        assert data_nodes == []
+        assert total == 5
+
     @pytest.mark.parametrize("repo", [_DataFSRepository])
     def test_load_all_with_filters(self, data_node, repo):
         repository = repo()
@@ -114,3 +114,29 @@ def test_read_without_header_custom_exposed_type():
         assert row_pandas[0] == row_custom.id
         assert str(row_pandas[1]) == row_custom.integer
         assert row_pandas[2] == row_custom.text
+
+
+def test_read_chunks_with_header_pandas():
+    csv_data_node_as_pandas = CSVDataNode("bar", Scope.SCENARIO, properties={"path": csv_file_path})
+    chunks = list(csv_data_node_as_pandas._read_chunks(["text", "id"], start=2, stop=9, chunk_size=3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    expected = pd.read_csv(csv_file_path)[["text", "id"]].iloc[2:9].reset_index(drop=True)
+    assert pd.DataFrame.equals(pd.concat(chunks, ignore_index=True), expected)
+
+
+def test_read_chunks_with_header_numpy():
+    csv_data_node_as_numpy = CSVDataNode(
+        "bar", Scope.SCENARIO, properties={"path": csv_file_path, "has_header": True, "exposed_type": "numpy"}
+    )
+    chunks = list(csv_data_node_as_numpy._read_chunks(["integer"], start=8))
+    assert len(chunks) == 1
+    assert np.array_equal(chunks[0], pd.read_csv(csv_file_path)[["integer"]].iloc[8:].to_numpy())
+
+
+def test_read_chunks_without_header():
+    csv_data_node_as_list = CSVDataNode(
+        "baz", Scope.SCENARIO, properties={"path": csv_file_path, "has_header": False, "exposed_type": MyCustomObject}
+    )
+    chunks = list(csv_data_node_as_list._read_chunks(start=9, chunk_size=1))
+    # The data is read entirely then split
+    assert [[row.id for row in chunk] for chunk in chunks] == [["kus458"], ["5kuds458"]]
@@ -105,3 +105,56 @@ def test_core_event_consumer():
     all_evt_csumer_0.stop()
     sc_evt_csumer_1.stop()
     task_creation_evt_csumer_2.stop()
+
+
+class BatchCoreEventConsumerProcessor(CoreEventConsumerBase):
+    def __init__(self, registration_id: str, queue: SimpleQueue, **kwargs):
+        self.batches: list = []
+        super().__init__(registration_id, queue, **kwargs)
+
+    def process_events(self, events):
+        self.batches.append(events)
+
+    def process_event(self, event: Event):
+        pass
+
+
+def test_core_event_consumer_batch_mode():
+    registration_id, registration_queue = Notifier.register(batch=True)
+    consumer = BatchCoreEventConsumerProcessor(registration_id, registration_queue, max_batch_size=10)
+
+    events = [
+        Event(EventEntityType.JOB, EventOperation.UPDATE, "JOB_0", attribute_name="status", attribute_value=i)
+        for i in range(3)
+    ]
+    events.insert(1, Event(EventEntityType.JOB, EventOperation.CREATION, "JOB_1"))
+    events.append(Event(EventEntityType.JOB, EventOperation.UPDATE, "JOB_1", attribute_name="status"))
+    Notifier._publish_batch(events)
+    consumer.start()
+
+    assert_true_after_time(lambda: len(consumer.batches) == 1, time=10)
+    # Only the last update of the status of JOB_0 is kept
+    assert consumer.batches[0] == [events[1], events[3], events[4]]
+    metrics = consumer.get_metrics()
+    assert metrics["processed_events"] == 3
+    assert metrics["coalesced_events"] == 2
+    assert metrics["queue_size"] == 0
+
+    consumer.stop()
+
+
+def test_core_event_consumer_bounded_queue():
+    registration_id, registration_queue = Notifier.register()
+    consumer = AllCoreEventConsumerProcessor(registration_id, registration_queue)
+    consumer._max_queue_size = 2
+    for i in range(5):
+        Notifier.publish(Event(EventEntityType.SCENARIO, EventOperation.CREATION, f"SCENARIO_{i}"))
+    consumer.start()
+
+    # The first event is processed, the oldest events queued after it are discarded
+    assert_true_after_time(lambda: consumer.event_collected == 3, time=10)
+    metrics = consumer.get_metrics()
+    assert metrics["discarded_events"] == 2
+    assert metrics["max_queue_size"] == 4
+
+    consumer.stop()
@@ -280,6 +280,7 @@ def test_job_events():
     assert snapshot.collected_events[1].operation == EventOperation.UPDATE
     assert snapshot.collected_events[1].entity_type == EventEntityType.JOB
     assert snapshot.collected_events[1].metadata.get("task_config_id") == task_config.id
+    assert snapshot.collected_events[1].metadata.get("submission_id") == tp.get_submissions()[0].id
     assert snapshot.collected_events[1].attribute_name == "status"
     assert snapshot.collected_events[1].attribute_value == Status.BLOCKED
 
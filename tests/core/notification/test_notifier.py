@@ -844,3 +844,82 @@ def test_publish_deletion_event():
         and event.attribute_name is None
         for i, event in enumerate(published_events)
     )
+
+
+def test_publish_to_matching_topics_only():
+    topics = [
+        _Topic(),
+        _Topic(EventEntityType.SCENARIO),
+        _Topic(EventEntityType.SCENARIO, "scenario_id"),
+        _Topic(EventEntityType.SCENARIO, "scenario_id", EventOperation.UPDATE),
+        _Topic(EventEntityType.SCENARIO, "scenario_id", EventOperation.UPDATE, "name"),
+        _Topic(entity_id="scenario_id"),
+        _Topic(operation=EventOperation.UPDATE),
+        _Topic(attribute_name="name"),
+        _Topic(EventEntityType.DATA_NODE, operation=EventOperation.CREATION),
+    ]
+    queues = [
+        Notifier.register(topic.entity_type, topic.entity_id, topic.operation, topic.attribute_name)[1]
+        for topic in topics
+    ]
+    events = [
+        Event(EventEntityType.SCENARIO, EventOperation.UPDATE, entity_id="scenario_id", attribute_name="name"),
+        Event(EventEntityType.SCENARIO, EventOperation.UPDATE, entity_id="scenario_id", attribute_name="tags"),
+        Event(EventEntityType.SCENARIO, EventOperation.CREATION, entity_id="scenario_id"),
+        Event(EventEntityType.SCENARIO, EventOperation.DELETION),
+        Event(EventEntityType.DATA_NODE, EventOperation.CREATION, entity_id="dn_id"),
+        Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id="scenario_id", attribute_name="name"),
+    ]
+    for event in events:
+        Notifier.publish(event)
+
+    for topic, queue in zip(topics, queues):
+        received = []
+        while not queue.empty():
+            received.append(queue.get())
+        assert received == [event for event in events if Notifier._is_matching(event, topic)]
+
+
+def test_unregister_after_registrations_reset():
+    registration_id, _ = Notifier.register(EventEntityType.SCENARIO)
+    Notifier._topics_registrations_list = {}
+    Notifier.unregister(registration_id)
+    _, registration_queue = Notifier.register(EventEntityType.SCENARIO)
+    Notifier.publish(Event(EventEntityType.SCENARIO, EventOperation.CREATION, entity_id="scenario_id"))
+    assert registration_queue.qsize() == 1
+    assert len(Notifier._topics_registrations_list) == 1
+
+
+def test_publish_batch():
+    _, queue = Notifier.register(EventEntityType.SCENARIO)
+    _, batch_queue = Notifier.register(EventEntityType.SCENARIO, batch=True)
+    events = [
+        Event(EventEntityType.SCENARIO, EventOperation.UPDATE, entity_id="scenario_id", attribute_name="name"),
+        Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, entity_id="dn_id", attribute_name="name"),
+        Event(EventEntityType.SCENARIO, EventOperation.UPDATE, entity_id="scenario_id", attribute_name="tags"),
+    ]
+    Notifier._publish_batch(events)
+
+    assert queue.qsize() == 2
+    assert [queue.get(), queue.get()] == [events[0], events[2]]
+    assert batch_queue.qsize() == 1
+    assert batch_queue.get() == [events[0], events[2]]
+
+    # Events published out of a batch are not wrapped in a list
+    Notifier.publish(events[0])
+    assert batch_queue.get() == events[0]
+
+
+def test_publish_batch_on_context_manager_exit():
+    scenario_config = Config.configure_scenario("scenario", [])
+    scenario = tp.create_scenario(scenario_config)
+    _, batch_queue = Notifier.register(EventEntityType.SCENARIO, scenario.id, EventOperation.UPDATE, batch=True)
+
+    with scenario as sc:
+        sc.name = "name"
+        sc.properties["key"] = "value"
+        sc.tags = {"tag"}
+
+    assert batch_queue.qsize() == 1
+    # The name is stored in the scenario properties
+    assert [event.attribute_name for event in batch_queue.get()] == ["properties", "properties", "tags"]
@@ -0,0 +1,126 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+import os
+import stat
+
+import pandas as pd
+
+from taipy.gui import Gui, Markdown
+
+
+def _create_clients(gui: Gui, *client_ids: str):
+    flask_client = gui._server.test_client()
+    for client_id in client_ids:
+        gui._bindings()._get_or_create_scope(client_id)
+        flask_client.get(f"/taipy-jsx/test?client_id={client_id}")
+
+
+def test_copy_on_write(gui: Gui):
+    def set_item(state, id):
+        state.d["a"] = 2
+
+    d = {"a": 1, "b": {"c": 3}}
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|Set|button|on_action=set_item|id=my_button|> <|{d.a}|> <|{d.b.c}|>"))
+    gui.run(run_server=False)
+    _create_clients(gui, "c1", "c2")
+    scopes = gui._bindings()._get_all_scopes()
+    # scopes reference the default value until it is modified
+    assert scopes["c1"].d._dict is scopes["c2"].d._dict
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    ws_client.emit("message", {"client_id": "c1", "type": "A", "name": "my_button", "payload": "set_item"})
+    assert scopes["c1"].d._dict == {"a": 2, "b": {"c": 3}}
+    assert scopes["c2"].d._dict == {"a": 1, "b": {"c": 3}}
+    assert d == {"a": 1, "b": {"c": 3}}
+
+
+def test_memory_usage(gui: Gui):
+    df = pd.DataFrame({"x": range(10_000)})
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{df}|table|>"))
+    gui.run(run_server=False)
+    _create_clients(gui, "c1", "c2")
+    usage = gui.get_memory_usage()
+    assert usage["scope_count"] == 2
+    df_size = int(df.memory_usage(deep=True).sum())
+    for client_id in ("c1", "c2"):
+        scope_usage = usage["scopes"][client_id]
+        df_var = next(name for name in scope_usage["variables"] if name.startswith("df"))
+        assert scope_usage["variables"][df_var] == df_size
+        assert scope_usage["shared_size"] >= df_size
+    # the data frame is shared by both scopes and counted once
+    assert df_size <= usage["size"] < 2 * df_size
+    # a value only referenced by one scope is reported in its own size
+    gui._bindings()._get_all_scopes()["c1"].df = pd.DataFrame({"x": range(10_000)})
+    usage = gui.get_memory_usage()
+    assert usage["scopes"]["c1"]["size"] >= df_size
+    assert usage["size"] >= 2 * df_size
+
+
+def test_memory_usage_single_client(gui: Gui):
+    x = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{x}|>"))
+    gui.run(run_server=False, single_client=True)
+    assert gui.get_memory_usage()["scope_count"] == 1
+
+
+def test_spill_idle_scopes(gui: Gui, tmp_path):
+    df = pd.DataFrame({"x": range(100)})
+    d = {"a": 1}  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{df}|table|> <|{d.a}|>"))
+    gui.run(run_server=False)
+    _create_clients(gui, "c1", "c2")
+    scopes = gui._bindings()._get_all_scopes()
+    df_var = next(name for name in vars(scopes["c1"]) if name.startswith("df"))
+    setattr(scopes["c1"], df_var, pd.DataFrame({"x": range(1000)}))
+    assert gui._bindings()._spill_idle_scopes(str(tmp_path), 3600) == []
+    # only the values that are not shared with other scopes are spilled: c2 has none
+    assert gui._bindings()._spill_idle_scopes(str(tmp_path), 0) == ["c1"]
+    assert len(list(tmp_path.iterdir())) == 1
+    assert not hasattr(scopes["c1"], df_var)
+    assert getattr(scopes["c2"], df_var) is df
+    assert gui.get_memory_usage()["spilled_scope_count"] == 1
+    # the scope is restored when it is accessed
+    gui._server.test_client().get("/taipy-jsx/test?client_id=c1")
+    assert getattr(scopes["c1"], df_var)["x"].tolist() == list(range(1000))
+    assert gui.get_memory_usage()["spilled_scope_count"] == 0
+    assert len(list(tmp_path.iterdir())) == 0
+    # the spill file is removed with the scope
+    assert gui._bindings()._spill_idle_scopes(str(tmp_path), 0) == ["c1"]
+    gui._bindings()._delete_scope("c1")
+    assert len(list(tmp_path.iterdir())) == 0
+
+
+def test_spill_to_private_folder(gui: Gui):
+    df = pd.DataFrame({"x": range(100)})  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{df}|table|>"))
+    gui.run(run_server=False)
+    _create_clients(gui, "c1")
+    scopes = gui._bindings()._get_all_scopes()
+    df_var = next(name for name in vars(scopes["c1"]) if name.startswith("df"))
+    setattr(scopes["c1"], df_var, pd.DataFrame({"x": range(1000)}))
+    gui._Gui__spill_idle_states()  # type: ignore[attr-defined]
+    assert gui.get_memory_usage()["spilled_scope_count"] == 1
+    # the spilled states can only be read by the current user
+    folder = gui._Gui__private_state_spill_folder  # type: ignore[attr-defined]
+    assert stat.S_IMODE(os.stat(folder).st_mode) == 0o700
+    files = os.listdir(folder)
+    assert len(files) == 1
+    assert stat.S_IMODE(os.stat(os.path.join(folder, files[0])).st_mode) == 0o600
+    # the spilled states are removed when the application stops
+    gui._Gui__remove_spilled_states()  # type: ignore[attr-defined]
+    assert not os.path.exists(folder)
+    assert gui.get_memory_usage()["spilled_scope_count"] == 0
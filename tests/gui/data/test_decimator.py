@@ -0,0 +1,131 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import numpy
+import pandas
+
+from taipy.gui.data.decimator import LTTB, MinMaxDecimator, ScatterDecimator
+from taipy.gui.data.decimator._pyramid import _DecimationPyramid
+
+
+def _large_dataframe(nb_rows: int = 200_000):
+    x = numpy.arange(nb_rows, dtype=float)
+    return pandas.DataFrame({"x": x, "y": numpy.sin(x / 1000) + numpy.random.default_rng(0).normal(0, 0.1, nb_rows)})
+
+
+def _decimate(decimator, df, relayout=None, version=0):
+    decimator_payload = {"width": 100}
+    if relayout is not None:
+        decimator_payload["relayoutData"] = relayout
+    return decimator._on_decimate_df(
+        df, {"decimator": "d", "chartMode": "lines", "xAxis": "x", "yAxis": "y"}, decimator_payload, version=version
+    )
+
+
+def _get_pyramid(decimator, df):
+    return decimator._Decimator__pyramids[(id(df), "x", "y")][-1]  # type: ignore[attr-defined]
+
+
+def test_pyramid_levels():
+    df = _large_dataframe()
+    pyramid = _DecimationPyramid._build(df["x"], df["y"])
+    assert pyramid is not None
+    assert pyramid.nb_levels > 2
+    positions, level = pyramid._select(None, None, 2000)
+    assert level > 0
+    assert 2000 <= len(positions) < len(df)
+    # the global extrema are always kept
+    assert df["y"].idxmax() in positions
+    assert df["y"].idxmin() in positions
+    positions, level = pyramid._select(1000.0, 1500.0, 2000)
+    assert level == 0
+    assert positions == slice(1001, 1500)
+
+
+def test_pyramid_unsupported_data():
+    df = _large_dataframe(2000)
+    assert _DecimationPyramid._build(df["x"][::-1], df["y"]) is None
+    assert _DecimationPyramid._build(df["x"].astype(str), df["y"]) is None
+    df.loc[1000, "x"] = numpy.nan
+    assert _DecimationPyramid._build(df["x"], df["y"]) is None
+
+
+def test_pyramid_datetime_range():
+    df = pandas.DataFrame(
+        {"x": pandas.date_range("2020-01-01", periods=100_000, freq="min"), "y": numpy.arange(100_000)}
+    )
+    pyramid = _DecimationPyramid._build(df["x"], df["y"])
+    assert pyramid is not None
+    positions, _ = pyramid._select("2020-01-01 01:00:00", "2020-01-01 02:00:00", 100)
+    assert positions == slice(61, 120)
+
+
+def test_decimator_uses_pyramid():
+    df = _large_dataframe()
+    decimator = LTTB(n_out=100)
+    decimated, is_applied, _ = _decimate(decimator, df)
+    assert is_applied
+    assert len(decimated) == 100
+    pyramid = _get_pyramid(decimator, df)
+    assert pyramid is not None
+    # zoomed requests only return points in range, and reuse the pyramid
+    decimated, is_applied, _ = _decimate(decimator, df, {"xaxis.range[0]": 50_000, "xaxis.range[1]": 150_000})
+    assert is_applied
+    assert len(decimated) == 100
+    assert decimated["x"].min() > 50_000 and decimated["x"].max() < 150_000
+    assert _get_pyramid(decimator, df) is pyramid
+    # a deep zoom is answered from the original data
+    decimated, _, _ = _decimate(decimator, df, {"xaxis.range[0]": 1000, "xaxis.range[1]": 1050})
+    assert decimated["x"].tolist() == list(range(1001, 1050))
+
+
+def test_decimator_pyramid_invalidation():
+    df = _large_dataframe()
+    decimator = MinMaxDecimator(n_out=100)
+    _decimate(decimator, df)
+    pyramid = _get_pyramid(decimator, df)
+    df.loc[10, "y"] = 1000
+    # the pyramid is rebuilt when the version of the data changes
+    _decimate(decimator, df)
+    assert _get_pyramid(decimator, df) is pyramid
+    decimated, _, _ = _decimate(decimator, df, version=1)
+    assert _get_pyramid(decimator, df) is not pyramid
+    assert 1000 in decimated["y"].values
+    key = (id(df), "x", "y")
+    del df
+    assert key not in decimator._Decimator__pyramids  # type: ignore[attr-defined]
+
+
+def test_decimator_pyramid_needs_version():
+    df = _large_dataframe()
+    decimator = MinMaxDecimator(n_out=100)
+    decimated, is_applied, _ = _decimate(decimator, df, version=None)
+    assert is_applied
+    assert len(decimated) <= 100
+    assert not decimator._Decimator__pyramids  # type: ignore[attr-defined]
+
+
+def test_decimator_pyramid_on_copy():
+    df = _large_dataframe()
+    decimator = MinMaxDecimator(n_out=100)
+    payload = ({"decimator": "d", "chartMode": "lines", "xAxis": "x", "yAxis": "y"}, {"width": 100})
+    decimator._on_decimate(df.copy(deep=False), *payload, source=df, version=0)
+    pyramid = _get_pyramid(decimator, df)
+    decimator._on_decimate(df.copy(deep=False), *payload, source=df, version=0)
+    assert _get_pyramid(decimator, df) is pyramid
+    assert len(decimator._Decimator__pyramids) == 1  # type: ignore[attr-defined]
+
+
+def test_scatter_decimator_does_not_use_pyramid():
+    df = _large_dataframe()
+    decimator = ScatterDecimator()
+    _decimate(decimator, df)
+    assert not decimator._Decimator__pyramids  # type: ignore[attr-defined]
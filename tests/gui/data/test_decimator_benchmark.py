@@ -0,0 +1,147 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+import typing as t
+
+import numpy
+import pytest
+
+from taipy.gui.data.decimator import LTTB, RDP
+
+
+# Reference (loop based) implementations of the decimation algorithms
+def _lttb_reference(data: numpy.ndarray, n_out: int) -> numpy.ndarray:
+    if n_out >= data.shape[0]:
+        return numpy.full(len(data), True)
+    n_bins = n_out - 2
+    data_bins = numpy.array_split(data[1:-1], n_bins)
+    prev_a = data[0]
+    start_pos = 0
+    out_mask = numpy.full(len(data), False)
+    out_mask[0] = True
+    out_mask[len(data) - 1] = True
+    for i in range(len(data_bins)):
+        this_bin = data_bins[i]
+        next_bin = data_bins[i + 1] if i < n_bins - 1 else data[-1:]
+        a = prev_a
+        bs = this_bin
+        c = next_bin.mean(axis=0)
+        areas = 0.5 * abs((a[0] - c[0]) * ((bs - a)[:, 1]) - ((a - bs)[:, 0]) * (c[1] - a[1]))
+        bs_pos = numpy.argmax(areas)
+        prev_a = bs[bs_pos]
+        out_mask[start_pos + bs_pos] = True
+        start_pos += len(this_bin)
+    return out_mask
+
+
+def _dsquared_line_points(p1, p2, points):
+    xdiff = p2[0] - p1[0]
+    ydiff = p2[1] - p1[1]
+    nom = (ydiff * points[:, 0] - xdiff * points[:, 1] + p2[0] * p1[1] - p2[1] * p1[0]) ** 2
+    denom = ydiff**2 + xdiff**2
+    return numpy.divide(nom, denom)
+
+
+def _rdp_epsilon_reference(data: numpy.ndarray, epsilon: float) -> numpy.ndarray:
+    mask = numpy.full(data.shape[0], True)
+    stack: t.List[t.Tuple[int, int]] = [(0, data.shape[0] - 1)]
+    while stack:
+        (start, end) = stack.pop()
+        if end - start <= 1:
+            continue
+        dsq = _dsquared_line_points(data[start], data[end], data[start + 1 : end])
+        if (dsq > epsilon**2).any():
+            mid = int(numpy.argmax(dsq)) + 1 + start
+            stack.append((start, mid))
+            stack.append((mid, end))
+        else:
+            mask[start + 1 : end] = False
+    return mask
+
+
+def _rdp_points_reference(data: numpy.ndarray, n_out: int) -> numpy.ndarray:
+    data_len = data.shape[0]
+    if data_len <= n_out:
+        return numpy.full(data_len, True)
+    weights = numpy.empty(data_len)
+    weights[0] = float("inf")
+    weights[data_len - 1] = float("inf")
+    stack = [(0, data_len - 1)]
+    while stack:
+        (start, end) = stack.pop()
+        if end - start <= 1:
+            continue
+        dsq = _dsquared_line_points(data[start], data[end], data[start + 1 : end])
+        max_dist_index = numpy.argmax(dsq) + start + 1
+        weights[max_dist_index] = numpy.amax(dsq)
+        stack.append((start, max_dist_index))
+        stack.append((max_dist_index, end))
+    return weights >= numpy.sort(weights)[data_len - n_out]
+
+
+def _random_walk(nb_points: int, seed: int = 0, fortran: bool = False) -> numpy.ndarray:
+    rng = numpy.random.default_rng(seed)
+    data = numpy.column_stack((numpy.arange(nb_points) * 0.5, rng.normal(0, 1, nb_points).cumsum()))
+    return numpy.asfortranarray(data) if fortran else data
+
+
+def _timed(fct: t.Callable, *args) -> t.Tuple[t.Any, float]:
+    start = time.perf_counter()
+    result = fct(*args)
+    return result, time.perf_counter() - start
+
+
+@pytest.mark.parametrize("nb_points, n_out", [(10, 5), (1_000, 3), (12_345, 100), (100_003, 1_000), (200_000, 1_998)])
+@pytest.mark.parametrize("fortran", [False, True])
+def test_lttb_same_mask(nb_points: int, n_out: int, fortran: bool):
+    data = _random_walk(nb_points, nb_points, fortran)
+    numpy.testing.assert_array_equal(LTTB(n_out)._decimate(data, {}), _lttb_reference(data, n_out))
+
+
+@pytest.mark.parametrize("nb_points, epsilon", [(10, 1), (1_000, 0.5), (12_345, 2), (50_000, 5)])
+def test_rdp_epsilon_same_mask(nb_points: int, epsilon: float):
+    data = _random_walk(nb_points, nb_points)
+    numpy.testing.assert_array_equal(RDP(epsilon=epsilon)._decimate(data, {}), _rdp_epsilon_reference(data, epsilon))
+
+
+@pytest.mark.parametrize("nb_points, n_out", [(10, 5), (1_000, 3), (12_345, 100), (50_000, 1_000)])
+def test_rdp_points_same_mask(nb_points: int, n_out: int):
+    data = _random_walk(nb_points, nb_points)
+    numpy.testing.assert_array_equal(RDP(n_out=n_out)._decimate(data, {}), _rdp_points_reference(data, n_out))
+
+
+def test_rdp_with_duplicate_points():
+    data = numpy.array([[0.0, 0.0], [1.0, 1.0], [1.0, 1.0], [2.0, 0.0], [2.0, 0.0], [3.0, 5.0], [0.0, 0.0]])
+    numpy.testing.assert_array_equal(RDP(epsilon=1)._decimate(data, {}), _rdp_epsilon_reference(data, 1))
+    numpy.testing.assert_array_equal(RDP(n_out=4)._decimate(data, {}), _rdp_points_reference(data, 4))
+
+
+@pytest.mark.benchmark
+def test_lttb_benchmark():
+    data = _random_walk(2_000_000)
+    new_mask, new_time = _timed(LTTB(2_000)._decimate, data, {})
+    ref_mask, ref_time = _timed(_lttb_reference, data, 2_000)
+    numpy.testing.assert_array_equal(new_mask, ref_mask)
+    assert new_time < ref_time
+
+
+@pytest.mark.benchmark
+def test_rdp_benchmark():
+    data = _random_walk(200_000)
+    new_mask, new_time = _timed(RDP(n_out=2_000)._decimate, data, {})
+    ref_mask, ref_time = _timed(_rdp_points_reference, data, 2_000)
+    numpy.testing.assert_array_equal(new_mask, ref_mask)
+    assert new_time < ref_time
+    new_mask, new_time = _timed(RDP(epsilon=2)._decimate, data, {})
+    ref_mask, ref_time = _timed(_rdp_epsilon_reference, data, 2)
+    numpy.testing.assert_array_equal(new_mask, ref_mask)
+    assert new_time < ref_time
@@ -11,10 +11,12 @@
 
 import inspect
 import os
+import tracemalloc
 import warnings
 from datetime import datetime
 from importlib import util
-from unittest.mock import Mock
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import numpy
 import pandas
@@ -23,8 +25,9 @@ from flask import g
 
 from taipy.gui import Gui
 from taipy.gui.data.data_format import _DataFormat
-from taipy.gui.data.decimator import ScatterDecimator
+from taipy.gui.data.decimator import LTTB, MinMaxDecimator, ScatterDecimator
 from taipy.gui.data.pandas_data_accessor import _PandasDataAccessor
+from taipy.gui.utils.types import _TaipyData
 
 
 # Define a mock to simulate _DataFormat behavior with a "value" attribute
@@ -171,6 +174,87 @@ def test_aggregate(gui: Gui, helpers, small_dataframe):
     assert next(v.get("value") for v in data if v.get("name") == "A") == 5
 
 
+def _aggregation_accessor(df):
+    holder = _TaipyData(df, "tpec_TpD_x")
+    gui = Mock()
+    gui._get_data_scope.return_value = SimpleNamespace(tpec_TpD_x=holder)
+    return _PandasDataAccessor(gui), holder
+
+
+def _aggregation_query():
+    return {
+        "columns": ["name", "value", "count"],
+        "start": 0,
+        "end": -1,
+        "aggregates": ["name"],
+        "applies": {"value": "sum", "count": "count"},
+    }
+
+
+def _grouped_rows(monkeypatch):
+    grouped_rows = []
+    groupby = pandas.DataFrame.groupby
+
+    def counting_groupby(df, *args, **kwargs):
+        grouped_rows.append(len(df))
+        return groupby(df, *args, **kwargs)
+
+    monkeypatch.setattr(pandas.DataFrame, "groupby", counting_groupby)
+    return grouped_rows
+
+
+def _aggregated_values(accessor, holder):
+    value = accessor.get_data(holder.get_name(), holder.get(), _aggregation_query(), _DataFormat.JSON)["value"]
+    return {row["name"]: (row["value"], row["count"]) for row in value["data"]}, value["rowcount"]
+
+
+def test_aggregation_cache(monkeypatch):
+    df = pandas.DataFrame({"name": ["A", "B", "A", "C"], "value": [1, 2, 3, 4], "count": [1, 1, 1, 1]})
+    accessor, holder = _aggregation_accessor(df)
+    grouped_rows = _grouped_rows(monkeypatch)
+    expected = ({"A": (4, 2), "B": (2, 1), "C": (4, 1)}, 3)
+    assert _aggregated_values(accessor, holder) == expected
+    assert _aggregated_values(accessor, holder) == expected
+    assert grouped_rows == [4]
+    # modified data is aggregated again
+    df.loc[0, "value"] = 10
+    holder.set(df)
+    assert _aggregated_values(accessor, holder) == ({"A": (13, 2), "B": (2, 1), "C": (4, 1)}, 3)
+    assert grouped_rows == [4, 4]
+
+
+def test_aggregation_cache_appended_rows(monkeypatch):
+    df = pandas.DataFrame({"name": ["A", "B", "A", "C"], "value": [1, 2, 3, 4], "count": [1, 1, 1, 1]})
+    accessor, holder = _aggregation_accessor(df)
+    grouped_rows = _grouped_rows(monkeypatch)
+    _aggregated_values(accessor, holder)
+    holder.set(
+        pandas.concat([df, pandas.DataFrame({"name": ["B", "D"], "value": [5, 6], "count": [1, 1]})], ignore_index=True)
+    )
+    assert _aggregated_values(accessor, holder) == ({"A": (4, 2), "B": (7, 2), "C": (4, 1), "D": (6, 1)}, 4)
+    # only the new rows were aggregated, then merged with the cached groups
+    assert grouped_rows[:2] == [4, 2]
+    # rows that were changed before the appended ones invalidate the cached groups
+    grouped_rows.clear()
+    modified = holder.get().copy()
+    modified.loc[1, "value"] = 0
+    holder.set(pandas.concat([modified, pandas.DataFrame({"name": ["A"], "value": [1], "count": [1]})]))
+    assert _aggregated_values(accessor, holder) == ({"A": (5, 3), "B": (5, 2), "C": (4, 1), "D": (6, 1)}, 4)
+    assert grouped_rows == [7]
+
+
+def test_aggregation_cache_not_combinable(monkeypatch):
+    df = pandas.DataFrame({"name": ["A", "B", "A"], "value": [1.0, 2.0, 3.0]})
+    accessor, holder = _aggregation_accessor(df)
+    grouped_rows = _grouped_rows(monkeypatch)
+    query = {"columns": ["name", "value"], "start": 0, "end": -1, "aggregates": ["name"], "applies": {"value": "mean"}}
+    accessor.get_data(holder.get_name(), df, query, _DataFormat.JSON)
+    holder.set(pandas.concat([df, pandas.DataFrame({"name": ["A"], "value": [8.0]})], ignore_index=True))
+    value = accessor.get_data(holder.get_name(), holder.get(), query, _DataFormat.JSON)["value"]
+    assert next(v.get("value") for v in value["data"] if v.get("name") == "A") == 4
+    assert grouped_rows == [3, 4]
+
+
 def test_filters(gui: Gui, helpers, small_dataframe):
     accessor = _PandasDataAccessor(gui)
     pd = pandas.DataFrame(data=small_dataframe)
@@ -374,6 +458,93 @@ def test_decimator(gui: Gui, helpers, small_dataframe):
         assert len(data) == 2
 
 
+def _chart_accessor(decimators):
+    gui = Mock()
+    gui._get_user_instance = lambda name, _: decimators.get(name)
+    return _PandasDataAccessor(gui)
+
+
+def _chart_payload(*traces):
+    return {
+        "alldata": True,
+        "decimatorPayload": {
+            "width": 100,
+            "decimators": [{"decimator": d, "chartMode": "lines", "xAxis": "x", "yAxis": y} for d, y in traces],
+        },
+    }
+
+
+def test_decimated_traces_union():
+    rng = numpy.random.default_rng(0)
+    df = pandas.DataFrame({"x": numpy.arange(1000.0), "y1": rng.normal(size=1000), "y2": rng.normal(size=1000)})
+    df["other"] = 0
+    accessor = _chart_accessor({"d1": LTTB(n_out=50), "d2": MinMaxDecimator(n_out=50)})
+    ret = accessor.get_data("x", df, _chart_payload(("d1", "y1"), ("d2", "y2")), _DataFormat.JSON)
+    data = ret["value"]["data"]
+    assert sorted(data.keys()) == ["x", "y1", "y2"]
+    y1 = LTTB(n_out=50)._decimate(df[["x", "y1"]].to_numpy(), {})
+    y2 = MinMaxDecimator(n_out=50)._decimate(df[["x", "y2"]].to_numpy(), {})
+    assert data["x"] == df["x"][y1 | y2].tolist()
+    # each trace only holds the values of its own decimated rows
+    assert [v for v in data["y1"] if v is not None] == df["y1"][y1].tolist()
+    assert [v for v in data["y2"] if v is not None] == df["y2"][y2].tolist()
+
+
+def test_decimated_and_full_traces():
+    rng = numpy.random.default_rng(0)
+    df = pandas.DataFrame({"x": numpy.arange(1000.0), "y1": rng.normal(size=1000), "y2": rng.normal(size=1000)})
+    df.index = [i % 10 for i in range(1000)]
+    accessor = _chart_accessor({"d1": LTTB(n_out=50)})
+    ret = accessor.get_data("x", df, _chart_payload(("d1", "y1"), (None, "y2")), _DataFormat.JSON)
+    data = ret["value"]["data"]
+    assert data["x"] == df["x"].tolist()
+    assert data["y2"] == df["y2"].tolist()
+    y1 = LTTB(n_out=50)._decimate(df[["x", "y1"]].to_numpy(), {})
+    assert [v for v in data["y1"] if v is not None] == df["y1"][y1].tolist()
+
+
+def test_decimator_pyramid_with_duplicate_index():
+    nb_rows = 200_000
+    df = pandas.DataFrame(
+        {"x": numpy.arange(nb_rows, dtype=float), "y": numpy.random.default_rng(0).normal(size=nb_rows)}
+    )
+    df.index = [i % 10 for i in range(nb_rows)]
+    decimator = MinMaxDecimator(n_out=100)
+    accessor = _chart_accessor({"d1": decimator})
+    holder = _TaipyData(df, "x")
+    with patch.object(accessor, "_PandasDataAccessor__get_holder", return_value=holder):
+        accessor.get_data("x", df, _chart_payload(("d1", "y")), _DataFormat.JSON)
+        pyramids = decimator._Decimator__pyramids  # type: ignore[attr-defined]
+        pyramid = pyramids[(id(df), "x", "y")][-1]
+        # The index is reset on a new copy of the data for each request
+        accessor.get_data("x", df, _chart_payload(("d1", "y")), _DataFormat.JSON)
+        assert pyramids[(id(df), "x", "y")][-1] is pyramid
+        assert len(pyramids) == 1
+        # Setting the variable changes the version of the data
+        holder.set(df)
+        accessor.get_data("x", df, _chart_payload(("d1", "y")), _DataFormat.JSON)
+        assert pyramids[(id(df), "x", "y")][-1] is not pyramid
+
+
+def test_chart_data_memory():
+    nb_rows = 200_000
+    df = pandas.DataFrame({f"col{i}": numpy.random.randn(nb_rows) for i in range(20)})
+    df["col0"] = numpy.arange(nb_rows, dtype=float)
+    accessor = _chart_accessor({"d1": LTTB(n_out=500), "d2": MinMaxDecimator(n_out=500)})
+    payload = _chart_payload(("d1", "col1"), ("d2", "col2"))
+    for decimator in payload["decimatorPayload"]["decimators"]:
+        decimator["xAxis"] = "col0"
+    tracemalloc.start()
+    try:
+        with patch.object(accessor, "_PandasDataAccessor__get_holder", return_value=_TaipyData(df, "x")):
+            accessor.get_data("x", df, payload, _DataFormat.JSON)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    # only the x and y columns may be duplicated
+    assert peak < df.memory_usage().sum() / 5
+
+
 def test_edit(gui, small_dataframe):
     accessor = _PandasDataAccessor(gui)
     pd = pandas.DataFrame(small_dataframe)
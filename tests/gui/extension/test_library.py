@@ -175,6 +175,13 @@ def test_lib_inner_no_value_md(gui: Gui, test_client, helpers):
     helpers.test_control_md(gui, md_string, expected)
 
 
+def test_lib_inner_number_md(gui: Gui, test_client, helpers):
+    gui._set_frame(inspect.currentframe())
+    md_string = "<|42|test_lib.inner|>"
+    expected = ["<TestLib_Inner", "withProperty={tpec_TpExPr_42_TPMDL_0}"]
+    helpers.test_control_md(gui, md_string, expected)
+
+
 def test_lib_bad_name():
     with pytest.raises(NameError):
         Gui.add_library(MyBadLibrary())
@@ -16,7 +16,7 @@ from contextlib import nullcontext
 import pandas as pd
 import pytest
 
-from taipy.gui import Gui
+from taipy.gui import Gui, Markdown
 from taipy.gui.utils import _get_module_name_from_frame, _TaipyContent
 
 
@@ -109,3 +109,14 @@ def test_on_action_call(gui:Gui):
     with gui.get_flask_app().app_context():
         gui._Gui__on_action(an_id, a_non_action_payload) # type: ignore[reportAttributeAccessIssue]
         gui._Gui__on_action(an_id, an_action_payload) # type: ignore[reportAttributeAccessIssue]
+
+
+def test_startup_timings(gui: Gui, helpers):
+    gui.add_page("test", Markdown("<|Hello|>"))
+    gui.run(run_server=False)
+    timings = gui._get_startup_timings()
+    assert list(timings) == ["config", "hooks", "server", "variables", "libraries", "blueprint"]
+    assert all(duration >= 0 for duration in timings.values())
+    sid = helpers.create_scope_and_get_sid(gui)
+    gui._server.test_client().get(f"/taipy-init?client_id={sid}")
+    assert "pre_render" in gui._get_startup_timings()
@@ -0,0 +1,67 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+
+import pytest
+
+from taipy.gui import Gui, Markdown
+
+
+@pytest.mark.parametrize("page_render_cache, expected_renders", [(False, 4), (True, 2)])
+def test_page_render_cache(gui: Gui, monkeypatch, page_render_cache: bool, expected_renders: int):
+    x = 10  # noqa: F841
+    renders = []
+    render = Markdown.render
+
+    def counting_render(self, gui):
+        renders.append(self)
+        return render(self, gui)
+
+    monkeypatch.setattr(Markdown, "render", counting_render)
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|{x}|slider|>\n<|{x * 2}|>"))
+    gui.run(run_server=False, page_render_cache=page_render_cache)
+    flask_client = gui._server.test_client()
+    jsx = []
+    for client_id in ("c1", "c2"):
+        gui._bindings()._get_or_create_scope(client_id)
+        for _ in range(2):
+            jsx.append(flask_client.get(f"/taipy-jsx/test?client_id={client_id}").json["jsx"])
+    assert len(renders) == expected_renders
+    assert all("<Slider" in j and "tp_TpExPr_x_2_TPMDL_" in j for j in jsx)
+    if page_render_cache:
+        assert jsx[0] == jsx[1]
+        assert jsx[2] == jsx[3]
+
+
+def test_page_render_cache_invalidation(gui: Gui, monkeypatch):
+    x = 10  # noqa: F841
+    renders = []
+    render = Markdown.render
+
+    def counting_render(self, gui):
+        renders.append(self)
+        return render(self, gui)
+
+    monkeypatch.setattr(Markdown, "render", counting_render)
+    gui._set_frame(inspect.currentframe())
+    page = Markdown("<|{x}|>")
+    gui.add_page("test", page)
+    gui.run(run_server=False, single_client=True, page_render_cache=True)
+    flask_client = gui._server.test_client()
+    flask_client.get("/taipy-jsx/test")
+    flask_client.get("/taipy-jsx/test")
+    assert len(renders) == 1
+    # changing the content of the page invalidates the cache
+    page._content = "<|{x}|slider|>"
+    assert "<Slider" in flask_client.get("/taipy-jsx/test").json["jsx"]
+    assert len(renders) == 2
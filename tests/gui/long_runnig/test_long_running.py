@@ -10,9 +10,13 @@
 # specific language governing permissions and limitations under the License.
 
 import inspect
+import threading
 from time import sleep
 
-from taipy.gui import Gui, State, invoke_long_callback
+import pytest
+
+from taipy.gui import Gui, State, cancel_long_callback, get_long_callback_status, invoke_long_callback
+from taipy.gui.utils._long_callback_executor import _LongCallbackExecutor
 
 
 def test_long_callback(gui: Gui):
@@ -42,3 +46,95 @@ def test_long_callback(gui: Gui):
         invoke_long_callback(state, heavy_function, (), heavy_function_status)
         invoke_long_callback(state, heavy_function, (2,), heavy_function_status, (), 1000)
         invoke_long_callback(state, heavy_function_with_exception, (), heavy_function_status)
+
+
+def test_long_callback_client_limit(gui: Gui):
+    status = None  # noqa: F841
+    event = threading.Event()
+
+    def blocking_function():
+        event.wait(5)
+
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True, long_callback_client_limit=1)
+    state = gui._Gui__state  # type: ignore[attr-defined]
+
+    with gui.get_flask_app().app_context():
+        first_id = invoke_long_callback(state, blocking_function)
+        second_id = invoke_long_callback(state, blocking_function)
+        third_id = invoke_long_callback(state, blocking_function)
+        assert get_long_callback_status(state, first_id) == _LongCallbackExecutor.RUNNING
+        # the other calls wait for the first one to finish
+        assert get_long_callback_status(state, second_id) == _LongCallbackExecutor.PENDING
+        assert cancel_long_callback(state, third_id)
+        assert not cancel_long_callback(state, first_id)
+        assert get_long_callback_status(state, third_id) == _LongCallbackExecutor.CANCELLED
+        event.set()
+        for _ in range(50):
+            if get_long_callback_status(state, second_id) == _LongCallbackExecutor.DONE:
+                break
+            sleep(0.1)
+        assert get_long_callback_status(state, first_id) == _LongCallbackExecutor.DONE
+        assert get_long_callback_status(state, second_id) == _LongCallbackExecutor.DONE
+
+
+def test_long_callback_executor():
+    executor = _LongCallbackExecutor(max_workers=2)
+    statuses = []
+    done = threading.Event()
+
+    def on_status(status, e=None, function_name=None, function_result=None):
+        statuses.append((status, function_result, function_name))
+        if isinstance(status, bool):
+            done.set()
+
+    def slow_function(value):
+        sleep(0.35)
+        return value
+
+    task_id = executor._submit("client", slow_function, (12,), on_status, 0.1)
+    assert done.wait(5)
+    assert executor._get_status(task_id) == _LongCallbackExecutor.DONE
+    # periodic calls, then the final one
+    assert statuses[0] == (0, None, None)
+    assert len(statuses) >= 3
+    assert statuses[-1] == (True, 12, None)
+    assert executor._get_counts() == {_LongCallbackExecutor.PENDING: 0, _LongCallbackExecutor.RUNNING: 0}
+
+    def failing_function():
+        raise ValueError("error")
+
+    statuses.clear()
+    done.clear()
+    task_id = executor._submit("client", failing_function, (), on_status)
+    assert done.wait(5)
+    assert executor._get_status(task_id) == _LongCallbackExecutor.FAILED
+    assert statuses == [(False, None, "failing_function")]
+
+
+def test_long_callback_executor_shutdown(gui: Gui):
+    gui.run(run_server=False, long_callback_max_workers=1)
+    executor = gui._get_long_callback_executor()
+    statuses = []
+    release = threading.Event()
+
+    def on_status(status, e=None, function_name=None, function_result=None):
+        statuses.append(status)
+
+    running_id = executor._submit("client", release.wait, (5,), on_status)
+    pending_id = executor._submit("client", release.wait, (5,), on_status)
+    # a new configuration replaces the executor, the previous one is shut down
+    gui._config.config["long_callback_max_workers"] = 2
+    assert gui._get_long_callback_executor() is not executor
+    assert executor._get_status(pending_id) == _LongCallbackExecutor.CANCELLED
+    assert executor._get_status(running_id) == _LongCallbackExecutor.RUNNING
+    with pytest.raises(RuntimeError):
+        executor._submit("client", release.wait, (5,), on_status)
+    # the running callback is not interrupted
+    release.set()
+    for _ in range(50):
+        if executor._get_status(running_id) == _LongCallbackExecutor.DONE:
+            break
+        sleep(0.1)
+    assert executor._get_status(running_id) == _LongCallbackExecutor.DONE
+    assert statuses == [True]
@@ -11,7 +11,8 @@
 
 import inspect
 
-from taipy.gui import Gui, Markdown
+from taipy.gui import Gui, Markdown, notify
+from taipy.gui.utils._evaluator import _Evaluator
 
 
 def test_a_button_pressed(gui: Gui, helpers):
@@ -41,5 +42,71 @@ def test_a_button_pressed(gui: Gui, helpers):
     assert gui._bindings()._get_all_scopes()[sid].x == 20  # type: ignore
     # assert for received message (message that would be sent to the front-end client)
     received_messages = ws_client.get_received()
+    # all the updates made by the callback are sent in a single message
+    assert len(received_messages) == 1
     helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_x_TPMDL_0", 20)
-    helpers.assert_outward_ws_message(received_messages[1], "MU", "tpec_TpExPr_text_TPMDL_0", "a random text")
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_text_TPMDL_0", "a random text")
+
+
+def test_a_button_messages_order(gui: Gui, helpers):
+    def do_something(state, id):
+        state.x = 20
+        notify(state, "info", "x is set")
+        state.text = "a random text"
+
+    x = 10  # noqa: F841
+    text = "hi"  # noqa: F841
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+    gui.add_page(
+        "test", Markdown("<|Do something!|button|on_action=do_something|id=my_button|> | <|{x}|> | <|{text}|>")
+    )
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    ws_client.get_received()
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"})
+    received_messages = ws_client.get_received()
+    # the updates made before the notification are sent before it
+    assert [message["args"]["type"] for message in received_messages] == ["MU", "AL", "MU"]
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_x_TPMDL_0", 20)
+    helpers.assert_outward_ws_message(received_messages[2], "MU", "tpec_TpExPr_text_TPMDL_0", "a random text")
+
+
+def test_a_button_expressions_evaluated_once(gui: Gui, helpers, monkeypatch):
+    def do_something(state, id):
+        for i in range(20):
+            state.x = i
+            state.y = i * 2
+
+    x = 1  # noqa: F841
+    y = 2  # noqa: F841
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|Do something!|button|on_action=do_something|id=my_button|> | <|{x + y}|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    sid = helpers.create_scope_and_get_sid(gui)
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    ws_client.get_received()
+
+    evaluated = []
+    evaluate = _Evaluator._Evaluator__evaluate  # type: ignore[attr-defined]
+
+    def counting_evaluate(self, expr_string, var_values):
+        evaluated.append(expr_string)
+        return evaluate(self, expr_string, var_values)
+
+    monkeypatch.setattr(_Evaluator, "_Evaluator__evaluate", counting_evaluate)
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"})
+    assert evaluated == ["x + y"]
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 1
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tp_TpExPr_x_y_TPMDL_0_0", 57)
@@ -0,0 +1,56 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+
+from taipy.gui import Gui, Markdown, notify
+
+
+def _create_client(gui: Gui, helpers, **kwargs):
+    def do_something(state, id):
+        state.x = 20
+        notify(state, "I", "done")
+
+    x = 10  # noqa: F841
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+    gui.add_page("test", Markdown("<|Do something!|button|on_action=do_something|id=my_button|> | <|{x}|>"))
+    gui.run(run_server=False, **kwargs)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    ws_client.get_received()
+    return ws_client, sid
+
+
+def test_ws_batch_window(gui: Gui, helpers):
+    ws_client, sid = _create_client(gui, helpers, ws_batch_window=20)
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"})
+    # nothing is sent before the batching window has elapsed
+    assert ws_client.get_received() == []
+    gui._server._ws.sleep(0.2)
+    received_messages = ws_client.get_received()
+    assert len(received_messages) == 1
+    assert received_messages[0]["args"]["type"] == "MS"
+    messages = received_messages[0]["args"]["payload"]
+    assert [m["type"] for m in messages] == ["MU", "AL"]
+    helpers.assert_outward_ws_message({"name": "message", "args": messages[0]}, "MU", "tpec_TpExPr_x_TPMDL_0", 20)
+
+
+def test_ws_no_batch_window(gui: Gui, helpers):
+    ws_client, sid = _create_client(gui, helpers)
+    ws_client.emit("message", {"client_id": sid, "type": "A", "name": "my_button", "payload": "do_something"})
+    received_messages = ws_client.get_received()
+    assert [m["args"]["type"] for m in received_messages] == ["MU", "AL"]
+    helpers.assert_outward_ws_message(received_messages[0], "MU", "tpec_TpExPr_x_TPMDL_0", 20)
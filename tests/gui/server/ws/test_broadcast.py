@@ -37,3 +37,44 @@ def test_broadcast(gui: Gui, helpers):
     received_messages = ws_client.get_received()
     assert len(received_messages)
     helpers.assert_outward_simple_ws_message(received_messages[0], "BC", "_bc_broadcast_name", "broadcast_value")
+
+
+def test_broadcast_change_fan_out(gui: Gui, helpers, monkeypatch):
+    # Bind test variables
+    v = 1  # noqa: F841
+    w = 0  # noqa: F841
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", Markdown("<|{v}|> <|{w}|> <|{v + w}|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    ws_clients = {}
+    for client_id, w_value in (("c1", 10), ("c2", 20)):
+        gui._bindings()._get_or_create_scope(client_id)
+        flask_client.get(f"/taipy-jsx/test?client_id={client_id}")
+        ws_client = gui._server._ws.test_client(gui._server.get_flask())
+        ws_client.emit(
+            "message",
+            {"client_id": client_id, "type": "U", "name": "tpec_TpExPr_w_TPMDL_0", "payload": {"value": w_value}},
+        )
+        ws_client.get_received()
+        ws_clients[client_id] = ws_client
+
+    emitted = []
+    emit = gui._server._ws.emit
+
+    def counting_emit(*args, **kwargs):
+        emitted.append(kwargs.get("to"))
+        return emit(*args, **kwargs)
+
+    monkeypatch.setattr(gui._server._ws, "emit", counting_emit)
+    gui.broadcast_change("v", 5)
+    # one message per client for the expression depending on w, then one message for all the clients
+    assert [len(to) for to in emitted] == [1, 1, 2]
+    for client_id, total in (("c1", 15), ("c2", 25)):
+        received_messages = ws_clients[client_id].get_received()
+        assert len(received_messages) == 2
+        helpers.assert_outward_ws_message(received_messages[0], "MU", "tp_TpExPr_v_w_TPMDL_0_0", total)
+        helpers.assert_outward_ws_message(received_messages[1], "MU", "tpec_TpExPr_v_TPMDL_0", 5)
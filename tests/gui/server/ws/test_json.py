@@ -0,0 +1,73 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+import json
+from datetime import datetime
+
+from taipy.gui import Gui, Markdown
+from taipy.gui._renderers.json import _TaipyJsonAdapter, _TaipyJsonFragment, _TaipyWsJson
+from taipy.gui.utils import _date_to_string
+
+
+def test_ws_json_fragments():
+    encoded = _TaipyWsJson.dumps(
+        ["message", {"a": _TaipyJsonFragment('{"value":[1,2]}'), "b": [_TaipyJsonFragment('"x"'), 3]}],
+        separators=(",", ":"),
+    )
+    assert encoded == '["message",{"a":{"value":[1,2]},"b":["x",3]}]'
+    assert _TaipyWsJson.loads(encoded) == ["message", {"a": {"value": [1, 2]}, "b": ["x", 3]}]
+    assert json.loads(_TaipyWsJson.dumps({"d": datetime(2020, 1, 1)})) == {"d": _date_to_string(datetime(2020, 1, 1))}
+
+
+def test_ws_update_encoded_once(gui: Gui, helpers, monkeypatch):
+    # Bind test variables
+    var = "value"  # noqa: F841
+    dates = []  # noqa: F841
+
+    def on_change(state, var_name, value):
+        if var_name == "var":
+            state.dates = [datetime(2020, 1, 1), datetime(2021, 1, 1)]
+
+    # set gui frame
+    gui._set_frame(inspect.currentframe())
+
+    gui.add_page("test", Markdown("<|{var}|> <|{dates}|>"))
+    gui.run(run_server=False)
+    flask_client = gui._server.test_client()
+    # WS client and emit
+    ws_client = gui._server._ws.test_client(gui._server.get_flask())
+    sid = helpers.create_scope_and_get_sid(gui)
+    # Get the jsx once so that the page will be evaluated -> variable will be registered
+    flask_client.get(f"/taipy-jsx/test?client_id={sid}")
+    ws_client.get_received()
+
+    parsed = []
+    parse = _TaipyJsonAdapter.parse
+
+    def counting_parse(self, o):
+        parsed.append(o)
+        return parse(self, o)
+
+    monkeypatch.setattr(_TaipyJsonAdapter, "parse", counting_parse)
+    ws_client.emit(
+        "message", {"client_id": sid, "type": "U", "name": "tpec_TpExPr_var_TPMDL_0", "payload": {"value": "v"}}
+    )
+    received_messages = ws_client.get_received()
+    assert received_messages
+    helpers.assert_outward_ws_message(
+        received_messages[0],
+        "MU",
+        "tpec_TpExPr_dates_TPMDL_0",
+        [_date_to_string(datetime(2020, 1, 1)), _date_to_string(datetime(2021, 1, 1))],
+    )
+    # each date was converted once, when validating the update
+    assert len(parsed) == 2
@@ -42,4 +42,8 @@ def test_sending_messages_in_group(gui: Gui, helpers):
     assert gui._bindings()._get_all_scopes()[cid].btn_id == "button2"  # type: ignore
 
     received_messages = ws_client.get_received()
-    helpers.assert_outward_ws_multiple_message(received_messages[0], "MS", 2)
+    # both updates are coalesced in a single MultipleUpdate message
+    helpers.assert_outward_ws_multiple_message(received_messages[0], "MS", 1)
+    update = {"name": "message", "args": received_messages[0]["args"]["payload"][0]}
+    helpers.assert_outward_ws_message(update, "MU", "tpec_TpExPr_btn_id_TPMDL_0", "button2")
+    helpers.assert_outward_ws_message(update, "MU", "tp_TpExPr_Hello_name_TPMDL_0_0", "Hello Monde!")
@@ -9,6 +9,7 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import ast
 import inspect
 import warnings
 
@@ -87,3 +88,28 @@ def test_evaluate_expression_2_clients(gui: Gui):
         g.client_id = "B"
         gui._evaluate_expr("x")
         gui._re_evaluate_expr("x")
+
+
+def test_expression_analyzed_once(gui: Gui, helpers, monkeypatch):
+    x = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False)
+    parsed = []
+    parse = ast.parse
+
+    def counting_parse(source, *args, **kwargs):
+        parsed.append(source)
+        return parse(source, *args, **kwargs)
+
+    monkeypatch.setattr(ast, "parse", counting_parse)
+    with gui.get_flask_app().app_context():
+        for client_id in ("A", "B"):
+            gui._bindings()._get_or_create_scope(client_id)
+            g.client_id = client_id
+            with warnings.catch_warnings(record=True) as records:
+                warnings.simplefilter("always")
+                gui._evaluate_expr("{x + len(str(x))} {[v * x for v in range(x)]} {id}")
+                warns = helpers.get_taipy_warnings(records)
+                # The collision with a built-in is reported for each client
+                assert any("'id' cannot be used in Taipy expressions" in str(w.message) for w in warns)
+    assert parsed == ["x + len(str(x))", "[v * x for v in range(x)]", "id"]
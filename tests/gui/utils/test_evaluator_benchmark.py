@@ -0,0 +1,83 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import inspect
+import time
+import typing as t
+
+import pytest
+
+from taipy.gui import Gui
+from taipy.gui.utils import _getscopeattr, _getscopeattr_drill, _setscopeattr, _variable_decode
+
+_NB_EXPRESSIONS = 500
+_NB_UPDATES = 20
+
+
+# Evaluation of the expressions as it was done before they were compiled
+def _re_evaluate_reference(gui: Gui, var_name: str):
+    evaluator = gui._Gui__evaluator  # type: ignore[attr-defined]
+    global_ctx = evaluator._Evaluator__global_ctx
+    for expr in evaluator._Evaluator__var_to_expr_list[var_name]:
+        if expr == var_name:
+            continue
+        eval_dict = {
+            k: _getscopeattr_drill(gui, gui._bind_var(v))
+            for k, v in evaluator._Evaluator__expr_to_var_map[expr].items()
+        }
+        expr_string = 'f"' + _variable_decode(expr)[0].replace('"', '\\"') + '"'
+        ctx = {}
+        ctx.update(global_ctx)
+        ctx.update(eval_dict)
+        _setscopeattr(gui, evaluator.get_hash_from_expr(expr), eval(expr_string, ctx))
+
+
+def _evaluate_exprs(gui: Gui) -> t.List[str]:
+    return [
+        gui._evaluate_expr(f"{i}: {{x * {i} + len(str(x))}} {{[x + v for v in range({i % 5})]}}")
+        for i in range(_NB_EXPRESSIONS)
+    ]
+
+
+def _update(gui: Gui, re_evaluate: t.Callable[[Gui, str], t.Any]) -> float:
+    var_name = gui._bind_var("x")
+    start = time.perf_counter()
+    for i in range(_NB_UPDATES):
+        _setscopeattr(gui, var_name, i)
+        re_evaluate(gui, var_name)
+    return time.perf_counter() - start
+
+
+def test_evaluator_same_values(gui: Gui):
+    x = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True)
+    with gui.get_flask_app().app_context():
+        hashes = _evaluate_exprs(gui)
+        evaluator = gui._Gui__evaluator  # type: ignore[attr-defined]
+        _update(gui, evaluator.re_evaluate_expr)
+        new_values = [_getscopeattr(gui, h) for h in hashes]
+        _update(gui, _re_evaluate_reference)
+        assert new_values == [_getscopeattr(gui, h) for h in hashes]
+        assert new_values[7] == f"7: {7 * (_NB_UPDATES - 1) + 2} {[_NB_UPDATES - 1 + v for v in range(2)]}"
+
+
+@pytest.mark.benchmark
+def test_evaluator_benchmark(gui: Gui):
+    x = 10  # noqa: F841
+    gui._set_frame(inspect.currentframe())
+    gui.run(run_server=False, single_client=True)
+    with gui.get_flask_app().app_context():
+        _evaluate_exprs(gui)
+        evaluator = gui._Gui__evaluator  # type: ignore[attr-defined]
+        new_time = _update(gui, evaluator.re_evaluate_expr)
+        ref_time = _update(gui, _re_evaluate_reference)
+        assert new_time < ref_time
@@ -0,0 +1,72 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+
+from taipy.core import DataNode, Job, Task
+from taipy.core.data.data_node_id import EDIT_COMMENT_KEY, EDIT_JOB_ID_KEY, EDIT_TIMESTAMP_KEY
+from taipy.gui_core._context import _GuiCoreContext
+
+a_task = Task("task_config_id", {}, print)
+a_job = MagicMock(spec=Job)
+a_job.id = "JOB_job_id"
+a_job.task = a_task
+
+edits = [
+    {EDIT_TIMESTAMP_KEY: datetime(2025, 1, 1) + timedelta(hours=i), EDIT_JOB_ID_KEY: a_job.id}
+    if i % 2
+    else {EDIT_TIMESTAMP_KEY: datetime(2025, 1, 1) + timedelta(hours=i), EDIT_COMMENT_KEY: f"edit_{i}"}
+    for i in range(10)
+]
+
+
+def _create_data_node():
+    # The 4 most recent edits are kept in the data node, the others are archived
+    datanode = MagicMock(spec=DataNode)
+    datanode.id = "DATANODE_id"
+    datanode.edits = edits[6:]
+    datanode._count_archived_edits.return_value = 6
+    datanode.get_edit_history.return_value = edits
+    return datanode
+
+
+def mock_core_get(entity_id):
+    return a_job if entity_id == a_job.id else _create_data_node()
+
+
+class TestGuiCoreContext_data_node_history:
+    def test_get_data_node_history(self):
+        with (
+            patch("taipy.gui_core._context.core_get", side_effect=mock_core_get) as mock_get,
+            patch("taipy.gui_core._context.is_readable", return_value=True),
+        ):
+            gui_core_context = _GuiCoreContext(Mock())
+            history = gui_core_context.get_data_node_history("DATANODE_id", 3)
+            assert [edit[3] for edit in history] == [10, 9, 8]
+            assert history[0][1] == a_job.id
+            assert history[0][2] == "Execution of task task_config_id."
+            assert history[1][2] == "edit_8"
+            # The job is read once for the edits it made: the data node and the job
+            assert mock_get.call_count == 2
+
+    def test_get_data_node_history_archived(self):
+        with (
+            patch("taipy.gui_core._context.core_get", side_effect=mock_core_get),
+            patch("taipy.gui_core._context.is_readable", return_value=True),
+        ):
+            gui_core_context = _GuiCoreContext(Mock())
+            with patch.object(_GuiCoreContext, "_HISTORY_PAGE_SIZE", 4):
+                history = gui_core_context.get_data_node_history("DATANODE_id")
+            assert [edit[3] for edit in history] == [10, 9, 8, 7]
+            history = gui_core_context.get_data_node_history("DATANODE_id", 20)
+            assert [edit[3] for edit in history] == list(range(10, 0, -1))
+            assert history[-1][2] == "edit_0"
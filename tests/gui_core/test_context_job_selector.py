@@ -0,0 +1,107 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import typing as t
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+from taipy.core import Job, JobId, Scenario, Task
+from taipy.core.job.status import Status
+from taipy.core.notification import EventEntityType
+from taipy.core.notification.event import Event, EventOperation
+from taipy.gui_core._context import _GuiCoreContext
+
+a_task = Task("task_config_id", {}, print)
+jobs: t.List[Job] = []
+for i in range(5):
+    job = Job(t.cast(JobId, f"JOB_job_{i}"), a_task, f"SUBMISSION_{i % 2}", "scenario_id")
+    job._creation_date = datetime(2025, 1, 1) + timedelta(days=i)
+    job._status = Status.COMPLETED if i % 2 else Status.FAILED
+    jobs.append(job)
+
+
+def mock_core_get(entity_id):
+    return next((job for job in jobs if job.id == entity_id), a_task if entity_id == a_task.id else None)
+
+
+def _create_context() -> _GuiCoreContext:
+    context = _GuiCoreContext(MagicMock())
+    context._GuiCoreContext__lazy_start = lambda: None  # type: ignore[attr-defined]
+    return context
+
+
+class TestGuiCoreContext_job_selector:
+    def test_get_jobs_list_not_paged(self):
+        with patch("taipy.gui_core._context.get_jobs", return_value=list(jobs)):
+            context = _create_context()
+            assert context.get_jobs_list() == jobs
+            assert context.get_jobs_list(None, None) == jobs
+            assert context.get_jobs_count() == 5
+
+    def test_get_jobs_list_paged(self):
+        with patch("taipy.gui_core._context.get_jobs", return_value=list(jobs)) as mock_get_jobs:
+            context = _create_context()
+            # The most recent jobs come first
+            assert context.get_jobs_list(None, 2) == [jobs[4], jobs[3]]
+            assert context.get_jobs_list({"start": 2, "count": 2}, 2) == [jobs[2], jobs[1]]
+            assert context.get_jobs_list({"start": 4, "count": 2}, 2) == [jobs[0]]
+            assert context.get_jobs_count(None, 2) == 5
+            mock_get_jobs.assert_called_once()
+
+    def test_get_jobs_list_filtered(self):
+        with (
+            patch("taipy.gui_core._context.get_jobs", return_value=list(jobs)),
+            patch("taipy.gui_core._context.core_get", side_effect=mock_core_get),
+        ):
+            context = _create_context()
+            page: t.Dict[str, t.Any] = {
+                "start": 0,
+                "count": 10,
+                "filters": [{"col": "status", "operator": "is", "value": "completed"}],
+            }
+            assert context.get_jobs_list(page) == [jobs[3], jobs[1]]
+            assert context.get_jobs_count(page) == 2
+            page["filters"] = [{"col": "submission_id", "operator": "isnot", "value": "_1"}]
+            assert context.get_jobs_list(page) == [jobs[4], jobs[2], jobs[0]]
+            page["filters"] = [{"col": "submitted_label", "operator": "is", "value": "task_config"}]
+            assert context.get_jobs_count(page) == 5
+
+    def test_job_update_refreshes_selection(self):
+        updated_job = Job(t.cast(JobId, "JOB_job_0"), a_task, "SUBMISSION_0", "scenario_id")
+        updated_job._creation_date = jobs[0]._creation_date
+        updated_job._status = Status.COMPLETED
+        with (
+            patch("taipy.gui_core._context.get_jobs", return_value=list(jobs)),
+            patch("taipy.gui_core._context.core_get", return_value=updated_job),
+        ):
+            context = _create_context()
+            page = {"filters": [{"col": "status", "operator": "is", "value": "completed"}]}
+            assert context.get_jobs_count(page) == 2
+            context.process_event(Event(EventEntityType.JOB, EventOperation.UPDATE, updated_job.id, "status"))
+            assert context.get_jobs_count(page) == 3
+            assert context.get_jobs_list(page)[-1] is updated_job
+
+
+class TestGuiCoreContext_scenario_sort:
+    def test_sort_keys_are_cached(self):
+        scenario_a = Scenario("scenario_a_config_id", None, {})
+        scenario_b = Scenario("scenario_b_config_id", None, {})
+        sort_key = MagicMock(side_effect=lambda e: e.config_id)
+        with patch("taipy.gui_core._context._get_entity_property", return_value=sort_key):
+            context = _create_context()
+            sorts = [{"col": "config_id", "order": False}]
+            assert context.get_sorted_scenario_list([scenario_a, scenario_b], sorts) == [scenario_b, scenario_a]
+            assert context.get_sorted_scenario_list([scenario_a, scenario_b], sorts) == [scenario_b, scenario_a]
+            assert sort_key.call_count == 2
+            # Core events invalidate the sort keys
+            context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.UPDATE, "DATANODE_id", "value"))
+            context.get_sorted_scenario_list([scenario_a, scenario_b], sorts)
+            assert sort_key.call_count == 4
@@ -0,0 +1,103 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+import typing as t
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from taipy.core import Cycle, CycleId, Job, JobId, Scenario, Task
+from taipy.core.common.frequency import Frequency
+from taipy.core.common.scope import Scope
+from taipy.core.data.pickle import PickleDataNode
+from taipy.core.notification import EventEntityType
+from taipy.core.notification.event import Event, EventOperation
+from taipy.gui_core._context import _GuiCoreContext
+
+a_cycle = Cycle(Frequency.DAILY, {}, datetime.now(), datetime.now(), datetime.now(), id=CycleId("CYCLE_id"))
+a_scenario = Scenario("scenario_config_id", None, {})
+another_scenario = Scenario("scenario_config_id", None, {})
+a_task = Task("task_config_id", {}, print)
+a_job = Job(t.cast(JobId, "JOB_job_id"), a_task, "submit_id", a_scenario.id)
+another_job = Job(t.cast(JobId, "JOB_another_job_id"), a_task, "submit_id", a_scenario.id)
+a_datanode = PickleDataNode("data_node_config_id", Scope.SCENARIO, owner_id=a_scenario.id)
+another_datanode = PickleDataNode("data_node_config_id", Scope.SCENARIO, owner_id=a_scenario.id)
+
+_ENTITIES = {e.id: e for e in (a_scenario, another_scenario, a_job, another_job, a_datanode, another_datanode)}
+
+
+def mock_core_get(entity_id):
+    return _ENTITIES.get(entity_id)
+
+
+def _create_context() -> _GuiCoreContext:
+    context = _GuiCoreContext(MagicMock())
+    context._GuiCoreContext__lazy_start = lambda: None  # type: ignore[attr-defined]
+    return context
+
+
+class TestGuiCoreContext_process_event:
+    def test_scenario_events(self):
+        with patch("taipy.gui_core._context.core_get", side_effect=mock_core_get), patch(
+            "taipy.gui_core._context.is_readable", return_value=True
+        ), patch("taipy.gui_core._context.get_cycles_scenarios") as mock_get_cycles_scenarios:
+            context = _create_context()
+            context.scenario_by_cycle = {a_cycle: [a_scenario]}
+            context.data_nodes_by_owner = {a_scenario.id: [a_datanode]}
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.CREATION, another_scenario.id))
+            assert context.scenario_by_cycle == {a_cycle: [a_scenario], None: [another_scenario]}
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.UPDATE, a_scenario.id, "name"))
+            assert context.scenario_by_cycle == {a_cycle: [a_scenario], None: [another_scenario]}
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.DELETION, a_scenario.id))
+            assert context.scenario_by_cycle == {None: [another_scenario]}
+            assert context.data_nodes_by_owner == {}
+            mock_get_cycles_scenarios.assert_not_called()
+            # Deleting all the scenarios drops the cache
+            context.process_event(Event(EventEntityType.SCENARIO, EventOperation.DELETION))
+            assert context.scenario_by_cycle is None
+
+    def test_data_node_events(self):
+        with patch("taipy.gui_core._context.core_get", side_effect=mock_core_get):
+            context = _create_context()
+            context.data_nodes_by_owner = {a_scenario.id: [a_datanode]}
+            context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.CREATION, another_datanode.id))
+            assert context.data_nodes_by_owner == {a_scenario.id: [a_datanode, another_datanode]}
+            context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.DELETION, a_datanode.id))
+            assert context.data_nodes_by_owner == {a_scenario.id: [another_datanode]}
+            context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.CREATION, "DATANODE_unknown"))
+            assert context.data_nodes_by_owner is None
+
+    def test_job_events(self):
+        with patch("taipy.gui_core._context.core_get", side_effect=mock_core_get):
+            context = _create_context()
+            context.jobs_list = [a_job]
+            context.process_event(Event(EventEntityType.JOB, EventOperation.CREATION, another_job.id))
+            context.process_event(Event(EventEntityType.JOB, EventOperation.UPDATE, a_job.id, "status"))
+            assert context.jobs_list == [a_job, another_job]
+            context.process_event(Event(EventEntityType.JOB, EventOperation.DELETION, a_job.id))
+            assert context.jobs_list == [another_job]
+
+    def test_broadcast_core_changed_debounced(self):
+        with patch.object(_GuiCoreContext, "_CORE_CHANGED_DELAY", 0.05):
+            context = _create_context()
+            broadcast = t.cast(MagicMock, context.gui._broadcast)
+            context.broadcast_core_changed({"scenario": "SCENARIO_1"})
+            context.broadcast_core_changed({"scenario": ["SCENARIO_2", "SCENARIO_1"]})
+            context.broadcast_core_changed({"datanode": "DATANODE_1"})
+            context.broadcast_core_changed({"datanode": True})
+            # Messages for a specific client are not delayed
+            context.broadcast_core_changed({"jobs": True}, "client_id")
+            broadcast.assert_called_once_with(_GuiCoreContext._CORE_CHANGED_NAME, {"jobs": True}, "client_id")
+            time.sleep(0.2)
+            assert broadcast.call_count == 2
+            broadcast.assert_called_with(
+                _GuiCoreContext._CORE_CHANGED_NAME, {"scenario": ["SCENARIO_1", "SCENARIO_2"], "datanode": True}
+            )
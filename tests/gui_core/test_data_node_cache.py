@@ -0,0 +1,98 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, Mock, patch
+
+import pandas as pd
+
+from taipy.core import DataNode
+from taipy.core.notification import EventEntityType
+from taipy.core.notification.event import Event, EventOperation
+from taipy.gui_core._context import _GuiCoreContext
+from taipy.gui_core._data_node_cache import _DataNodeReadCache
+
+
+def _create_data_node(dn_id: str, value, last_edit_date=datetime(2025, 1, 1)):
+    datanode = MagicMock(spec=DataNode)
+    datanode.id = dn_id
+    datanode.last_edit_date = last_edit_date
+    datanode.is_ready_for_reading = True
+    datanode.read.return_value = value
+    return datanode
+
+
+class TestDataNodeReadCache:
+    def test_read_once_per_version(self):
+        cache = _DataNodeReadCache(1024 * 1024)
+        datanode = _create_data_node("DATANODE_a", pd.DataFrame({"a": [1, 2, 3]}))
+        value = cache._read(datanode)
+        assert cache._read(datanode) is value
+        datanode.read.assert_called_once()
+        # A new version of the data is read again and replaces the previous one
+        datanode.last_edit_date = datanode.last_edit_date + timedelta(seconds=1)
+        cache._read(datanode)
+        assert datanode.read.call_count == 2
+        assert cache._get_size() == int(value.memory_usage(deep=True).sum())
+
+    def test_never_edited_data_node_is_not_cached(self):
+        cache = _DataNodeReadCache(1024 * 1024)
+        datanode = _create_data_node("DATANODE_a", [1, 2, 3], None)
+        cache._read(datanode)
+        cache._read(datanode)
+        assert datanode.read.call_count == 2
+        assert cache._get_size() == 0
+
+    def test_eviction(self):
+        value = pd.DataFrame({"a": range(100)})
+        size = int(value.memory_usage(deep=True).sum())
+        cache = _DataNodeReadCache(2 * size)
+        datanodes = [_create_data_node(f"DATANODE_{i}", value) for i in range(3)]
+        for datanode in datanodes:
+            cache._read(datanode)
+        assert cache._get_size() == 2 * size
+        # The least recently used value was evicted
+        cache._read(datanodes[0])
+        assert datanodes[0].read.call_count == 2
+        cache._read(datanodes[2])
+        assert datanodes[2].read.call_count == 1
+        # Values larger than the cache are not kept
+        large_datanode = _create_data_node("DATANODE_large", pd.DataFrame({"a": range(1000)}))
+        cache._read(large_datanode)
+        cache._read(large_datanode)
+        assert large_datanode.read.call_count == 2
+
+    def test_invalidate(self):
+        cache = _DataNodeReadCache(1024 * 1024)
+        datanode = _create_data_node("DATANODE_a", [1, 2, 3])
+        cache._read(datanode)
+        cache._invalidate(datanode.id)
+        assert cache._get_size() == 0
+        cache._read(datanode)
+        assert datanode.read.call_count == 2
+
+
+class TestGuiCoreContext_data_node_viewer:
+    def test_one_read_for_tabular_views(self):
+        datanode = _create_data_node("DATANODE_a", pd.DataFrame({"a": [1, 2, 3]}))
+        with (
+            patch("taipy.gui_core._context.core_get", return_value=datanode),
+            patch("taipy.gui_core._context.is_readable", return_value=True),
+        ):
+            gui_core_context = _GuiCoreContext(Mock())
+            assert isinstance(gui_core_context.get_data_node_tabular_data(datanode.id), pd.DataFrame)
+            gui_core_context.get_data_node_tabular_columns(datanode.id)
+            gui_core_context.get_data_node_chart_config(datanode.id)
+            datanode.read.assert_called_once()
+            # Deleted data nodes are removed from the cache
+            gui_core_context.process_event(Event(EventEntityType.DATA_NODE, EventOperation.DELETION, datanode.id))
+            gui_core_context.get_data_node_tabular_data(datanode.id)
+            assert datanode.read.call_count == 2
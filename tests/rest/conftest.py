@@ -30,6 +30,7 @@ from taipy.core.data.pickle import PickleDataNode
 from taipy.core.job._job_manager import _JobManager
 from taipy.core.task._task_manager import _TaskManager
 from taipy.rest.app import create_app
+from taipy.rest.commons.submission_tracker import _SubmissionTracker
 from taipy.rest.config import _RestConfigChecker
 
 from .setup.shared.algorithms import evaluate, forecast
@@ -339,6 +340,7 @@ def cleanup_files(reset_configuration_singleton, inject_rest_sections, inject_co
         shutil.rmtree(".my_data", ignore_errors=True)
 
     yield
+    _SubmissionTracker._stop_instance()
     for path in [".data", ".my_data", "user_data", ".taipy"]:
         if os.path.exists(path):
             shutil.rmtree(path, ignore_errors=True)
@@ -60,3 +60,9 @@ def test_get_all_cycles(client, create_cycle_list):
 
     results = rep.get_json()
     assert len(results) == 10
+
+    rep = client.get(url_for("api.cycles", limit=2))
+    assert len(rep.get_json()) == 2
+    assert rep.headers["X-Total-Count"] == "10"
+    # cycles are not versioned
+    assert client.get(url_for("api.cycles", version="1.0")).status_code == 400
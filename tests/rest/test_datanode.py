@@ -9,10 +9,18 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import io
+import json
 from unittest import mock
 
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 from flask import url_for
 
+from taipy.core.common.scope import Scope
+from taipy.core.data.csv import CSVDataNode
+
 
 def test_get_datanode(client, default_datanode):
     # test 404
@@ -67,11 +75,29 @@ def test_get_all_datanodes(client, default_datanode_config_list):
             datanodes_url = url_for("api.datanodes", config_id=default_datanode_config_list[ds].name)
             client.post(datanodes_url)
 
-    rep = client.get(datanodes_url)
+    rep = client.get(url_for("api.datanodes"))
     assert rep.status_code == 200
 
     results = rep.get_json()
     assert len(results) == 10
+    assert rep.headers["X-Total-Count"] == "10"
+
+    # paging, sorted by id
+    rep = client.get(url_for("api.datanodes", offset=4, limit=3))
+    assert rep.status_code == 200
+    assert [result["id"] for result in rep.get_json()] == sorted(result["id"] for result in results)[4:7]
+    assert rep.headers["X-Total-Count"] == "10"
+    assert 'offset=7&limit=3>; rel="next"' in rep.headers["Link"]
+    assert 'offset=1&limit=3>; rel="prev"' in rep.headers["Link"]
+
+    # filtering and field selection
+    rep = client.get(url_for("api.datanodes", config_id="ds_3", fields="id,config_id"))
+    assert rep.get_json() == [{"id": r["id"], "config_id": "ds_3"} for r in results if r["config_id"] == "ds_3"]
+    assert rep.headers["X-Total-Count"] == "1"
+
+    # invalid arguments
+    assert client.get(url_for("api.datanodes", limit=-1)).status_code == 400
+    assert client.get(url_for("api.datanodes", fields="unknown")).status_code == 400
 
 
 def test_read_datanode(client, default_df_datanode):
@@ -93,6 +119,64 @@ def test_read_datanode(client, default_df_datanode):
         # assert rep.status_code == 200
 
 
+def test_read_datanode_rows_and_columns(client, default_df_datanode):
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock:
+        config_mock.return_value = default_df_datanode
+        datanodes_url = url_for("api.datanode_reader", datanode_id="foo", columns="b", start=1, stop=2)
+        rep = client.get(datanodes_url)
+        assert rep.status_code == 200
+        assert rep.json == {"data": [{"b": 4}]}
+
+        rep = client.get(url_for("api.datanode_reader", datanode_id="foo", columns="unknown"))
+        assert rep.status_code == 400
+
+
+def test_read_datanode_streamed(client, default_df_datanode):
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock:
+        config_mock.return_value = default_df_datanode
+        datanodes_url = url_for("api.datanode_reader", datanode_id="foo", start=1)
+
+        rep = client.get(datanodes_url, headers={"Accept": "application/x-ndjson"})
+        assert rep.status_code == 200
+        assert rep.mimetype == "application/x-ndjson"
+        assert [json.loads(line) for line in rep.get_data(as_text=True).splitlines()] == [
+            {"a": 3, "b": 4},
+            {"a": 5, "b": 6},
+        ]
+
+        rep = client.get(datanodes_url, headers={"Accept": "text/csv"})
+        assert rep.status_code == 200
+        assert rep.get_data(as_text=True).splitlines() == ["a,b", "3,4", "5,6"]
+
+        expected = pd.DataFrame([{"a": 3, "b": 4}, {"a": 5, "b": 6}])
+        rep = client.get(datanodes_url, headers={"Accept": "application/vnd.apache.arrow.stream"})
+        assert rep.status_code == 200
+        pd.testing.assert_frame_equal(pa.ipc.open_stream(rep.get_data()).read_all().to_pandas(), expected)
+
+        rep = client.get(datanodes_url, headers={"Accept": "application/vnd.apache.parquet"})
+        assert rep.status_code == 200
+        pd.testing.assert_frame_equal(pq.read_table(io.BytesIO(rep.get_data())).to_pandas(), expected)
+
+        rep = client.get(datanodes_url, headers={"Accept": "application/xml"})
+        assert rep.status_code == 406
+
+
+def test_read_csv_datanode_by_chunks(client, tmp_path):
+    path = tmp_path / "data.csv"
+    pd.DataFrame({"a": range(25), "b": range(25, 50)}).to_csv(path, index=False)
+    csv_datanode = CSVDataNode("csv_ds", Scope.SCENARIO, properties={"path": str(path), "has_header": True})
+    with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock, mock.patch(
+        "taipy.rest.api.resources.datanode.CHUNK_SIZE", 10
+    ), mock.patch.object(CSVDataNode, "read") as read_mock:
+        config_mock.return_value = csv_datanode
+        datanodes_url = url_for("api.datanode_reader", datanode_id="foo", columns="b", start=5, stop=22)
+        rep = client.get(datanodes_url, headers={"Accept": "text/csv"})
+        assert rep.status_code == 200
+        assert rep.get_data(as_text=True).splitlines() == ["b"] + [str(i) for i in range(30, 47)]
+        # The rows are read from the file by chunks
+        read_mock.assert_not_called()
+
+
 def test_write_datanode(client, default_datanode):
     with mock.patch("taipy.core.data._data_manager._DataManager._get") as config_mock:
         config_mock.return_value = default_datanode
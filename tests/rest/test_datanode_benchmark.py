@@ -0,0 +1,58 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import time
+from importlib import util
+from unittest import mock
+
+import pytest
+from flask import url_for
+
+from taipy.core.data._data_manager_factory import _DataManagerFactory
+
+_NB_REQUESTS = 500
+# Minimum number of GET /datanodes/<id>/ requests per second
+_MIN_REQUESTS_PER_SECOND = 100
+
+
+def _datanode_url(datanode_config) -> str:
+    data_manager = _DataManagerFactory._build_manager()
+    datanode = data_manager._bulk_get_or_create([datanode_config])[datanode_config]
+    return url_for("api.datanode_by_id", datanode_id=datanode.id)
+
+
+def test_get_datanode_loads_it_once(client, default_datanode_config):
+    url = _datanode_url(default_datanode_config)
+    assert client.get(url).status_code == 200
+
+    nb_requests = 10
+    repository = type(_DataManagerFactory._build_manager()._repository)
+    with (
+        mock.patch("taipy.rest.api.middlewares._middleware.util.find_spec", wraps=util.find_spec) as find_spec_mock,
+        mock.patch.object(repository, "_load", autospec=True, side_effect=repository._load) as load_mock,
+    ):
+        for _ in range(nb_requests):
+            assert client.get(url).status_code == 200
+
+    # The middleware is resolved once and each request reads the data node once
+    find_spec_mock.assert_not_called()
+    assert load_mock.call_count == nb_requests
+
+
+@pytest.mark.benchmark
+def test_get_datanode_benchmark(client, default_datanode_config):
+    url = _datanode_url(default_datanode_config)
+    assert client.get(url).status_code == 200
+
+    start = time.perf_counter()
+    for _ in range(_NB_REQUESTS):
+        assert client.get(url).status_code == 200
+    assert _NB_REQUESTS / (time.perf_counter() - start) > _MIN_REQUESTS_PER_SECOND
@@ -63,6 +63,13 @@ def test_get_all_jobs(client, create_job_list):
     results = rep.get_json()
     assert len(results) == 10
 
+    rep = client.get(url_for("api.jobs", offset=8, limit=5, fields="id"))
+    assert rep.get_json() == [{"id": job_id} for job_id in sorted(result["id"] for result in results)[8:]]
+    assert rep.headers["X-Total-Count"] == "10"
+    assert 'rel="next"' not in rep.headers["Link"]
+    # jobs have no config id
+    assert client.get(url_for("api.jobs", config_id="foo")).status_code == 400
+
 
 def test_cancel_job(client, default_job):
     # test 404
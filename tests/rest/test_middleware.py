@@ -57,3 +57,18 @@ def test_enterprise_middleware_not_applied_when_enterprise_is_not_installed(
     assert rv == "f"
     using_enterprise.assert_called_once()
     enterprise_middleware.assert_not_called()
+
+
+@patch("taipy.rest.api.middlewares._middleware._using_enterprise")
+@patch("taipy.rest.api.middlewares._middleware._enterprise_middleware")
+def test_enterprise_middleware_resolved_once(enterprise_middleware: MagicMock, using_enterprise: MagicMock):
+    enterprise_middleware.return_value = mock_enterprise_middleware
+    using_enterprise.return_value = True
+
+    @_middleware
+    def f():
+        return "f"
+
+    assert [f() for _ in range(3)] == ["f", "f", "f"]
+    using_enterprise.assert_called_once()
+    enterprise_middleware.assert_called_once()
@@ -13,6 +13,8 @@ from unittest import mock
 
 from flask import url_for
 
+from taipy.core.scenario._scenario_manager_factory import _ScenarioManagerFactory
+
 
 def test_get_scenario(client, default_scenario):
     # test 404
@@ -68,7 +70,7 @@ def test_get_all_scenarios(client, default_sequence, default_scenario_config_lis
             scenarios_url = url_for("api.scenarios", config_id=default_scenario_config_list[ds].name)
             client.post(scenarios_url)
 
-    rep = client.get(scenarios_url)
+    rep = client.get(url_for("api.scenarios"))
     assert rep.status_code == 200
 
     results = rep.get_json()
@@ -88,3 +90,16 @@ def test_execute_scenario(client, default_scenario_config):
 
     rep = client.post(url_for("api.scenario_submit", scenario_id=scn.json["scenario"]["id"]))
     assert rep.status_code == 200
+
+
+def test_execute_scenario_loads_it_once(client, default_scenario_config):
+    with mock.patch("taipy.rest.api.resources.scenario.ScenarioList.fetch_config") as config_mock:
+        config_mock.return_value = default_scenario_config
+        scn = client.post(url_for("api.scenarios", config_id="bar"))
+
+    repository = type(_ScenarioManagerFactory._build_manager()._repository)
+    with mock.patch.object(repository, "_load", autospec=True, side_effect=repository._load) as load_mock:
+        rep = client.post(url_for("api.scenario_submit", scenario_id=scn.json["scenario"]["id"]))
+        assert rep.status_code == 200
+        # The scenario is read once by the request, then taken from the request-scoped cache
+        assert load_mock.call_count == 1
@@ -0,0 +1,162 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import json
+import threading
+import time
+from unittest import mock
+
+import pytest
+from flask import url_for
+
+from taipy.core.exceptions.exceptions import NonExistingSubmission
+from taipy.core.job.status import Status
+from taipy.core.notification import EventEntityType, EventOperation
+from taipy.core.notification.event import Event
+from taipy.core.submission._submission_manager import _SubmissionManager
+from taipy.core.submission.submission_status import SubmissionStatus
+from taipy.rest.commons.submission_tracker import _SubmissionTracker
+
+
+def _submit_scenario(client, scenario_config):
+    with mock.patch("taipy.rest.api.resources.scenario.ScenarioList.fetch_config") as config_mock:
+        config_mock.return_value = scenario_config
+        scenario = client.post(url_for("api.scenarios", config_id="bar"))
+    return client.post(url_for("api.scenario_submit", scenario_id=scenario.json["scenario"]["id"]))
+
+
+def test_submit_returns_submission(client, default_scenario_config):
+    rep = _submit_scenario(client, default_scenario_config)
+    assert rep.status_code == 200
+    submission = rep.json["submission"]
+    assert submission["id"].startswith("SUBMISSION_")
+    assert len(submission["jobs"]) == 1
+
+    # The submission is not read again from the repository
+    with mock.patch.object(_SubmissionManager, "_get") as get_mock:
+        rep = client.get(url_for("api.submission_by_id", submission_id=submission["id"]))
+        get_mock.assert_not_called()
+    assert rep.status_code == 200
+    assert rep.json["submission"]["jobs"].keys() == submission["jobs"].keys()
+
+
+def test_get_submission(client, default_scenario_config):
+    rep = client.get(url_for("api.submission_by_id", submission_id="foo"))
+    assert rep.status_code == 404
+
+    submission = _SubmissionManager._create("entity_id", "SCENARIO", "entity_config_id")
+    rep = client.get(url_for("api.submission_by_id", submission_id=submission.id))
+    assert rep.status_code == 200
+    assert rep.json["submission"]["status"] == str(SubmissionStatus.SUBMITTED)
+    assert not rep.json["submission"]["is_finished"]
+
+    rep = client.get(url_for("api.submission_by_id", submission_id=submission.id, timeout=100))
+    assert rep.status_code == 400
+
+
+def test_long_poll(client):
+    submission = _SubmissionManager._create("entity_id", "SCENARIO", "entity_config_id")
+    tracker = _SubmissionTracker._get_instance()
+    version = tracker._get(submission.id)["version"]
+
+    def update_status():
+        time.sleep(0.2)
+        tracker.process_events(
+            [
+                Event(
+                    EventEntityType.JOB,
+                    EventOperation.UPDATE,
+                    "JOB_id",
+                    "status",
+                    Status.RUNNING,
+                    metadata={"submission_id": submission.id},
+                ),
+                Event(
+                    EventEntityType.SUBMISSION,
+                    EventOperation.UPDATE,
+                    submission.id,
+                    "submission_status",
+                    SubmissionStatus.RUNNING,
+                ),
+            ]
+        )
+
+    thread = threading.Thread(target=update_status)
+    thread.start()
+    rep = client.get(url_for("api.submission_by_id", submission_id=submission.id, since=version, timeout=10))
+    thread.join()
+    assert rep.json["submission"]["version"] > version
+    assert rep.json["submission"]["status"] == str(SubmissionStatus.RUNNING)
+    assert rep.json["submission"]["jobs"] == {"JOB_id": str(Status.RUNNING)}
+
+    # Without any change, the request returns after the timeout
+    version = rep.json["submission"]["version"]
+    rep = client.get(url_for("api.submission_by_id", submission_id=submission.id, since=version, timeout=0.1))
+    assert rep.json["submission"]["version"] == version
+
+
+def test_event_stream(client):
+    submission = _SubmissionManager._create("entity_id", "SCENARIO", "entity_config_id")
+    tracker = _SubmissionTracker._get_instance()
+
+    def complete():
+        time.sleep(0.2)
+        tracker.process_events(
+            [
+                Event(
+                    EventEntityType.SUBMISSION,
+                    EventOperation.UPDATE,
+                    submission.id,
+                    "submission_status",
+                    SubmissionStatus.COMPLETED,
+                )
+            ]
+        )
+
+    thread = threading.Thread(target=complete)
+    thread.start()
+    rep = client.get(
+        url_for("api.submission_by_id", submission_id=submission.id), headers={"Accept": "text/event-stream"}
+    )
+    assert rep.status_code == 200
+    assert rep.mimetype == "text/event-stream"
+    messages = [message.split("\n") for message in rep.get_data(as_text=True).split("\n\n") if message]
+    thread.join()
+    # The current state is sent first, then each change until the submission is finished
+    assert len(messages) == 2
+    assert messages[0][1] == "event: submission"
+    assert not json.loads(messages[0][2][len("data: ") :])["is_finished"]
+    state = json.loads(messages[1][2][len("data: ") :])
+    assert messages[1][0] == f"id: {state['version']}"
+    assert state["id"] == submission.id
+    assert state["is_finished"]
+
+
+def test_forget_finished_submissions():
+    tracker = _SubmissionTracker._get_instance()
+    with mock.patch.object(_SubmissionTracker, "_MAX_FINISHED_SUBMISSIONS", 2):
+        for i in range(3):
+            tracker.process_events(
+                [
+                    Event(EventEntityType.SUBMISSION, EventOperation.CREATION, f"SUBMISSION_{i}"),
+                    Event(
+                        EventEntityType.SUBMISSION,
+                        EventOperation.UPDATE,
+                        f"SUBMISSION_{i}",
+                        "submission_status",
+                        SubmissionStatus.COMPLETED,
+                    ),
+                ]
+            )
+    assert tracker._get("SUBMISSION_2")["is_finished"]
+    with mock.patch.object(_SubmissionManager, "_get", return_value=None):
+        with pytest.raises(NonExistingSubmission):
+            tracker._get("SUBMISSION_0")
@@ -68,7 +68,7 @@ def test_get_all_tasks(client, task_data, default_task_config_list):
             tasks_url = url_for("api.tasks", config_id=default_task_config_list[ds].name)
             client.post(tasks_url)
 
-    rep = client.get(tasks_url)
+    rep = client.get(url_for("api.tasks"))
     assert rep.status_code == 200
 
     results = rep.get_json()
@@ -0,0 +1,89 @@
+# Copyright 2021-2025 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import subprocess
+import sys
+import typing as t
+
+import pytest
+
+import taipy
+import taipy.core._init
+
+# Maximum time, in seconds, to import the core package in a fresh interpreter
+_CORE_IMPORT_TIME_BUDGET = 3.0
+
+# Packages that a core-only process must not load
+_SERVICE_PACKAGES = ["taipy.gui", "taipy.gui_core", "taipy.rest", "flask", "flask_socketio"]
+_DATA_NODE_BACKENDS = ["sqlalchemy", "boto3", "pymongo", "openpyxl", "deepdiff"]
+
+
+def _import_times(statement: str) -> t.Dict[str, float]:
+    """Cumulative import time, in seconds, of each module imported by *statement*."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    times: t.Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def test_core_imports():
+    times = _import_times("import taipy.core")
+    for package in _SERVICE_PACKAGES + _DATA_NODE_BACKENDS:
+        assert package not in times, f"'{package}' is imported by taipy.core"
+
+
+@pytest.mark.benchmark
+def test_core_import_time():
+    assert _import_times("import taipy.core")["taipy"] < _CORE_IMPORT_TIME_BUDGET
+
+
+def test_lazy_attributes():
+    assert "Gui" in dir(taipy)
+    assert taipy.Gui is taipy.gui.Gui
+    assert taipy.run is taipy._run._run
+    # The configuration methods of every package are available
+    assert callable(taipy.Config.configure_gui)
+    assert callable(taipy.Config.configure_rest)
+    assert callable(taipy.Config.configure_data_node)
+    # Every name exported by the core package is exposed
+    core_names = {name for name in dir(taipy.core._init) if not name.startswith("_")}
+    assert core_names == {name for name, module in taipy._LAZY_ATTRIBUTES.items() if module == "taipy.core._init"}
+
+
+def test_dir_after_set_is_resolved():
+    assert taipy.set is taipy.core._init.set
+    assert "set" in taipy.__dict__
+    assert {"set", "Gui", "run"} <= set(dir(taipy))
+
+
+def test_star_import():
+    # The statement fails, and so does the subprocess, if a name is missing
+    _import_times(
+        "import taipy; from taipy import *; "
+        "assert Gui is taipy.gui.Gui and run is taipy._run._run and create_scenario is taipy.core.create_scenario"
+    )
+
+
+def test_subpackages():
+    _import_times("import taipy; assert taipy.gui.Gui and taipy.gui_core.filters and taipy.rest.Rest")
+    assert {"common", "core", "gui", "gui_core", "rest"} <= set(dir(taipy))